@@ -6,31 +6,66 @@
 import cantera as ct
 import os
 import argparse
+import multiprocessing
 
+# number of conditions to convert at once
+chunk_size = 100000
 
-def main(input_dir='', output_dir='', mech=''):
+
+def convert(state_data, mw):
+    """Convert an array of Time, Temperature, Pressure, Mass Fractions to
+    Temperature, Pressure, Concentrations, with the molecular weights `mw`
+
+    Negative mass fractions are set to zero, and the remainder normalized
+    (as in Cantera's `TPY` setter)"""
+    Y = np.maximum(state_data[:, 3:], 0)
+    Y /= np.sum(Y, axis=1)[:, np.newaxis]
+    # moles per unit mass
+    n = Y / mw
+    out_data = np.empty((state_data.shape[0], mw.size + 2))
+    out_data[:, 0] = state_data[:, 1]
+    out_data[:, 1] = state_data[:, 2]
+    out_data[:, 2:] = n * (state_data[:, 2] / (
+        ct.gas_constant * state_data[:, 1] * np.sum(n, axis=1)))[:, np.newaxis]
+    return out_data
+
+
+def convert_file(args):
+    """Convert the `.npy` file `infile` to `outfile` in memory-mapped chunks"""
+    infile, outfile, mw = args
+    state_data = np.load(infile, mmap_mode='r')
+    state_data = state_data.reshape(-1, state_data.shape[-1])
+    out_data = np.lib.format.open_memmap(
+        outfile, mode='w+', dtype=np.float64,
+        shape=(state_data.shape[0], mw.size + 2))
+    for start in range(0, state_data.shape[0], chunk_size):
+        end = start + chunk_size
+        out_data[start:end] = convert(np.asarray(state_data[start:end]), mw)
+    out_data.flush()
+    del out_data
+
+
+def main(input_dir='', output_dir='', mech='', num_proc=None):
     assert input_dir != output_dir, 'Cannot convert in same folder'
     gas = ct.Solution(mech)
+    mw = gas.molecular_weights
 
     npy_files = [f for f in os.listdir(input_dir)]
     npy_files = [f for f in npy_files if f.endswith('.npy')
                  and os.path.isfile(os.path.join(input_dir, f))]
-    for npy in sorted(npy_files):
-        state_data = np.load(os.path.join(input_dir, npy))
-        state_data = state_data.reshape(state_data.shape[0] *
-                                        state_data.shape[1],
-                                        state_data.shape[2]
-                                        )
-        out_data = np.zeros((state_data.shape[0], gas.n_species + 2))
-        for i in range(state_data.shape[0]):
-            # convert to T, P, C
-            gas.TPY = state_data[i, 1], state_data[i, 2], state_data[i, 3:]
-            out_data[i, 0] = gas.T
-            out_data[i, 1] = gas.P
-            out_data[i, 2:] = gas.concentrations[:]
-
-        np.save(os.path.join(output_dir,
-                             npy), out_data)
+    jobs = [(os.path.join(input_dir, npy), os.path.join(output_dir, npy), mw)
+            for npy in sorted(npy_files)]
+    if num_proc == 1 or len(jobs) <= 1:
+        for job in jobs:
+            convert_file(job)
+        return
+
+    pool = multiprocessing.Pool(num_proc)
+    try:
+        pool.map(convert_file, jobs)
+    finally:
+        pool.close()
+        pool.join()
 
 
 if __name__ == '__main__':
@@ -52,7 +87,14 @@ def main(input_dir='', output_dir='', mech=''):
                         type=str,
                         required=True,
                         help='The Cantera format mechanism to use.')
+    parser.add_argument('-n', '--num_proc',
+                        type=int,
+                        default=None,
+                        required=False,
+                        help='The number of processes to convert files with, '
+                             'defaults to the number of CPUs.')
     args = parser.parse_args()
     main(input_dir=args.input_dir,
          output_dir=args.output_dir,
-         mech=args.mech)
+         mech=args.mech,
+         num_proc=args.num_proc)
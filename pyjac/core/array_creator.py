@@ -12,6 +12,7 @@
 import numpy as np
 from loopy.kernel.data import AddressSpace as scopes
 
+from pyjac.core import thermo_tables
 from pyjac.core.enum_types import JacobianFormat, JacobianType
 from pyjac.utils import listify, partition
 
@@ -596,6 +597,13 @@ def split_numpy_arrays(self, arrays):
 """
 
 
+T_invariant_keys = ['VAL', 'INV', 'LOG']
+"""list of str: The :class:`instruction_creator.PrecomputedInstructions` keys
+(in column order) of the shared temperature invariants, i.e., the (guarded)
+temperature, its inverse and logarithm
+"""
+
+
 default_inds = (global_ind, var_name)
 """str: The default indicies used in main loops of :module:`rate_subs`
 
@@ -1831,6 +1839,12 @@ def _make_mask(map_arr, mask_size):
     The name of the state vector rate of change array
 """
 
+condition_order = 'condition_order'
+"""
+    The name of the (optional) permutation array, in which the driver function
+    gathers / scatters the initial conditions
+"""
+
 jacobian_array = 'jac'
 """
     The name of the jacobian array
@@ -2054,6 +2068,18 @@ def _add_arrays(self, rate_info, test_size):
                              dtype=np.float64, order=self.order,
                              fixed_indicies=[(1, 0)])
 
+        # shared temperature invariants, see
+        # :func:`pyjac.core.rate_subs.get_temperature_invariants`
+        self.num_T_invariants = creator('num_T_invariants',
+                                        shape=(len(T_invariant_keys),),
+                                        dtype=kint_type, order=self.order,
+                                        initializer=np.arange(
+                                            len(T_invariant_keys),
+                                            dtype=kint_type))
+        self.T_invariants = creator('T_invariants',
+                                    shape=(test_size, len(T_invariant_keys)),
+                                    dtype=np.float64, order=self.order)
+
         # handle extra variable and P / V arrays
         self.E_arr = creator(state_vector, shape=(test_size, rate_info['Ns'] + 1),
                              dtype=np.float64, order=self.order,
@@ -2069,6 +2095,9 @@ def _add_arrays(self, rate_info, test_size):
 
         self.n_arr = creator(state_vector, shape=(test_size, rate_info['Ns'] + 1),
                              dtype=np.float64, order=self.order)
+        # the order in which the driver visits the initial conditions
+        self.condition_order = creator(condition_order, shape=(test_size,),
+                                       dtype=kint_type, order=self.order)
         self.conc_arr = creator('conc', shape=(test_size, rate_info['Ns']),
                                 dtype=np.float64, order=self.order)
         self.conc_ns_arr = creator('conc', shape=(test_size, rate_info['Ns']),
@@ -2189,6 +2218,19 @@ def _add_arrays(self, rate_info, test_size):
                                    dtype=kint_type),
             order=self.order)
 
+        # all species with non-zero net stoichiometry in any reaction
+        # (including the last species), indexed as the species -> reaction maps
+        net_spec = rate_info['net_per_spec']['map']
+        self.num_net_spec = creator('num_net_spec', dtype=kint_type,
+                                    shape=net_spec.shape,
+                                    initializer=np.arange(net_spec.size,
+                                                          dtype=kint_type),
+                                    order=self.order)
+        self.net_spec = creator('net_spec', dtype=kint_type,
+                                shape=net_spec.shape,
+                                initializer=net_spec,
+                                order=self.order)
+
         self.spec_to_rxn = creator('spec_to_rxn', dtype=kint_type,
                                    shape=rate_info['net_per_spec'][
                                        'reacs'].shape,
@@ -2887,6 +2929,29 @@ def _add_arrays(self, rate_info, test_size):
                                          'post_process']['Tlim'].shape,
                                      order=self.order)
 
+            # ragged coefficients & reduced T / P maps for Clenshaw evaluation
+            cheb_pp = rate_info['cheb']['post_process']
+            self.cheb_coeffs = creator('cheb_coeffs',
+                                       dtype=cheb_pp['coeffs'].dtype,
+                                       initializer=cheb_pp['coeffs'],
+                                       shape=cheb_pp['coeffs'].shape,
+                                       order=self.order)
+            self.cheb_coeff_offsets = creator(
+                'cheb_coeff_offsets', dtype=kint_type,
+                initializer=cheb_pp['coeff_offsets'].astype(kint_type),
+                shape=cheb_pp['coeff_offsets'].shape,
+                order=self.order)
+            self.cheb_Tred = creator('cheb_Tred',
+                                     dtype=cheb_pp['Tred'].dtype,
+                                     initializer=cheb_pp['Tred'],
+                                     shape=cheb_pp['Tred'].shape,
+                                     order=self.order)
+            self.cheb_Pred = creator('cheb_Pred',
+                                     dtype=cheb_pp['Pred'].dtype,
+                                     initializer=cheb_pp['Pred'],
+                                     shape=cheb_pp['Pred'].shape,
+                                     order=self.order)
+
             # workspace variables
             polymax = int(np.max(np.maximum(rate_info['cheb']['num_P'],
                                             rate_info['cheb']['num_T'])))
@@ -2934,6 +2999,14 @@ def _add_arrays(self, rate_info, test_size):
                                            'post_process']['params'].shape,
                                        order=self.order)
 
+            self.plog_offsets = creator('plog_offsets',
+                                        dtype=kint_type,
+                                        initializer=rate_info['plog'][
+                                            'post_process']['offsets'],
+                                        shape=rate_info['plog'][
+                                            'post_process']['offsets'].shape,
+                                        order=self.order)
+
             self.plog_num_param = creator('plog_num_param',
                                           dtype=rate_info['plog'][
                                               'num_P'].dtype,
@@ -2991,6 +3064,20 @@ def _add_arrays(self, rate_info, test_size):
                                         dtype=np.float64,
                                         shape=(test_size, rate_info['Ns']),
                                         order=self.order))
+        # tabulated thermodynamic properties / equilibrium constants, stored by
+        # name as the lowest temperature, inverse interval width and number of
+        # intervals of the table
+        self.thermo_tables = {}
+        if self.loopy_opts.thermo_table_tol is not None:
+            tables = thermo_tables.get_tables(rate_info,
+                                              self.loopy_opts.thermo_table_tol)
+            for name, (table, T0, inv_dT) in six.iteritems(tables):
+                setattr(self, name + '_table', creator(name + '_table',
+                                                       dtype=table.dtype,
+                                                       initializer=table,
+                                                       shape=table.shape,
+                                                       order=self.order))
+                self.thermo_tables[name] = (T0, inv_dT, table.shape[1])
         # thermo arrays
         self.spec_energy = self.h.copy() if self.conp else self.u.copy()
         self.spec_energy_ns = self.spec_energy.copy()
@@ -14,7 +14,8 @@
 from pyjac.utils import is_integer
 
 __all__ = ['RU', 'RUC', 'RU_JOUL', 'PA', 'get_elem_wt',
-           'ReacInfo', 'SpecInfo', 'calc_spec_smh']
+           'ReacInfo', 'SpecInfo', 'calc_spec_smh', 'calc_spec_cp',
+           'calc_spec_h']
 
 # universal gas constants, SI units
 RU =  8314.4621 # J/(kmole * K)
@@ -684,3 +685,71 @@ def calc_spec_smh(T, specs):
         spec_smh.append(smh)
 
     return (spec_smh)
+
+
+def _nasa_coeffs(specs):
+    """Returns the low / high temperature NASA coefficients and midpoint
+    temperatures of the species as arrays of shape (Ns, 7), (Ns, 7) and (Ns,)
+    """
+    lo = np.array([sp.lo for sp in specs], dtype=np.float64)
+    hi = np.array([sp.hi for sp in specs], dtype=np.float64)
+    Tmid = np.array([sp.Trange[1] for sp in specs], dtype=np.float64)
+    return lo, hi, Tmid
+
+
+def calc_spec_cp(T, specs):
+    """Calculate standard-state molar heat capacities for all species at one or
+    more temperatures.
+
+    Parameters
+    ----------
+    T : float or array_like of float
+        Temperature(s) of gas mixture.
+    specs : list of SpecInfo
+        List of species.
+
+    Returns
+    -------
+    spec_cp : :class:`numpy.ndarray`
+        Species' standard-state heat capacities [J/(kmole * K)], of shape
+        (len(T), len(specs))
+
+    """
+
+    lo, hi, Tmid = _nasa_coeffs(specs)
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))[:, np.newaxis]
+
+    def __cp(a):
+        return a[:, 0] + T * (a[:, 1] + T * (a[:, 2] + T * (
+            a[:, 3] + T * a[:, 4])))
+
+    return RU * np.where(T <= Tmid, __cp(lo), __cp(hi))
+
+
+def calc_spec_h(T, specs):
+    """Calculate standard-state molar enthalpies for all species at one or
+    more temperatures.
+
+    Parameters
+    ----------
+    T : float or array_like of float
+        Temperature(s) of gas mixture.
+    specs : list of SpecInfo
+        List of species.
+
+    Returns
+    -------
+    spec_h : :class:`numpy.ndarray`
+        Species' standard-state enthalpies [J/kmole], of shape
+        (len(T), len(specs))
+
+    """
+
+    lo, hi, Tmid = _nasa_coeffs(specs)
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))[:, np.newaxis]
+
+    def __h(a):
+        return a[:, 5] + T * (a[:, 0] + T * (a[:, 1] / 2.0 + T * (
+            a[:, 2] / 3.0 + T * (a[:, 3] / 4.0 + T * a[:, 4] / 5.0))))
+
+    return RU * np.where(T <= Tmid, __h(lo), __h(hi))
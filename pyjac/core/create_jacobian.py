@@ -1082,42 +1082,36 @@ def __dRopidE(loopy_opts, namestore, test_size=None,
             # conv
             if rxn_type == reaction_type.plog:
                 # conp & plog
-                lo_ind = 'lo'
-                hi_ind = 'hi'
-                param_ind = 'p'
+                lo_ind = 'lo_ind'
+                hi_ind = 'hi_ind'
                 # create extra arrays
                 P_lp, P_str = mapstore.apply_maps(namestore.P_arr, global_ind)
-                # number of plog rates per rxn
-                plog_num_param_lp, plog_num_param_str = mapstore.apply_maps(
-                    namestore.plog_num_param, var_name)
+                # locate the bracketing pressures
+                plog_data, bracket_insns, plog_inames = ic.get_plog_bracket(
+                    mapstore, namestore, maxP)
                 # pressure ranges
-                plog_params_lp, pressure_mid_lo = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, param_ind)
-                _, pressure_mid_hi = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, param_ind,
-                    affine={param_ind: 1})
                 _, pres_lo_str = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, lo_ind)
+                    namestore.plog_params, lo_ind, 0)
                 _, pres_hi_str = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, hi_ind)
+                    namestore.plog_params, hi_ind, 0)
                 # arrhenius params
                 _, A_lo_str = mapstore.apply_maps(
-                    namestore.plog_params, 1, var_name, lo_ind)
+                    namestore.plog_params, lo_ind, 1)
                 _, A_hi_str = mapstore.apply_maps(
-                    namestore.plog_params, 1, var_name, hi_ind)
+                    namestore.plog_params, hi_ind, 1)
                 _, beta_lo_str = mapstore.apply_maps(
-                    namestore.plog_params, 2, var_name, lo_ind)
+                    namestore.plog_params, lo_ind, 2)
                 _, beta_hi_str = mapstore.apply_maps(
-                    namestore.plog_params, 2, var_name, hi_ind)
+                    namestore.plog_params, hi_ind, 2)
                 _, Ta_lo_str = mapstore.apply_maps(
-                    namestore.plog_params, 3, var_name, lo_ind)
+                    namestore.plog_params, lo_ind, 3)
                 _, Ta_hi_str = mapstore.apply_maps(
-                    namestore.plog_params, 3, var_name, hi_ind)
+                    namestore.plog_params, hi_ind, 3)
                 _, pressure_lo = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, 0)
+                    namestore.plog_params, 'first', 0)
                 _, pressure_hi = mapstore.apply_maps(
-                    namestore.plog_params, 0, var_name, 'numP')
-                kernel_data.extend([P_lp, plog_num_param_lp, plog_params_lp])
+                    namestore.plog_params, 'last', 0)
+                kernel_data.extend([P_lp] + plog_data)
 
                 # add plog instruction
                 pre_instructions.extend([
@@ -1156,18 +1150,7 @@ def __dRopidE(loopy_opts, namestore, test_size=None,
 
                 # and dkf instructions
                 dkf_instructions = Template("""
-                    <> lo = 0 {id=lo_init}
-                    <> hi = numP {id=hi_init}
-                    <> numP = ${plog_num_param_str} - 1
-                    for ${param_ind}
-                        if ${param_ind} <= numP and \
-                                (logP > ${pressure_mid_lo}) and \
-                                (logP <= ${pressure_mid_hi})
-                            lo = ${param_ind} {id=set_lo, dep=lo_init}
-                            hi = ${param_ind} + 1 {id=set_hi, dep=hi_init}
-                        end
-                    end
-
+                    ${bracket_insns}
                     ${plog_preloads}
                     <> dkf = 0 {id=dkf_init}
                     # not out of range
@@ -1179,8 +1162,7 @@ def __dRopidE(loopy_opts, namestore, test_size=None,
                             {id=dkf_final, dep=dkf_init:set_*}
                     end
                 """).safe_substitute(**locals())
-                extra_inames.append((
-                    param_ind, '0 <= {} < {}'.format(param_ind, maxP - 1)))
+                extra_inames.extend(plog_inames)
             elif rxn_type == reaction_type.cheb:
                 # conp & cheb
                 # max degrees in mechanism
@@ -1727,6 +1709,7 @@ def dTdotdE(loopy_opts, namestore, test_size, conp=True, jac_create=None):
                           instructions=instructions,
                           pre_instructions=pre_instructions,
                           post_instructions=[post_instructions],
+                          chunkable=False,
                           var_name=var_name,
                           kernel_data=kernel_data,
                           mapstore=mapstore,
@@ -1834,6 +1817,7 @@ def dEdotdE(loopy_opts, namestore, test_size, conp=True, jac_create=None):
                           instructions=instructions,
                           pre_instructions=pre_instructions,
                           post_instructions=[post_instructions],
+                          chunkable=False,
                           var_name=var_name,
                           kernel_data=kernel_data,
                           mapstore=mapstore,
@@ -1988,6 +1972,7 @@ def dTdotdT(loopy_opts, namestore, test_size=None, conp=True, jac_create=None):
                           instructions=instructions,
                           pre_instructions=pre_instructions,
                           post_instructions=post_instructions,
+                          chunkable=False,
                           var_name=var_name,
                           kernel_data=kernel_data,
                           mapstore=mapstore,
@@ -2103,6 +2088,7 @@ def dEdotdT(loopy_opts, namestore, test_size=None, conp=False, jac_create=None):
                           instructions=instructions,
                           pre_instructions=pre_instructions,
                           post_instructions=post_instructions,
+                          chunkable=False,
                           var_name=var_name,
                           kernel_data=kernel_data,
                           mapstore=mapstore,
@@ -2757,38 +2743,32 @@ def __dRopidT(loopy_opts, namestore, test_size=None,
 
         pre_instructions = [precompute('Tinv', T_str, 'INV')]
         if rxn_type == reaction_type.plog:
-            lo_ind = 'lo'
-            hi_ind = 'hi'
-            param_ind = 'p'
+            lo_ind = 'lo_ind'
+            hi_ind = 'hi_ind'
             # create extra arrays
             P_lp, P_str = mapstore.apply_maps(namestore.P_arr, global_ind)
-            # number of plog rates per rxn
-            plog_num_param_lp, plog_num_param_str = mapstore.apply_maps(
-                namestore.plog_num_param, var_name)
+            # locate the bracketing pressures
+            plog_data, bracket_insns, plog_inames = ic.get_plog_bracket(
+                mapstore, namestore, maxP)
             # pressure ranges
-            plog_params_lp, pressure_mid_lo = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, param_ind)
-            _, pressure_mid_hi = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, param_ind,
-                affine={param_ind: 1})
             _, pres_lo_str = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, lo_ind)
+                namestore.plog_params, lo_ind, 0)
             _, pres_hi_str = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, hi_ind)
+                namestore.plog_params, hi_ind, 0)
             # arrhenius params
             _, beta_lo_str = mapstore.apply_maps(
-                namestore.plog_params, 2, var_name, lo_ind)
+                namestore.plog_params, lo_ind, 2)
             _, beta_hi_str = mapstore.apply_maps(
-                namestore.plog_params, 2, var_name, hi_ind)
+                namestore.plog_params, hi_ind, 2)
             _, Ta_lo_str = mapstore.apply_maps(
-                namestore.plog_params, 3, var_name, lo_ind)
+                namestore.plog_params, lo_ind, 3)
             _, Ta_hi_str = mapstore.apply_maps(
-                namestore.plog_params, 3, var_name, hi_ind)
+                namestore.plog_params, hi_ind, 3)
             _, pressure_lo = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, 0)
+                namestore.plog_params, 'first', 0)
             _, pressure_hi = mapstore.apply_maps(
-                namestore.plog_params, 0, var_name, 'numP')
-            kernel_data.extend([P_lp, plog_num_param_lp, plog_params_lp])
+                namestore.plog_params, 'last', 0)
+            kernel_data.extend([P_lp] + plog_data)
 
             # add plog instruction
             pre_instructions.append(precompute(
@@ -2821,16 +2801,7 @@ def __dRopidT(loopy_opts, namestore, test_size=None,
 
             # and dkf instructions
             dkf_instructions = Template("""
-                <> lo = 0 {id=lo_init}
-                <> hi = numP {id=hi_init}
-                <> numP = ${plog_num_param_str} - 1
-                for ${param_ind}
-                    if ${param_ind} <= numP and (logP > ${pressure_mid_lo}) and \
-                            (logP <= ${pressure_mid_hi})
-                        lo = ${param_ind} {id=set_lo, dep=lo_init}
-                        hi = ${param_ind} + 1 {id=set_hi, dep=hi_init}
-                    end
-                end
+                ${bracket_insns}
                 ${plog_preloads}
                 if logP > ${pressure_hi} # out of range above
                     <> dkf = (${beta_hi_str} + ${Ta_hi_str} * Tinv) * Tinv \
@@ -2847,8 +2818,7 @@ def __dRopidT(loopy_opts, namestore, test_size=None,
                     (${pres_hi_str} - ${pres_lo_str}) {id=dkf_final, dep=dkf_init*}
                 end
             """).safe_substitute(**locals())
-            extra_inames.append((
-                param_ind, '0 <= {} < {}'.format(param_ind, maxP - 1)))
+            extra_inames.extend(plog_inames)
         elif rxn_type == reaction_type.cheb:
             # max degrees in mechanism
             poly_max = int(max(maxP, maxT - 1))
@@ -3546,6 +3516,7 @@ def total_specific_energy(loopy_opts, namestore, test_size=None,
                           pre_instructions=[pre_instructions],
                           instructions=instructions,
                           post_instructions=[post_instructions],
+                          chunkable=False,
                           var_name=var_name,
                           kernel_data=kernel_data,
                           mapstore=mapstore,
@@ -5221,7 +5192,12 @@ def create_jacobian(lang, mech_name=None, therm_name=None, gas=None,
                     jac_format=JacobianFormat.full, for_validation=False,
                     fd_order=1, fd_mode=FiniteDifferenceMode.forward, mem_limits='',
                     unique_pointers=False, explicit_simd=None,
-                    rsort=reaction_sorting.none, **kwargs
+                    rsort=reaction_sorting.none, gather_spec_rates=False,
+                    temperature_invariants=False, thermo_table_tol=None,
+                    reorder_conditions=False, max_reactions_per_kernel=None,
+                    runtime_parameters=False, compact_working_buffer=False,
+                    index_type='int32', driver_block_size=None,
+                    driver_schedule='static', **kwargs
                     ):
     """Create Jacobian subroutine from mechanism.
 
@@ -5341,6 +5317,58 @@ def create_jacobian(lang, mech_name=None, therm_name=None, gas=None,
     explicit_simd: bool [False]
         If true, use explicit-SIMD instructions in OpenCL if possible.  Currently
         available for wide-vectorizations only.
+    gather_spec_rates : bool [False]
+        If True, evaluate the species production rates by summing over each
+        species' reactions (a gather), rather than adding each reaction's net
+        rate of progress to its species (a scatter).  The gather requires no atomic
+        instructions for deep-vectorization
+    temperature_invariants : bool [False]
+        If True, evaluate the temperature, its inverse and logarithm once per
+        condition and share them between the rate constant, falloff and
+        thermodynamic kernels, rather than re-evaluating in each kernel
+    thermo_table_tol : float [None]
+        If supplied, evaluate the species thermodynamic properties and the
+        equilibrium constants by cubic interpolation in uniform temperature
+        tables, built to satisfy this (relative) error tolerance.  Any quantity
+        that cannot meet the tolerance is evaluated from the polynomials as usual
+    reorder_conditions : bool [False]
+        If True, the driver function copies conditions into / out of the working
+        buffer in the order of a supplied permutation (the 'condition_order'
+        input), such that conditions taking the same branches may be grouped into
+        the same vector.  @see :func:`pyjac.core.driver_kernels.condition_order`
+        The generated calling program computes this permutation itself, while
+        the python wrapper takes it as its first argument (@see
+        :func:`pyjac.pywrap.pywrap_gen.pywrap`)
+    max_reactions_per_kernel : int [None]
+        If supplied, split kernels looping over more than this number of reactions
+        (or species) into a sequence of kernels, each evaluating a contiguous
+        chunk of the loop with its own partition of the mechanism data.  This
+        bounds the constant data in each generated function for very large
+        mechanisms
+    runtime_parameters : bool [False]
+        If True, serialize the mechanism parameter tables into a binary file
+        (with a JSON index of its layout) that is loaded when the kernel is
+        initialized, rather than compiling them into the generated source.  The
+        parameters may then be changed without recompiling.  The file is read
+        from the build directory, unless overridden at runtime by the
+        PYJAC_<KERNEL>_PARAMETERS environment variable (e.g.,
+        PYJAC_JACOBIAN_PARAMETERS)
+    compact_working_buffer : bool [False]
+        If True, arrays in the working buffer that are not in use at the same
+        time (over the ordered sub-kernels) share storage, reducing the memory
+        required per work-item
+    index_type : {'int32', 'int64'} ['int32']
+        The integer type used for index arithmetic over the initial conditions in
+        the generated kernels.  Using 'int64' avoids limiting the number of
+        conditions evaluated per-run to prevent integer overflow in the indexing
+        of large (e.g., Jacobian) arrays
+    driver_block_size : int or 'auto' [None]
+        If supplied, each OpenMP thread in the C lockstep driver evaluates a block
+        of this many conditions through each sub-kernel, amortizing the
+        per-condition loop overhead.  If 'auto', the block size is chosen such
+        that a thread's working buffer fits in the L2 cache of the host
+    driver_schedule : {'static', 'dynamic', 'guided'} ['static']
+        The OpenMP schedule of the C lockstep driver loop
 
     Returns
     -------
@@ -5413,6 +5441,18 @@ def create_jacobian(lang, mech_name=None, therm_name=None, gas=None,
                                         rate_spec=rate_specialization,
                                         rate_spec_kernels=split_rate_kernels,
                                         rop_net_kernels=split_rop_net_kernels,
+                                        spec_rates_gather=gather_spec_rates,
+                                        T_invariants=temperature_invariants,
+                                        thermo_table_tol=thermo_table_tol,
+                                        reorder_conditions=reorder_conditions,
+                                        max_reactions_per_kernel=(
+                                            max_reactions_per_kernel),
+                                        runtime_parameters=runtime_parameters,
+                                        compact_working_buffer=(
+                                            compact_working_buffer),
+                                        index_type=index_type,
+                                        driver_block_size=driver_block_size,
+                                        driver_schedule=driver_schedule,
                                         platform=platform,
                                         use_atomic_ints=use_atomic_ints,
                                         use_atomic_doubles=use_atomic_doubles,
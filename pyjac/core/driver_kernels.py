@@ -192,6 +192,15 @@ def create_interior_kernel(for_input):
         global_indicies = indicies[:]
         global_indicies[0] += ' + ' + driver_offset.name
 
+        order_data = []
+        if loopy_opts.reorder_conditions:
+            # gather / scatter the initial conditions in the supplied order
+            order_lp, order_str = mapstore.apply_maps(
+                namestore.condition_order, global_indicies[0],
+                reshape_to_working_buffer=False)
+            order_data.append(order_lp)
+            global_indicies[0] = order_str
+
         # bake in SIMD pre-split
         vec_spec = None
         split_spec = None
@@ -235,6 +244,17 @@ def __build(arr, local, **kwargs):
             end
         """)
 
+        # when each thread evaluates a block of conditions, the sub-kernels run
+        # over the entire block; hence the unused rows of a partial (final) block
+        # are zeroed, rather than left with stale or uninitialized data
+        zero_template = None
+        if for_input and loopy_opts.lang == 'c' and driven.block_size > 1:
+            zero_template = Template("""
+            if ${ind} >= ${problem_size} ${shape_check}
+                ${local_buffer} = 0 {id=zero_${name}, dep=copy_${name}}
+            end
+        """)
+
         warnings = []
         instructions = []
         for i, arr in enumerate(arrs):
@@ -244,14 +264,19 @@ def __build(arr, local, **kwargs):
                 shape_check = ' and {} < {}'.format(
                     indicies[-1], arr.shape[-1])
 
-            instructions.append(instruction_template.substitute(
-                local_buffer=working_strs[i],
-                global_buffer=strs[i],
-                ind=conditional_index,
-                problem_size=arc.problem_size.name,
-                name=arr.name,
-                shape_check=shape_check))
+            for template in [instruction_template, zero_template]:
+                if template is None:
+                    continue
+                instructions.append(template.substitute(
+                    local_buffer=working_strs[i],
+                    global_buffer=strs[i],
+                    ind=conditional_index,
+                    problem_size=arc.problem_size.name,
+                    name=arr.name,
+                    shape_check=shape_check))
             warnings.append('write_race(copy_{})'.format(arr.name))
+            if zero_template is not None:
+                warnings.append('write_race(zero_{})'.format(arr.name))
         if loopy_opts.is_simd:
             warnings.append('vectorize_failed')
             warnings.append('unrolled_vector_iname_conditional')
@@ -259,10 +284,11 @@ def __build(arr, local, **kwargs):
 
         kwargs = {}
         if loopy_opts.lang == 'c':
-            # override the number of copies in this function to 1
-            # (i.e., 1 per-thread)
-            kwargs['iname_domain_override'] = [(arc.global_ind, '0 <= {} < 1'.format(
-                arc.global_ind))]
+            # override the number of copies in this function to the number of
+            # conditions in each thread's block (by default, 1)
+            kwargs['iname_domain_override'] = [(
+                arc.global_ind, '0 <= {} < {}'.format(
+                    arc.global_ind, driven.block_size))]
 
         priorities = ([arc.global_ind + '_outer'] if loopy_opts.pre_split else [
             arc.global_ind]) + [arc.var_name]
@@ -272,7 +298,7 @@ def __build(arr, local, **kwargs):
                         mapstore=mapstore,
                         var_name=arc.var_name,
                         extra_inames=extra_inames,
-                        kernel_data=buffers + working_buffers + [
+                        kernel_data=buffers + working_buffers + order_data + [
                           arc.work_size, arc.problem_size, driver_offset],
                         silenced_warnings=warnings,
                         vectorization_specializer=vec_spec,
@@ -318,6 +344,107 @@ def __build(arr, local, **kwargs):
     return [copy_in, func_call, copy_out]
 
 
+def branch_divergence(T, thresholds, vector_width):
+    """
+    Returns the fraction of vectors (of :param:`vector_width` consecutive
+    conditions) in which the conditions do not all take the same branches, i.e.,
+    in which the temperatures straddle at least one of the :param:`thresholds`
+
+    Parameters
+    ----------
+    T: :class:`numpy.ndarray`
+        The temperatures of the initial conditions, in the order evaluated
+    thresholds: :class:`numpy.ndarray`
+        The temperatures at which the kernels branch, e.g., the species'
+        midpoint temperatures
+    vector_width: int
+        The number of conditions evaluated together
+
+    Returns
+    -------
+    divergence: float
+        The fraction of divergent vectors
+    """
+
+    buckets = np.searchsorted(np.unique(thresholds), T, side='right')
+    num_vecs = int(np.ceil(buckets.size / vector_width))
+    if not num_vecs:
+        return 0.
+    # pad the last vector with its final condition
+    padded = np.full(num_vecs * vector_width, buckets[-1], dtype=buckets.dtype)
+    padded[:buckets.size] = buckets
+    padded = padded.reshape((num_vecs, vector_width))
+    return np.count_nonzero(padded.min(axis=1) != padded.max(axis=1)) / num_vecs
+
+
+def condition_order(T, thresholds, vector_width):
+    """
+    Returns the permutation of the initial conditions to supply to a driver
+    function generated with :attr:`loopy_options.reorder_conditions`, that groups
+    conditions which take the same temperature branches (i.e., lie between the
+    same pair of :param:`thresholds`) into the same vector.
+
+    The sort is stable, such that the original ordering is preserved within each
+    group.  The branch divergence before and after reordering is logged
+
+    Parameters
+    ----------
+    T: :class:`numpy.ndarray`
+        The temperatures of the initial conditions
+    thresholds: :class:`numpy.ndarray`
+        The temperatures at which the kernels branch, e.g., the species'
+        midpoint temperatures (:code:`rate_info['thermo']['T_mid']`)
+    vector_width: int
+        The number of conditions evaluated together
+
+    Returns
+    -------
+    order: :class:`numpy.ndarray`
+        The (zero-based) indicies of the conditions, in the order they should be
+        evaluated
+    """
+
+    buckets = np.searchsorted(np.unique(thresholds), T, side='right')
+    order = np.argsort(buckets, kind='mergesort').astype(arc.kint_type)
+
+    logger = logging.getLogger(__name__)
+    logger.info('Branch divergence of {}-wide vectors: {:.1%} (original order), '
+                '{:.1%} (reordered).'.format(
+                    vector_width, branch_divergence(T, thresholds, vector_width),
+                    branch_divergence(T[order], thresholds, vector_width)))
+    return order
+
+
+def get_block_size(per_condition, cache_size, max_block_size=64):
+    """
+    Determine the number of conditions each OpenMP thread should evaluate per
+    call to the driven kernel, such that the thread's working buffer fits in
+    the supplied cache.
+
+    Parameters
+    ----------
+    per_condition: int
+        The size (in bytes) of the working buffer required per condition
+    cache_size: int
+        The size (in bytes) of the cache
+    max_block_size: int [64]
+        The maximum number of conditions per-block, to bound the work wasted on
+        a partially filled final block
+
+    Returns
+    -------
+    block_size: int
+        The number of conditions per-block, a power of two no smaller than one
+    """
+
+    if not per_condition or not cache_size:
+        return 1
+    block_size = 1
+    while block_size * 2 <= min(cache_size // per_condition, max_block_size):
+        block_size *= 2
+    return block_size
+
+
 def lockstep_driver_template(loopy_opts, driven):
     """
     Returns the appropriate template for a lockstep-based driver function for
@@ -343,8 +470,8 @@ def lockstep_driver_template(loopy_opts, driven):
             // note: work_size unpacking _must_ be done in a parallel section in
             // order to get correct values from omp_get_num_threads()
             ${unpacks}
-            #pragma omp for
-            for (${dtype} ${driver_offset} = 0; ${driver_offset} < ${problem_size}; ${driver_offset} += 1)"""  # noqa
+            #pragma omp for schedule(${schedule})
+            for (${dtype} ${driver_offset} = 0; ${driver_offset} < ${problem_size}; ${driver_offset} += ${block_size})"""  # noqa
             """
             {
                 ${insns}
@@ -374,10 +501,12 @@ def lockstep_driver_template(loopy_opts, driven):
 
     from loopy.types import to_loopy_type
     return template.safe_substitute(
-        dtype=driven.type_map[to_loopy_type(arc.kint_type)],
+        dtype=driven.type_map[to_loopy_type(loopy_opts.index_dtype)],
         driver_offset=driver_offset.name,
         problem_size=arc.problem_size.name,
-        work_size=arc.work_size.name)
+        work_size=arc.work_size.name,
+        schedule=loopy_opts.driver_schedule,
+        block_size=driven.block_size)
 
 
 def queue_driver(loopy_opts, namestore, inputs, outputs, driven,
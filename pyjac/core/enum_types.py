@@ -60,9 +60,22 @@ def __int__(self):
 class reaction_sorting(Enum):
     """
     The reaction sorting scheme
+
+    *   simd: group reactions by type, falloff form, third-body type and
+        reversibility
+    *   specialization: additionally group reactions (within the simd groups) by
+        their Arrhenius rate specialization and stoichiometric shape, such
+        that the rate evaluation kernels have uniform inner loops
+    *   locality: group reactions by reaction type, and order them by the
+        indicies of the species they touch, to improve cache reuse in the rate of
+        progress and species rate kernels
+
+    See :func:`pyjac.core.mech_interpret.sort_reactions`
     """
     none = 0,
-    simd = 1
+    simd = 1,
+    specialization = 2,
+    locality = 3
 
 
 class RateSpecialization(IntEnum):
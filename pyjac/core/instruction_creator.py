@@ -20,6 +20,7 @@
 from pytools import ImmutableRecord
 
 from pyjac.core.array_creator import var_name, jac_creator, kint_type
+from pyjac.core.thermo_tables import T_range
 from pyjac.loopy_utils import preambles_and_manglers as lp_pregen
 from pyjac import utils
 
@@ -375,7 +376,7 @@ class TemperatureGuard(Guard):
         T = min(max(T_min, T), T_max)
     """
 
-    def __init__(self, loopy_opts, T_min=100., T_max=10000.):
+    def __init__(self, loopy_opts, T_min=T_range[0], T_max=T_range[1]):
         super(TemperatureGuard, self).__init__(loopy_opts, minv=T_min, maxv=T_max)
 
 
@@ -594,6 +595,24 @@ def __init__(self, loopy_opts, basename='precompute'):
         self.basename = basename
         self._mang = []
         self.loopy_opts = loopy_opts
+        self._shared = {}
+
+    def share(self, var_str, shared_strs):
+        """
+        Load the precomputed values of :param:`var_str` from (already evaluated)
+        shared values, rather than recomputing them in this kernel
+
+        Parameters
+        ----------
+        var_str : str
+            The stringified representation of the variable, as passed to
+            :func:`__call__`
+        shared_strs : dict of str
+            The stringified representation of the shared values, keyed by the
+            transform (e.g., 'INV', 'LOG') they represent.  Note that the shared
+            values are assumed to be guarded.
+        """
+        self._shared[var_str] = shared_strs.copy()
 
     def __call__(self, result_name, var_str, INSN_KEY, guard=True):
         """
@@ -617,6 +636,13 @@ def __call__(self, result_name, var_str, INSN_KEY, guard=True):
             A loopy instruction in the form:
                 '<>result_name = fn(var_str)'
         """
+        shared = self._shared.get(var_str, {})
+        if INSN_KEY in shared:
+            return Template("<>${result} = ${value} {id=${id}}").safe_substitute(
+                result=result_name,
+                value=shared[INSN_KEY],
+                id=self.reserve_name())
+
         if guard:
             try:
                 # see if user specified callable, or just a default
@@ -721,6 +747,72 @@ def get_update_instruction(mapstore, mask_arr, base_update_insn):
     return base_update_insn
 
 
+def get_plog_bracket(mapstore, namestore, maxP, logP='logP', search_ind='s'):
+    """
+    Generates instructions to locate the interval of the (ragged) PLOG parameter
+    table that brackets the log-pressure :param:`logP`, via a binary search.
+
+    The search takes a fixed number of steps, ceil(log2(maxP - 1)), and each step
+    selects the new bounds without branching, such that the cost is logarithmic
+    in the number of pressures and identical for every reaction
+
+    Parameters
+    ----------
+    mapstore: :class:`array_creator.MapStore`
+        The base mapstore used in creation of this kernel, must be defined over
+        the PLOG reactions (i.e., :attr:`NameStore.num_plog`)
+    namestore: :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    maxP: int
+        The maximum number of pressure interpolations of any reaction in
+        the mechanism.
+    logP: str ['logP']
+        The name of the (precomputed) log-pressure
+    search_ind: str ['s']
+        The iname to use for the binary search
+
+    Returns
+    -------
+    kernel_data: list of :class:`loopy.GlobalArg`
+        The PLOG offset and parameter arrays
+    instructions: str
+        The search instructions.  On completion, the temporary variables `first`
+        and `last` contain the row of the lowest / highest pressure of the
+        reaction in :attr:`NameStore.plog_params`, while `lo_ind` and `hi_ind`
+        contain the rows bracketing :param:`logP`, i.e.:
+        P[lo_ind] < logP <= P[hi_ind].  If :param:`logP` is below the range of
+        the reaction lo_ind == first, while if it is above hi_ind == last.
+        The final updates of `lo_ind` / `hi_ind` have the ids `set_lo` / `set_hi`
+        respectively
+    extra_inames: list of tuple
+        The binary search iname and bounds
+    """
+
+    offset_lp, offset_str = mapstore.apply_maps(namestore.plog_offsets, var_name)
+    _, offset_next_str = mapstore.apply_maps(namestore.plog_offsets, var_name,
+                                             affine=1)
+    params_lp, pressure_mid = mapstore.apply_maps(
+        namestore.plog_params, 'mid', 0)
+
+    num_steps = max(int(np.ceil(np.log2(max(maxP - 1, 1)))), 1)
+    extra_inames = [(search_ind, '0 <= {} < {}'.format(search_ind, num_steps))]
+
+    instructions = Template("""
+    <> first = ${offset_str} {id=first}
+    <> last = ${offset_next_str} - 1 {id=last}
+    <> lo_ind = first {id=lo_init}
+    <> hi_ind = last {id=hi_init}
+    for ${search_ind}
+        <> mid = (lo_ind + hi_ind) // 2 {id=mid, dep=lo_init:hi_init}
+        <> above = ${logP} > ${pressure_mid} {id=above, dep=mid}
+        lo_ind = if(above, mid, lo_ind) {id=set_lo, dep=above}
+        hi_ind = if(above, hi_ind, mid) {id=set_hi, dep=above}
+    end
+    """).safe_substitute(**locals())
+
+    return [offset_lp, params_lp], instructions, extra_inames
+
+
 def wrap_instruction_on_condition(insn, condition, wrapper):
     """
     Utility function to wrap the :param:`insn` in the supplied :param:`wrapper`
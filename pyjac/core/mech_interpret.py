@@ -55,7 +55,107 @@
 elem_wt = chem.get_elem_wt()
 
 
-def sort_reactions(reacs, sort_type, return_order=False):
+def _species_indicies(reacs, specs=None):
+    """
+    Returns the (sorted) indicies of the species participating (as a reactant or
+    product) in each of the :param:`reacs`.  If :param:`specs` is not supplied,
+    species are numbered in order of first appearance in the reactions
+    """
+    if specs is not None:
+        index = dict((spec.name, i) for i, spec in enumerate(specs))
+    else:
+        index = {}
+        for rxn in reacs:
+            for spec in rxn.reac + rxn.prod:
+                index.setdefault(spec, len(index))
+    return [sorted(set(index[spec] for spec in rxn.reac + rxn.prod))
+            for rxn in reacs]
+
+
+def _arrhenius_type(rxn):
+    """
+    Returns the (full) Arrhenius rate specialization of the reaction,
+    see :func:`pyjac.core.rate_subs.assign_rates`
+    """
+    b, Ta = rxn.b, rxn.E
+    if b == 0 and Ta == 0:
+        return 0
+    elif b == int(b) and Ta == 0:
+        return 1
+    elif Ta == 0:
+        return 2
+    elif b == 0:
+        return 3
+    return 4
+
+
+def _stoich_shape(rxn):
+    """
+    Returns the stoichiometric "shape" of the reaction, i.e., the (sorted)
+    reactant and product stoichiometric coefficients
+    """
+    return (tuple(sorted(rxn.reac_nu)), tuple(sorted(rxn.prod_nu)))
+
+
+def _enum_types(rxn):
+    """
+    Returns the reaction type, falloff form, third body form and reversible type
+    of the reaction
+    """
+    from pyjac.core.enum_types import (
+        reaction_type, falloff_form, reversible_type, thd_body_type)
+
+    enum_order = (reaction_type, falloff_form, thd_body_type, reversible_type)
+    types = []
+    for enum in enum_order:
+        e_val = rxn.get_type(enum)
+        assert len(e_val) == 1
+        types.append(int(e_val[0]))
+    return tuple(types)
+
+
+def sorting_metrics(reacs, specs=None, block_size=8):
+    """
+    Returns metrics describing the SIMD-coherence and data locality of the
+    given reaction ordering
+
+    Parameters
+    ----------
+    reacs : list of `ReacInfo`
+        The (ordered) reactions in the mechanism
+    specs : list of `SpecInfo` [None]
+        The species in the mechanism, used to determine the species indicies.  If
+        not supplied, species are numbered in order of first appearance
+    block_size : int [8]
+        The number of consecutive reactions considered to be evaluated together,
+        e.g., the vector width
+
+    Returns
+    -------
+    metrics : dict
+        *   'type_runs': the number of runs of consecutive reactions with
+            identical reaction types (:func:`_enum_types`) and Arrhenius rate
+            specialization
+        *   'shape_runs': the number of runs of consecutive reactions with
+            identical stoichiometric shapes
+        *   'species_per_block': the mean number of distinct species touched by
+            a block of :param:`block_size` consecutive reactions
+    """
+
+    def __runs(keys):
+        return sum(1 for i, key in enumerate(keys) if not i or key != keys[i - 1])
+
+    inds = _species_indicies(reacs, specs)
+    blocks = [set().union(*inds[i:i + block_size])
+              for i in range(0, len(inds), block_size)]
+    return {'type_runs': __runs([_enum_types(rxn) + (_arrhenius_type(rxn),)
+                                 for rxn in reacs]),
+            'shape_runs': __runs([_stoich_shape(rxn) for rxn in reacs]),
+            'species_per_block': np.mean([len(x) for x in blocks]) if blocks
+            else 0}
+
+
+def sort_reactions(reacs, sort_type, return_order=False, specs=None):
     """
     reacs : list of `ReacInfo`
         List of reactions in mechanism to be sorted.
@@ -65,37 +165,66 @@ def sort_reactions(reacs, sort_type, return_order=False):
     return_order : bool [False]
         If True, return new order of sorted reactions, if false, return the sorted
         reactions themselves
+    specs : list of `SpecInfo` [None]
+        The species in the mechanism, used to determine the species indicies for
+        :attr:`reaction_sorting.locality`.  If not supplied, species are numbered
+        in order of first appearance in the reactions
 
+    Notes
+    -----
+    The :attr:`reaction_sorting.simd` and :attr:`reaction_sorting.specialization`
+    schemes group the reactions by type, falloff form, third-body type and
+    reversibility, with the latter further grouping reactions by Arrhenius rate
+    specialization, and then by stoichiometric shape.
+
+    The :attr:`reaction_sorting.locality` scheme groups the reactions by type
+    only, and orders reactions by the largest, and then smallest, species index
+    touched, such that consecutive reactions tend to share species.
+
+    The resulting :func:`sorting_metrics` are logged.
     """
 
     ordering = np.arange(len(reacs))
     from pyjac.core.enum_types import reaction_sorting
-    if sort_type is not None and sort_type != reaction_sorting.none:
-        from pyjac.core.enum_types import (
-            reaction_type, falloff_form, reversible_type, thd_body_type)
-
+    if sort_type is not None and sort_type != reaction_sorting.none and reacs:
         # we consider the following enums:
         # column #1, reaction type
         # column #2, falloff form
         # column #3, third body form
         # column #4, reversible type
-
-        enum_order = (reaction_type, falloff_form, thd_body_type, reversible_type)
-        sort_matrix = np.empty((len(reacs), 4))
-        for i, rxn in enumerate(reacs):
-            for j, enum in enumerate(enum_order):
-                e_val = rxn.get_type(enum)
-                assert len(e_val) == 1
-                sort_matrix[i, j] = int(e_val[0])
-
-        ordering = np.arange(len(reacs))
+        sort_matrix = [list(_enum_types(rxn)) for rxn in reacs]
+
+        if sort_type == reaction_sorting.specialization:
+            # column #5, Arrhenius rate specialization
+            # column #6, stoichiometric shape
+            shapes = [_stoich_shape(rxn) for rxn in reacs]
+            shape_index = dict((shape, i) for i, shape in enumerate(
+                sorted(set(shapes))))
+            for i, rxn in enumerate(reacs):
+                sort_matrix[i].extend([_arrhenius_type(rxn),
+                                       shape_index[shapes[i]]])
+        elif sort_type == reaction_sorting.locality:
+            # keep only the reaction type, such that the (e.g.) PLOG and Chebyshev
+            # reactions remain contiguous, and then:
+            # column #2, largest species index
+            # column #3, smallest species index
+            for i, inds in enumerate(_species_indicies(reacs, specs)):
+                sort_matrix[i] = sort_matrix[i][:1] + [inds[-1], inds[0]]
+
+        sort_matrix = np.array(sort_matrix, dtype=np.float64).reshape(
+            (len(reacs), -1))
 
         # now sort by column -- https://stackoverflow.com/a/38194077
-        for i in reversed(range(len(enum_order))):
+        for i in reversed(range(sort_matrix.shape[1])):
             inds = sort_matrix[:, i].argsort(kind='mergesort')
             ordering = ordering[inds]
             sort_matrix = sort_matrix[inds]
 
+        logger = logging.getLogger(__name__)
+        logger.info('Reaction sorting ({}): {}'.format(sort_type.name, ', '.join(
+            '{}={:.4g}'.format(k, v) for k, v in sorted(sorting_metrics(
+                [reacs[i] for i in ordering], specs).items()))))
+
     if return_order:
         return ordering
 
@@ -804,7 +933,7 @@ def read_mech(mech_filename, therm_filename, sort_type=None):
         spec.finalize()
 
     if sort_type:
-        reacs = sort_reactions(reacs, sort_type)
+        reacs = sort_reactions(reacs, sort_type, specs=specs)
 
     return (elems, specs, reacs)
 
@@ -1257,6 +1386,6 @@ def handle_effiencies(reac, ct_rxn):
         spec.finalize()
 
     if sort_type:
-        reacs = sort_reactions(reacs, sort_type)
+        reacs = sort_reactions(reacs, sort_type, specs=specs)
 
     return (elems, specs, reacs)
@@ -442,6 +442,12 @@ def __specialize(rates, fall=False):
     pp_cheb_coeff = np.empty(0)
     pp_cheb_plim = np.empty(0)
     pp_cheb_tlim = np.empty(0)
+    # ragged (CSR) form of the coefficients, and the affine maps from the
+    # inverse temperature / log pressure to the reduced T / P
+    cheb_coeffs = np.empty(0)
+    cheb_coeff_offsets = np.zeros(1, dtype=arc.kint_type)
+    cheb_tred = np.empty(0)
+    cheb_pred = np.empty(0)
     if num_cheb:
         pp_cheb_coeff = np.zeros((num_cheb, int(np.max(cheb_n_temp)),
                                   int(np.max(cheb_n_pres))))
@@ -452,23 +458,38 @@ def __specialize(rates, fall=False):
         pp_cheb_plim = np.log(np.array(cheb_plim, dtype=np.float64))
         pp_cheb_tlim = 1. / np.array(cheb_tlim, dtype=np.float64)
 
+        # each reaction's (row-major) coefficients, stored consecutively
+        cheb_coeffs = np.concatenate([np.asarray(p, dtype=np.float64).flatten()
+                                      for p in cheb_coeff])
+        cheb_coeff_offsets = np.cumsum(np.concatenate(
+            ([0], cheb_n_temp * cheb_n_pres))).astype(arc.kint_type)
+
+        def __reduction(lim):
+            # red = scale * x + offset, for x in [lim[0], lim[1]] -> [-1, 1]
+            scale = 2. / (lim[:, 1] - lim[:, 0])
+            return np.vstack((scale, -(lim[:, 1] + lim[:, 0]) / (
+                lim[:, 1] - lim[:, 0]))).T.copy()
+        cheb_tred = __reduction(pp_cheb_tlim)
+        cheb_pred = __reduction(pp_cheb_plim)
+
     # plog parameter reorder
     pp_plog_params = np.empty(0)
+    pp_plog_offsets = np.empty(0)
     maxP = None
     if num_plog:
         # max # of parameters for sizing
         maxP = np.max(num_pressures)
-        # for simplicity, we're going to use a padded form
-        pp_plog_params = np.zeros((4, num_plog, maxP))
-        for m in range(4):
-            for i, numP in enumerate(num_pressures):
-                for j in range(numP):
-                    pp_plog_params[m, i, j] = plog_params[i][j][m]
+        # store the parameters of each reaction consecutively in a ragged table,
+        # i.e., row plog_offsets[i] + j holds the [P, A, b, Ta] of the j-th
+        # pressure of the i-th PLOG reaction
+        pp_plog_offsets = np.cumsum(np.concatenate((
+            [0], num_pressures))).astype(arc.kint_type)
+        pp_plog_params = np.array([rate for params in plog_params
+                                   for rate in params], dtype=np.float64)
 
         # take the log of P and A
         hold = np.seterr(divide='ignore')
-        pp_plog_params[0, :, :] = np.log(pp_plog_params[0, :, :])
-        pp_plog_params[1, :, :] = np.log(pp_plog_params[1, :, :])
+        pp_plog_params[:, :2] = np.log(pp_plog_params[:, :2])
         pp_plog_params[np.where(np.isinf(pp_plog_params))] = 0
         np.seterr(**hold)
 
@@ -494,7 +515,8 @@ def __specialize(rates, fall=False):
             'plog': {'map': plog_map, 'num': num_plog,
                      'num_P': num_pressures, 'params': plog_params,
                      'max_P': maxP,
-                     'post_process': {'params': pp_plog_params},
+                     'post_process': {'params': pp_plog_params,
+                                      'offsets': pp_plog_offsets},
                      },
             'cheb': {'map': cheb_map, 'num': num_cheb,
                      'num_P': cheb_n_pres, 'num_T': cheb_n_temp,
@@ -503,7 +525,11 @@ def __specialize(rates, fall=False):
                      'post_process': {
                          'params': pp_cheb_coeff,
                          'Plim': pp_cheb_plim,
-                         'Tlim': pp_cheb_tlim
+                         'Tlim': pp_cheb_tlim,
+                         'coeffs': cheb_coeffs,
+                         'coeff_offsets': cheb_coeff_offsets,
+                         'Tred': cheb_tred,
+                         'Pred': cheb_pred
                      }},
             'fall': {'map': fall_map, 'num': num_fall,
                      'ftype': fall_types, 'blend': blend_type,
@@ -615,6 +641,156 @@ def __create(arr, nrange, name):
             __create(namestore.spec_rates, namestore.num_specs, 'wdot_reset')]
 
 
+def get_temperature_invariants(loopy_opts, namestore, test_size=None):
+    """Evaluates the (guarded) temperature, its inverse and logarithm once per
+    condition, storing them in the shared :attr:`NameStore.T_invariants`
+    (in the column order of :data:`array_creator.T_invariant_keys`) for use
+    in the rate constant, falloff and thermodynamic kernels
+
+    Parameters
+    ----------
+    loopy_opts : `loopy_options` object
+        A object containing all the loopy options to execute
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    test_size : int
+        If not none, this kernel is being used for testing.
+        Hence we need to size the arrays accordingly
+
+    Returns
+    -------
+    knl_list : :class:`knl_info`
+        The generated infos for feeding into the kernel generator
+    """
+
+    mapstore = arc.MapStore(loopy_opts, namestore.num_T_invariants, test_size)
+
+    # first, create all arrays
+    kernel_data = []
+
+    # add problem size
+    kernel_data.extend(arc.initial_condition_dimension_vars(
+        loopy_opts, test_size))
+
+    T_lp, T_str = mapstore.apply_maps(namestore.T_arr, global_ind)
+    inv_lp, inv_str = mapstore.apply_maps(namestore.T_invariants, *default_inds)
+    kernel_data.extend([T_lp, inv_lp])
+
+    precompute = ic.PrecomputedInstructions(loopy_opts)
+    Tval = 'Tval'
+    pre_instructions = [precompute(Tval, T_str, 'VAL',
+                                   guard=ic.TemperatureGuard(loopy_opts))]
+
+    values = {'VAL': Tval,
+              'INV': '1 / {}'.format(Tval),
+              'LOG': 'log({})'.format(Tval)}
+    keys = arc.T_invariant_keys
+    # select the invariant corresponding to this column
+    value = values[keys[-1]]
+    for i, key in reversed(list(enumerate(keys[:-1]))):
+        value = 'if({} == {}, {}, {})'.format(var_name, i, values[key], value)
+
+    instructions = Template(
+        """
+            ${inv_str} = ${value} {id=set, dep=precompute*}
+        """).substitute(**locals())
+
+    # each invariant is written by exactly one thread / lane
+    can_vectorize, vec_spec = ic.get_deep_specializer(
+        loopy_opts, init_ids=['set'], atomic=False, is_write_race=False)
+
+    return k_gen.knl_info(name='T_invariants',
+                          pre_instructions=pre_instructions,
+                          instructions=instructions,
+                          mapstore=mapstore,
+                          var_name=var_name,
+                          kernel_data=kernel_data,
+                          can_vectorize=can_vectorize,
+                          vectorization_specializer=vec_spec,
+                          manglers=[precompute])
+
+
+def _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        kernel_data):
+    """
+    If :attr:`loopy_opts.T_invariants` is set, direct the :param:`precompute`
+    instructions of the (guarded) temperature to load from the shared block
+    evaluated by :func:`get_temperature_invariants`, rather than recomputing
+    them in this kernel
+
+    Parameters
+    ----------
+    loopy_opts : `loopy_options` object
+        A object containing all the loopy options to execute
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    mapstore : :class:`array_creator.MapStore`
+        The mapstore of the kernel
+    T_str : str
+        The stringified temperature, as passed to :param:`precompute`
+    precompute : :class:`instruction_creator.PrecomputedInstructions`
+        The precomputed instruction generator of the kernel
+    kernel_data : list of :class:`loopy.KernelArgument`
+        The kernel's arguments, to which the shared block is added
+    """
+
+    if not loopy_opts.T_invariants:
+        return
+
+    shared = {}
+    for i, key in enumerate(arc.T_invariant_keys):
+        inv_lp, shared[key] = mapstore.apply_maps(
+            namestore.T_invariants, global_ind, str(i))
+    kernel_data.append(inv_lp)
+    precompute.share(T_str, shared)
+
+
+def _table_interpolant(namestore, mapstore, name, index, T='T'):
+    """
+    Generates the instructions to evaluate a (cubic) interpolant from the
+    table :param:`name` of :attr:`NameStore.thermo_tables`, without branching
+
+    Parameters
+    ----------
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    mapstore : :class:`array_creator.MapStore`
+        The mapstore of the kernel
+    name : str
+        The tabulated quantity, @see :func:`thermo_tables.get_tables`
+    index : str
+        The index of the table entry (i.e., the species or reaction) to evaluate
+    T : str ['T']
+        The temperature at which to evaluate the table
+
+    Returns
+    -------
+    table_lp : :class:`loopy.GlobalArg`
+        The table
+    pre_instructions : list of str
+        The instructions locating :param:`T` in the table, shared between all
+        entries
+    interpolant : str
+        The interpolant of the :param:`index`-th entry at :param:`T`
+    """
+
+    T0, inv_dT, num_intervals = namestore.thermo_tables[name]
+    table = getattr(namestore, name + '_table')
+    table_lp, _ = mapstore.apply_maps(table, index, 'cell', 0)
+    c = [mapstore.apply_maps(table, index, 'cell', i)[1] for i in range(4)]
+
+    # clamp the interval; the table covers the guarded temperature range, so
+    # this only catches round-off at the ends of the table
+    pre_instructions = [
+        '<> Tpos = ({T} - ({T0:.17g})) * ({inv_dT:.17g})'.format(
+            T=T, T0=T0, inv_dT=inv_dT),
+        '<int32> cell = min(max(floor(Tpos), 0.0), {:.1f})'.format(
+            num_intervals - 1),
+        '<> t = Tpos - cell']
+    interpolant = '{} + t * ({} + t * ({} + t * {}))'.format(*c)
+    return table_lp, pre_instructions, interpolant
+
+
 def get_concentrations(loopy_opts, namestore, conp=True,
                        test_size=None):
     """Determines concentrations from moles and state variables depending
@@ -718,6 +894,7 @@ def get_concentrations(loopy_opts, namestore, conp=True,
                           pre_instructions=[pre_instructions],
                           instructions=instructions,
                           post_instructions=[post_instructions],
+                          chunkable=False,
                           mapstore=mapstore,
                           var_name=var_name,
                           kernel_data=kernel_data,
@@ -972,6 +1149,7 @@ def get_extra_var_rates(loopy_opts, namestore, conp=True,
                           pre_instructions=pre_instructions,
                           instructions=instructions,
                           post_instructions=post_instructions,
+                          chunkable=False,
                           mapstore=mapstore,
                           var_name=var_name,
                           kernel_data=kernel_data,
@@ -1090,6 +1268,7 @@ def get_temperature_rate(loopy_opts, namestore, conp=True,
                           pre_instructions=pre_instructions,
                           instructions=instructions,
                           post_instructions=post_instructions,
+                          chunkable=False,
                           mapstore=mapstore,
                           var_name=var_name,
                           kernel_data=kernel_data,
@@ -1103,6 +1282,10 @@ def get_spec_rates(loopy_opts, namestore, conp=True,
        temperature derivative
     kernel
 
+    If :attr:`loopy_opts.spec_rates_gather` is set, the gather form
+    (:func:`__get_spec_rates_gather`) is returned instead of the default scatter
+    over reactions
+
     Parameters
     ----------
     loopy_opts : `loopy_options` object
@@ -1123,6 +1306,9 @@ def get_spec_rates(loopy_opts, namestore, conp=True,
         equation types
     """
 
+    if loopy_opts.spec_rates_gather:
+        return __get_spec_rates_gather(loopy_opts, namestore, test_size)
+
     kernel_data = []
 
     # add problem size
@@ -1188,6 +1374,94 @@ def get_spec_rates(loopy_opts, namestore, conp=True,
                           vectorization_specializer=vec_spec)
 
 
+def __get_spec_rates_gather(loopy_opts, namestore, test_size=None):
+    """Generates instructions, kernel arguements, and data for the species
+    production rates, summing the net rates of progress of the reactions of each
+    species (via the species -> reaction CSR map) and writing each species rate
+    once.  As each species is owned by a single thread / lane, no atomics are
+    required for deep-vectorization
+
+    Species that participate in no reactions are not written, and retain the zero
+    value of the output buffer.
+
+    Parameters
+    ----------
+    loopy_opts : `loopy_options` object
+        A object containing all the loopy options to execute
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    test_size : int
+        If not none, this kernel is being used for testing.
+        Hence we need to size the arrays accordingly
+
+    Returns
+    -------
+    knl_list : :class:`knl_info`
+        The generated info for feeding into the kernel generator
+    """
+
+    kernel_data = []
+
+    # add problem size
+    kernel_data.extend(arc.initial_condition_dimension_vars(
+        loopy_opts, test_size))
+
+    # various indicies
+    spec_ind = 'spec_ind'
+    irxn = 'irxn'
+    rxn_ind = 'rxn_ind'
+
+    # create map store
+    mapstore = arc.MapStore(loopy_opts, namestore.num_net_spec, test_size)
+
+    # create arrays
+    spec_lp, spec_str = mapstore.apply_maps(namestore.net_spec, var_name)
+    rxn_offsets_lp, rxn_offsets_str = mapstore.apply_maps(
+        namestore.spec_to_rxn_offsets, var_name)
+    _, rxn_offsets_next_str = mapstore.apply_maps(
+        namestore.spec_to_rxn_offsets, var_name, affine=1)
+    rxn_lp, rxn_str = mapstore.apply_maps(namestore.spec_to_rxn, irxn)
+    nu_lp, nu_str = mapstore.apply_maps(namestore.spec_to_rxn_nu, irxn)
+    rop_net_lp, rop_net_str = mapstore.apply_maps(namestore.rop_net,
+                                                  global_ind, rxn_ind)
+    wdot_lp, wdot_str = mapstore.apply_maps(namestore.spec_rates,
+                                            global_ind, spec_ind)
+
+    # update kernel args
+    kernel_data.extend(
+        [spec_lp, rxn_offsets_lp, rxn_lp, nu_lp, rop_net_lp, wdot_lp])
+
+    # now the instructions
+    instructions = Template(
+        """
+    <> ${spec_ind} = ${spec_str}
+    <> offset = ${rxn_offsets_str}
+    <> offset_next = ${rxn_offsets_next_str}
+    <> net_rate = 0 {id=init}
+    for ${irxn}
+        <> ${rxn_ind} = ${rxn_str}
+        net_rate = net_rate + ${nu_str} * ${rop_net_str} {id=sum, dep=init}
+    end
+    ${wdot_str} = net_rate {id=set, dep=sum}
+    """).safe_substitute(**locals())
+
+    # extra inames
+    extra_inames = [(irxn, 'offset <= {} < offset_next'.format(irxn))]
+
+    # each species rate is written by exactly one thread / lane
+    can_vectorize, vec_spec = ic.get_deep_specializer(
+        loopy_opts, init_ids=['set'], atomic=False, is_write_race=False)
+
+    return k_gen.knl_info(name='spec_rates',
+                          instructions=instructions,
+                          mapstore=mapstore,
+                          var_name=var_name,
+                          kernel_data=kernel_data,
+                          extra_inames=extra_inames,
+                          can_vectorize=can_vectorize,
+                          vectorization_specializer=vec_spec)
+
+
 def get_rop_net(loopy_opts, namestore, test_size=None):
     """Generates instructions, kernel arguements, and data for the net
     Rate of Progress kernels
@@ -1645,6 +1919,86 @@ def get_rxn_pres_mod(loopy_opts, namestore, test_size=None):
     return info_list
 
 
+def __get_tabulated_rev_rates(loopy_opts, namestore, test_size=None):
+    """Generates instructions, kernel arguements, and data for reverse reaction
+    rates, using the equilibrium constants interpolated from the table built by
+    :mod:`thermo_tables`
+
+    Parameters
+    ----------
+    loopy_opts : `loopy_options` object
+        A object containing all the loopy options to execute
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    test_size : int
+        If not none, this kernel is being used for testing.
+        Hence we need to size the arrays accordingly
+
+    Returns
+    -------
+    knl_list : list of :class:`knl_info`
+        The generated infos for feeding into the kernel generator
+    """
+
+    kernel_data = []
+    # add problem size
+    kernel_data.extend(arc.initial_condition_dimension_vars(
+        loopy_opts, test_size))
+
+    # add the reverse map
+    rev_map = arc.MapStore(loopy_opts, namestore.num_rev_reacs, test_size)
+    rev_map.check_and_add_transform(
+        namestore.kf, namestore.rev_map)
+
+    # temperature
+    T_lp, T_str = rev_map.apply_maps(namestore.T_arr, global_ind)
+    # the (logarithm of the) equilibrium constants are tabulated on the reverse
+    # reaction index
+    table_lp, table_insns, interpolant = _table_interpolant(
+        namestore, rev_map, 'Kc', var_name)
+
+    # the Kc array on the main loop, no map as this is only reversible
+    Kc_lp, Kc_str = rev_map.apply_maps(namestore.Kc, *default_inds)
+
+    # create the kf array / str
+    kf_arr, kf_str = rev_map.apply_maps(
+        namestore.kf, *default_inds)
+
+    # create the kr array / str (no map as we're looping over rev inds)
+    kr_arr, kr_str = rev_map.apply_maps(
+        namestore.kr, *default_inds)
+
+    # update kernel data
+    kernel_data.extend([T_lp, table_lp, Kc_lp, kf_arr, kr_arr])
+
+    # guard the temperature, as in the thermodynamic polynomial evaluation
+    guard = ic.TemperatureGuard(loopy_opts)
+    precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, rev_map, T_str, precompute,
+                        kernel_data)
+    preinstructs = [precompute('T', T_str, 'VAL', guard=guard)] + table_insns
+
+    expg = ic.GuardedExp(loopy_opts)
+    Kc_exp = expg('logKc')
+
+    instructions = Template("""
+    <>logKc = ${interpolant}
+    <>Kc_temp = ${Kc_exp}
+    ${Kc_str} = Kc_temp
+    ${kr_str} = ${kf_str} / Kc_temp
+    """).safe_substitute(**locals())
+
+    return k_gen.knl_info(name='rateconst_Kc',
+                          instructions=instructions,
+                          pre_instructions=preinstructs,
+                          var_name=var_name,
+                          kernel_data=kernel_data,
+                          mapstore=rev_map,
+                          manglers=[precompute, expg],
+                          # the table lookup varies between conditions
+                          silenced_warnings=['vectorize_failed'])
+
+
 def get_rev_rates(loopy_opts, namestore, allint, test_size=None):
     """Generates instructions, kernel arguements, and data for reverse reaction
     rates
@@ -1674,6 +2028,10 @@ def get_rev_rates(loopy_opts, namestore, allint, test_size=None):
     if namestore.num_rev_reacs is None:
         return None
 
+    if 'Kc' in namestore.thermo_tables:
+        return __get_tabulated_rev_rates(loopy_opts, namestore,
+                                         test_size=test_size)
+
     # start developing the Kc kernel
     kernel_data = []
     spec_ind = 'spec_ind'
@@ -1926,6 +2284,14 @@ def get_cheb_arrhenius_rates(loopy_opts, namestore, maxP, maxT,
                              test_size=None):
     """Generates instructions, kernel arguements, and data for cheb rate constants
 
+    The Chebyshev polynomials are evaluated via a (nested) Clenshaw recurrence
+    over each reaction's own temperature / pressure degrees, reading the
+    coefficients from a ragged (CSR) array such that reactions with low-order
+    fits do not pay for the highest order fit in the mechanism.
+
+    If all Chebyshev reactions share the same temperature & pressure bounds, the
+    reduced temperature and pressure are evaluated once per condition.
+
     Parameters
     ----------
     loopy_opts : `loopy_options` object
@@ -1956,19 +2322,11 @@ def get_cheb_arrhenius_rates(loopy_opts, namestore, maxP, maxT,
     # create mapper
     mapstore = arc.MapStore(loopy_opts, namestore.num_cheb, test_size)
 
-    # max degrees in mechanism
-    poly_max = int(np.maximum(maxP, maxT))
-
-    # extra inames
+    # extra inames -- bounded by the degrees of each reaction
     pres_poly_ind = 'k'
     temp_poly_ind = 'm'
-    poly_compute_ind = 'p'
-    lim_ind = 'dummy'
-    extra_inames = [(pres_poly_ind, '0 <= {} < {}'.format(
-        pres_poly_ind, maxP)),
-        (temp_poly_ind, '0 <= {} < {}'.format(
-                        temp_poly_ind, maxT)),
-        (poly_compute_ind, '2 <= {} < {}'.format(poly_compute_ind, poly_max))]
+    extra_inames = [(pres_poly_ind, '0 <= {} < numP'.format(pres_poly_ind)),
+                    (temp_poly_ind, '0 <= {} < numT'.format(temp_poly_ind))]
 
     # create arrays
 
@@ -1977,18 +2335,10 @@ def get_cheb_arrhenius_rates(loopy_opts, namestore, maxP, maxT,
 
     num_P_lp, num_P_str = mapstore.apply_maps(namestore.cheb_numP, var_name)
     num_T_lp, num_T_str = mapstore.apply_maps(namestore.cheb_numT, var_name)
-    params_lp, params_str = mapstore.apply_maps(namestore.cheb_params,
-                                                var_name,
-                                                temp_poly_ind,
-                                                pres_poly_ind)
-    plim_lp, _ = mapstore.apply_maps(namestore.cheb_Plim, var_name, lim_ind)
-    tlim_lp, _ = mapstore.apply_maps(namestore.cheb_Tlim, var_name, lim_ind)
-
-    # workspace vars are based only on their polynomial indicies
-    pres_poly_lp, ppoly_k_str = mapstore.apply_maps(namestore.cheb_pres_poly,
-                                                    pres_poly_ind)
-    temp_poly_lp, tpoly_m_str = mapstore.apply_maps(namestore.cheb_temp_poly,
-                                                    temp_poly_ind)
+    offsets_lp, offset_str = mapstore.apply_maps(namestore.cheb_coeff_offsets,
+                                                 var_name)
+    coeffs_lp, coeff_str = mapstore.apply_maps(namestore.cheb_coeffs,
+                                               'coeff_ind')
 
     # create temperature and pressure arrays
     T_arr, T_str = mapstore.apply_maps(namestore.T_arr, global_ind)
@@ -2003,87 +2353,67 @@ def get_cheb_arrhenius_rates(loopy_opts, namestore, maxP, maxT,
     kernel_data.extend(arc.initial_condition_dimension_vars(
         loopy_opts, test_size))
 
-    kernel_data.extend([params_lp, num_P_lp, num_T_lp, plim_lp, tlim_lp,
-                        pres_poly_lp, temp_poly_lp, T_arr, P_arr, kf_arr])
+    kernel_data.extend([coeffs_lp, offsets_lp, num_P_lp, num_T_lp, T_arr, P_arr,
+                        kf_arr])
 
     # preinstructions
     logP = 'logP'
     Tinv = 'Tinv'
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        kernel_data)
 
     preinstructs = [precompute(logP, P_str, 'LOG'),
                     precompute(Tinv, T_str, 'INV', guard=ic.TemperatureGuard(
                         loopy_opts))]
 
-    # various strings for preindexed limits, params, etc
-    _, Pmin_str = mapstore.apply_maps(namestore.cheb_Plim, var_name, '0')
-    _, Pmax_str = mapstore.apply_maps(namestore.cheb_Plim, var_name, '1')
-    _, Tmin_str = mapstore.apply_maps(namestore.cheb_Tlim, var_name, '0')
-    _, Tmax_str = mapstore.apply_maps(namestore.cheb_Tlim, var_name, '1')
-
-    _, ppoly0_str = mapstore.apply_maps(namestore.cheb_pres_poly, '0')
-    _, ppoly1_str = mapstore.apply_maps(namestore.cheb_pres_poly, '1')
-    _, ppolyp_str = mapstore.apply_maps(namestore.cheb_pres_poly,
-                                        poly_compute_ind)
-    _, ppolypm1_str = mapstore.apply_maps(namestore.cheb_pres_poly,
-                                          poly_compute_ind,
-                                          affine=-1)
-    _, ppolypm2_str = mapstore.apply_maps(namestore.cheb_pres_poly,
-                                          poly_compute_ind,
-                                          affine=-2)
-    _, tpoly0_str = mapstore.apply_maps(namestore.cheb_temp_poly, '0')
-    _, tpoly1_str = mapstore.apply_maps(namestore.cheb_temp_poly, '1')
-    _, tpolyp_str = mapstore.apply_maps(namestore.cheb_temp_poly,
-                                        poly_compute_ind)
-    _, tpolypm1_str = mapstore.apply_maps(namestore.cheb_temp_poly,
-                                          poly_compute_ind,
-                                          affine=-1)
-    _, tpolypm2_str = mapstore.apply_maps(namestore.cheb_temp_poly,
-                                          poly_compute_ind,
-                                          affine=-2)
+    # the reduced temperature / pressure
+    reductions = []
+    for red, red_arr, var in [('Tred', namestore.cheb_Tred, Tinv),
+                              ('Pred', namestore.cheb_Pred, logP)]:
+        if np.all(red_arr.initializer == red_arr.initializer[0]):
+            # shared between all reactions, evaluate once per condition
+            scale, offset = red_arr.initializer[0]
+            preinstructs.append(
+                '<>{red} = {var} * ({scale:.17g}) + ({offset:.17g})'.format(
+                    red=red, var=var, scale=scale, offset=offset))
+        else:
+            red_lp, scale_str = mapstore.apply_maps(red_arr, var_name, '0')
+            _, offset_str = mapstore.apply_maps(red_arr, var_name, '1')
+            kernel_data.append(red_lp)
+            reductions.append('<>{red} = {var} * {scale} + {offset}'.format(
+                red=red, var=var, scale=scale_str, offset=offset_str))
+    reductions = '\n'.join(reductions)
 
     eguard = ic.GuardedExp(loopy_opts, exptype=utils.exp_10_fun[loopy_opts.lang])
     exp10fun = eguard('kf_temp')
 
+    # for a Chebyshev series y = sum_{k=0}^{n-1} a_k T_k(x), the Clenshaw
+    # recurrence b_k = a_k + 2 * x * b_{k + 1} - b_{k + 2} (k = n - 1, ..., 0)
+    # gives y = b_0 - x * b_1.  This is applied in pressure to find the
+    # coefficient of each temperature polynomial, and again in temperature
     instructions = Template("""
-<>Pmin = ${Pmin_str}
-<>Tmin = ${Tmin_str}
-<>Pmax = ${Pmax_str}
-<>Tmax = ${Tmax_str}
-<>Tred = (-Tmax - Tmin + 2 * ${Tinv}) / (Tmax - Tmin)
-<>Pred = (-Pmax - Pmin + 2 * ${logP}) / (Pmax - Pmin)
+${reductions}
 <>numP = ${num_P_str} {id=plim}
 <>numT = ${num_T_str} {id=tlim}
-${ppoly0_str} = 1 {id=ppoly_init}
-${ppoly1_str} = Pred {id=ppoly_init1}
-${tpoly0_str} = 1 {id=tpoly_init}
-${tpoly1_str} = Tred {id=tpoly_init2}
-#<> poly_end = max(numP, numT)
-# compute polynomial terms
-for p
-    if p < numP
-        ${ppolyp_str} = 2 * Pred * ${ppolypm1_str} - ${ppolypm2_str} \
-            {id=ppoly, dep=plim:ppoly_init*}
-    end
-    if p < numT
-        ${tpolyp_str} = 2 * Tred * ${tpolypm1_str} - ${tpolypm2_str} \
-            {id=tpoly, dep=tlim:tpoly_init*}
-    end
-end
-<> kf_temp = 0 {id=kf_init}
+<>offset = ${offset_str}
+<>b1 = 0 {id=b1_init}
+<>b2 = 0 {id=b2_init}
 for m
-    <>temp = 0 {id=temp_init}
+    <>d1 = 0 {id=d1_init}
+    <>d2 = 0 {id=d2_init}
     for k
-        if k < numP
-            temp = temp + ${ppoly_k_str} * ${params_str} {id=temp,
-                dep=ppoly:tpoly:kf_init:temp_init}
-        end
-    end
-    if m < numT
-        kf_temp = kf_temp + ${tpoly_m_str} * temp {id=kf, dep=temp:kf_init}
+        <>coeff_ind = offset + (numT - 1 - m) * numP + (numP - 1 - k)
+        <>d0 = ${coeff_str} + 2 * Pred * d1 - d2 {id=d0, dep=d*_init:plim:tlim}
+        d2 = d1 {id=d2, dep=d0}
+        d1 = d0 {id=d1, dep=d2}
     end
+    <>t0 = d1 - Pred * d2 + 2 * Tred * b1 - b2 {id=t0, dep=d1:d2:b*_init}
+    b2 = b1 {id=b2, dep=t0}
+    b1 = t0 {id=b1, dep=b2}
 end
+<> kf_temp = b1 - Tred * b2 {id=kf, dep=b1:b2}
 
 ${kf_str} = ${exp10fun} {id=set, dep=kf}
 """)
@@ -2131,28 +2461,13 @@ def get_plog_arrhenius_rates(loopy_opts, namestore, maxP, test_size=None):
 
     # parameter indicies
     arrhen_ind = 'm'
-    param_ind = 'k'
-    lo_ind = 'lo_ind'
-    hi_ind = 'hi_ind'
 
     # create mapper
-    mapstore = arc.MapStore(loopy_opts, namestore.plog_map, test_size)
-
-    # number of parameter sets per reaction
-    mapstore.check_and_add_transform(namestore.plog_num_param,
-                                     namestore.num_plog)
+    mapstore = arc.MapStore(loopy_opts, namestore.num_plog, test_size)
 
-    # plog parameters
-    mapstore.check_and_add_transform(namestore.plog_params,
-                                     namestore.num_plog)
     # fwd rate constants
     mapstore.check_and_add_transform(namestore.kf, namestore.plog_map)
 
-    plog_num_param_lp, plog_num_param_str = mapstore.apply_maps(
-        namestore.plog_num_param, var_name)
-    plog_params_lp, plog_params_str = mapstore.apply_maps(
-        namestore.plog_params, arrhen_ind, var_name, param_ind)
-
     # temperature / pressure arrays
     T_arr, T_str = mapstore.apply_maps(namestore.T_arr, global_ind)
     P_arr, P_str = mapstore.apply_maps(namestore.P_arr, global_ind)
@@ -2166,6 +2481,15 @@ def get_plog_arrhenius_rates(loopy_opts, namestore, maxP, test_size=None):
     # forward rxn rate constants
     kf_arr, kf_str = mapstore.apply_maps(namestore.kf, *default_inds)
 
+    # precompute names
+    logP = 'logP'
+    logT = 'logT'
+    Tinv = 'Tinv'
+
+    # locate the bracketing pressures
+    plog_data, bracket_insns, extra_inames = ic.get_plog_bracket(
+        mapstore, namestore, maxP, logP=logP)
+
     # data
     kernel_data = []
     # add problem size
@@ -2173,30 +2497,17 @@ def get_plog_arrhenius_rates(loopy_opts, namestore, maxP, test_size=None):
         loopy_opts, test_size))
 
     # update kernel data
-    kernel_data.extend([plog_params_lp, plog_num_param_lp, T_arr,
-                        P_arr, low_lp, hi_lp, kf_arr])
+    kernel_data.extend(plog_data + [T_arr, P_arr, low_lp, hi_lp, kf_arr])
     # extra loops
-    extra_inames = [(param_ind, '0 <= {} < {}'.format(param_ind, maxP - 1)),
-                    (arrhen_ind, '0 <= {} < 4'.format(arrhen_ind))]
+    extra_inames.append((arrhen_ind, '0 <= {} < 4'.format(arrhen_ind)))
 
     # specific indexing strings
-    _, pressure_lo = mapstore.apply_maps(
-        namestore.plog_params, 0, var_name, 0)
-    _, pressure_hi = mapstore.apply_maps(
-        namestore.plog_params, 0, var_name, 'numP')
-    _, pressure_mid_lo = mapstore.apply_maps(
-        namestore.plog_params, 0, var_name, param_ind)
-    _, pressure_mid_hi = mapstore.apply_maps(
-        namestore.plog_params, 0, var_name, param_ind, affine={param_ind: 1})
+    _, pressure_lo = mapstore.apply_maps(namestore.plog_params, 'first', 0)
+    _, pressure_hi = mapstore.apply_maps(namestore.plog_params, 'last', 0)
     _, pressure_general_lo = mapstore.apply_maps(
-        namestore.plog_params, arrhen_ind, var_name, lo_ind)
+        namestore.plog_params, 'lo_ind', arrhen_ind)
     _, pressure_general_hi = mapstore.apply_maps(
-        namestore.plog_params, arrhen_ind, var_name, hi_ind)
-
-    # precompute names
-    logP = 'logP'
-    logT = 'logT'
-    Tinv = 'Tinv'
+        namestore.plog_params, 'hi_ind', arrhen_ind)
 
     # exponentials
     expg = ic.GuardedExp(loopy_opts)
@@ -2205,33 +2516,16 @@ def get_plog_arrhenius_rates(loopy_opts, namestore, maxP, test_size=None):
     # instructions
     instructions = Template(
         """
+        ${bracket_insns}
         <>lower = ${logP} <= ${pressure_lo} # check below range
-        if lower
-            <>lo_ind = 0 {id=ind00, nosync=ind10}
-            <>hi_ind = 0 {id=ind01, nosync=ind11}
-        end
-        <>numP = ${plog_num_param_str} - 1
         <>upper = ${logP} > ${pressure_hi} # check above range
-        if upper
-            lo_ind = numP {id=ind10, nosync=ind00}
-            hi_ind = numP {id=ind11, nosync=ind01}
-        end
         <>oor = lower or upper
-        for k
-            # check that
-            # 1. inside this reactions parameter's still
-            # 2. inside pressure range
-            <> midcheck = (k < numP) and (${logP} > ${pressure_mid_lo}) \
-                and (${logP} <= ${pressure_mid_hi})
-            if midcheck
-                lo_ind = k {id=ind20, dep=ind10:ind00}
-                hi_ind = k + 1 {id=ind21, dep=ind11:ind01}
-            end
-        end
+        # above range, use the highest pressure's parameters
+        lo_ind = if(upper, last, lo_ind) {id=set_oor, dep=set_lo}
         # load pressure and reaction parameters into temp arrays
         for m
-            low[m] = ${pressure_general_lo} {id=lo, dep=ind*}
-            hi[m] = ${pressure_general_hi} {id=hi, dep=ind*}
+            low[m] = ${pressure_general_lo} {id=lo, dep=set_oor}
+            hi[m] = ${pressure_general_hi} {id=hi, dep=set_hi}
         end
         # eval logkf's
         <>logk1 = low[1] + ${logT} * low[2] - low[3] * ${Tinv}  {id=a1, dep=lo}
@@ -2249,6 +2543,8 @@ def get_plog_arrhenius_rates(loopy_opts, namestore, maxP, test_size=None):
 
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        kernel_data)
     guardT = ic.TemperatureGuard(loopy_opts)
     preinsns = [precompute(Tinv, T_str, 'INV', guard=guardT),
                 precompute(logT, T_str, 'LOG', guard=guardT),
@@ -2477,6 +2773,8 @@ def get_troe_kernel(loopy_opts, namestore, test_size=None):
     vec_spec = ic.write_race_silencer(['Fi'])
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        kernel_data)
 
     return [k_gen.knl_info('fall_troe',
                            pre_instructions=[
@@ -2574,6 +2872,8 @@ def get_sri_kernel(loopy_opts, namestore, test_size=None):
 
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        kernel_data)
     Tguard = ic.TemperatureGuard(loopy_opts)
     pre_instructions = [precompute(Tval, T_str, 'VAL', guard=Tguard),
                         precompute(Tinv, T_str, 'INV', guard=Tguard)]
@@ -2762,6 +3062,8 @@ def get_rdomain(rtype):
     guardT = ic.TemperatureGuard(loopy_opts)
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        base_kernel_data)
     default_preinstructs = {Tinv:
                             precompute(Tinv, T_str, 'INV', guard=guardT),
                             logT:
@@ -3112,6 +3414,13 @@ def __add_knl(knls, klist=None):
     # reset kernels
     __add_knl(reset_arrays(loopy_opts, nstore, test_size=test_size))
 
+    # the shared temperature invariants, if enabled
+    T_invariants = None
+    if loopy_opts.T_invariants:
+        T_invariants = get_temperature_invariants(loopy_opts, nstore,
+                                                  test_size=test_size)
+        __add_knl(T_invariants)
+
     # first, add the concentration kernel
     __add_knl(get_concentrations(loopy_opts, nstore, conp=conp,
                                  test_size=test_size))
@@ -3166,13 +3475,18 @@ def __add_knl(knls, klist=None):
 
     # thermo polynomial dimension
     depends_on = []
+    if T_invariants is not None:
+        # the thermo kernels read the shared invariants
+        depends_on.append(T_invariants)
     # check for reverse rates
     if rate_info['rev']['num']:
-        # add the 'b' eval
-        __add_knl(polyfit_kernel_gen('b', loopy_opts,
-                                     nstore, test_size))
-        # addd the 'b' eval to depnediencies
-        depends_on.append(kernels[-1])
+        if 'Kc' not in nstore.thermo_tables:
+            # add the 'b' eval (unneeded if the equilibrium constants are
+            # tabulated)
+            __add_knl(polyfit_kernel_gen('b', loopy_opts,
+                                         nstore, test_size))
+            # addd the 'b' eval to depnediencies
+            depends_on.append(kernels[-1])
         # add Kc / rev rates
         __add_knl(get_rev_rates(loopy_opts,
                                 nstore,
@@ -3225,6 +3539,10 @@ def __add_knl(knls, klist=None):
 
     # get a wrapper for the dependecies
     thermo_in, thermo_out = inputs_and_outputs(conp, KernelType.chem_utils)
+    thermo_barriers = []
+    if T_invariants is not None and loopy_opts.depth:
+        # barrier after the shared temperature invariants
+        thermo_barriers.append((0, 1, 'global'))
     thermo_wrap = k_gen.make_kernel_generator(kernel_type=KernelType.chem_utils,
                                               loopy_opts=loopy_opts,
                                               kernels=depends_on,
@@ -3233,6 +3551,7 @@ def __add_knl(knls, klist=None):
                                               output_arrays=thermo_out,
                                               auto_diff=auto_diff,
                                               test_size=test_size,
+                                              barriers=thermo_barriers,
                                               mem_limits=mem_limits
                                               )
 
@@ -3247,6 +3566,8 @@ def __insert_at(name, before=True):
                 else:
                     barriers.append((ind, ind + 1, 'global'))
         # need to add barriers
+        # barrier after the shared temperature invariants
+        __insert_at('T_invariants', False)
         # barrier at third bodies for get_concentrations
         __insert_at('eval_thd_body_concs', True)
         # barrier for reduced pressure based on thd body concs and kf_fall
@@ -3303,6 +3624,65 @@ def __insert_at(name, before=True):
         **kwargs)
 
 
+def __get_tabulated_thermo(nicename, loopy_opts, namestore, test_size=None):
+    """Generates a kernel that evaluates a species thermodynamic property
+       by interpolation in the table built by :mod:`thermo_tables`
+
+    Parameters
+    ----------
+    nicename : str
+        The variable name to use in generated code
+    loopy_opts : `loopy_options` object
+        A object containing all the loopy options to execute
+    namestore : :class:`array_creator.NameStore`
+        The namestore / creator for this method
+    test_size : int
+        If not None, this kernel is being used for testing.
+
+    Returns
+    -------
+    knl : :class:`knl_info`
+        The generated info for feeding into the kernel generator
+
+    """
+
+    loop_index = 'k'
+    # create mapper
+    mapstore = arc.MapStore(loopy_opts, namestore.num_specs, test_size, loop_index)
+
+    knl_data = []
+    # add problem size
+    knl_data.extend(arc.initial_condition_dimension_vars(loopy_opts, test_size))
+    # create the input/temperature arrays
+    T_lp, T_str = mapstore.apply_maps(namestore.T_arr, global_ind)
+    out_lp, out_str = mapstore.apply_maps(getattr(namestore, nicename),
+                                          global_ind, loop_index)
+    table_lp, table_insns, interpolant = _table_interpolant(
+        namestore, mapstore, nicename, loop_index)
+    knl_data.extend([table_lp, T_lp, out_lp])
+
+    # guard the temperature, as in the polynomial evaluation
+    guard = ic.TemperatureGuard(loopy_opts)
+    precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        knl_data)
+    preinstructs = [precompute('T', T_str, 'VAL', guard=guard)] + table_insns
+
+    instructions = Template("""
+        ${out_str} = ${interpolant}
+    """).safe_substitute(**locals())
+
+    return k_gen.knl_info(instructions=instructions,
+                          kernel_data=knl_data,
+                          pre_instructions=preinstructs,
+                          name='eval_{}'.format(nicename),
+                          var_name=loop_index,
+                          mapstore=mapstore,
+                          manglers=[precompute],
+                          # the table lookup varies between conditions
+                          silenced_warnings=['vectorize_failed'])
+
+
 def polyfit_kernel_gen(nicename, loopy_opts, namestore, test_size=None):
     """Helper function that generates kernels for
        evaluation of various thermodynamic species properties
@@ -3329,6 +3709,10 @@ def polyfit_kernel_gen(nicename, loopy_opts, namestore, test_size=None):
     if nicename in ['b', 'db'] and namestore.rev_map is None:
         return None
 
+    if nicename in namestore.thermo_tables:
+        return __get_tabulated_thermo(nicename, loopy_opts, namestore,
+                                      test_size=test_size)
+
     param_ind = 'dummy'
     loop_index = 'k'
     # create mapper
@@ -3458,6 +3842,8 @@ def polyfit_kernel_gen(nicename, loopy_opts, namestore, test_size=None):
     Tval = 'T'
     # create a precomputed instruction generator
     precompute = ic.PrecomputedInstructions(loopy_opts)
+    _share_T_invariants(loopy_opts, namestore, mapstore, T_str, precompute,
+                        knl_data)
     preinstructs = [precompute(Tval, T_str, 'VAL', guard=guard)]
     preinstructs.append(precompute('Tinv', T_str, 'INV', guard=guard))
     preinstructs.append(precompute('logT', T_str, 'LOG', guard=guard))
@@ -3525,6 +3911,12 @@ def write_chem_utils(reacs, specs, loopy_opts, conp=True,
     # generate the kernels
     output = ['cp', 'h', 'b'] if conp else ['cv', 'u', 'b']
     kernels = []
+    barriers = []
+    if loopy_opts.T_invariants:
+        kernels.append(get_temperature_invariants(loopy_opts, nstore,
+                                                  test_size=test_size))
+        if loopy_opts.depth:
+            barriers.append((0, 1, 'global'))
     for nicename in output:
         kernels.append(polyfit_kernel_gen(nicename, loopy_opts,
                                           nstore, test_size))
@@ -3534,6 +3926,7 @@ def write_chem_utils(reacs, specs, loopy_opts, conp=True,
         kernel_type=KernelType.chem_utils,
         kernels=kernels,
         namestore=nstore,
+        barriers=barriers,
         input_arrays=['phi'],
         output_arrays=output,
         auto_diff=auto_diff,
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""Module for tabulating the species thermodynamic properties and reaction
+equilibrium constants on a uniform temperature grid, for branch-free evaluation
+via piecewise cubic interpolation
+"""
+
+# Python 2 compatibility
+from __future__ import division
+
+# Standard libraries
+import logging
+
+# Non-standard librarys
+import numpy as np
+
+# Local imports
+from pyjac.core import chem_model as chem
+
+table_properties = ['cp', 'cv', 'h', 'u', 'b']
+"""The species thermodynamic properties that may be tabulated"""
+
+max_intervals = 2048
+"""The maximum number of temperature intervals in a table"""
+
+T_range = (100., 10000.)
+"""The temperature range covered by the tables, i.e., the bounds the kernels
+place on the temperature,
+@see :class:`pyjac.core.instruction_creator.TemperatureGuard`"""
+
+# the (local) points that define the cubic on each interval, and the matrix
+# converting the values at these points to the polynomial coefficients
+_nodes = np.linspace(0, 1, 4)
+_inv_vandermonde = np.linalg.inv(np.vander(_nodes, 4, increasing=True))
+# the (local) points at which the interpolant error is checked
+_checks = (np.arange(8) + 0.5) / 8
+
+
+def nasa7_property(nicename, a_lo, a_hi, T_mid, T, T_branch=None):
+    """
+    Evaluates the species thermodynamic property :param:`nicename` from the
+    7-coefficient NASA polynomials, identically to
+    :func:`pyjac.core.rate_subs.polyfit_kernel_gen`
+
+    Parameters
+    ----------
+    nicename: ['cp', 'cv', 'h', 'u', 'b']
+        The property to evaluate
+    a_lo: :class:`numpy.ndarray`
+        The low-temperature coefficients, of shape (Ns, 7)
+    a_hi: :class:`numpy.ndarray`
+        The high-temperature coefficients, of shape (Ns, 7)
+    T_mid: :class:`numpy.ndarray`
+        The species' midpoint temperatures, of shape (Ns,)
+    T: array_like of float
+        The temperature(s) to evaluate at
+    T_branch: array_like of float [None]
+        If supplied, the temperature(s) used to select the low / high
+        temperature polynomials, otherwise :param:`T`
+
+    Returns
+    -------
+    prop: :class:`numpy.ndarray`
+        The property, of shape (len(T), Ns)
+    """
+
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))[:, np.newaxis]
+    if T_branch is None:
+        T_branch = T
+    else:
+        T_branch = np.atleast_1d(np.asarray(
+            T_branch, dtype=np.float64))[:, np.newaxis]
+
+    def __eval(a):
+        a0, a1, a2, a3, a4, a5, a6 = a.T
+        if nicename in ['cp', 'cv']:
+            return chem.RU * (T * (T * (T * (T * a4 + a3) + a2) + a1) + a0 - (
+                1 if nicename == 'cv' else 0))
+        elif nicename in ['h', 'u']:
+            return chem.RU * (T * (T * (T * (T * (T * a4 / 5 + a3 / 4) + a2 / 3) +
+                                        a1 / 2) + a0) + a5 - (
+                T if nicename == 'u' else 0))
+        elif nicename == 'b':
+            return T * (T * (T * (T * a4 / 20 + a3 / 12) + a2 / 6) + a1 / 2) + \
+                (a0 - 1) * np.log(T) - a0 + a6 - a5 / T
+        raise ValueError('Unknown thermodynamic property: {}'.format(nicename))
+
+    return np.where(T_branch < T_mid, __eval(a_lo), __eval(a_hi))
+
+
+def fit_table(func, Tmin, Tmax, tol, relative=True, T_align=None,
+              max_intervals=max_intervals, scale_range=None):
+    """
+    Fits a table of piecewise cubic interpolants, on a uniform temperature grid
+    covering :param:`Tmin` to :param:`Tmax`, to the quantities evaluated by
+    :param:`func`.
+
+    The number of intervals is doubled until the error of the interpolant
+    (checked within each interval) satisfies :param:`tol`
+
+    Parameters
+    ----------
+    func: :class:`Callable`
+        Evaluates the tabulated quantities at an array of temperatures, returning
+        an array of shape (len(T), N).  Takes as a second arguement the
+        temperatures to use in selecting between piecewise definitions (if any),
+        such that each interval is fit to a single piece
+    Tmin: float
+        The lowest temperature of the table
+    Tmax: float
+        The highest temperature of the table
+    tol: float
+        The maximum allowed error of the interpolant
+    relative: bool [True]
+        If True, :param:`tol` is relative to the largest magnitude of each
+        quantity over the temperature range (or :param:`scale_range`),
+        otherwise it is an absolute error
+    T_align: float [None]
+        If supplied, a temperature that should lie on a grid point, e.g., a
+        discontinuity of the tabulated quantities
+    max_intervals: int [:data:`max_intervals`]
+        The largest number of intervals to try
+    scale_range: tuple of float [None]
+        If supplied, the (lowest, highest) temperatures over which the largest
+        magnitude of each quantity is taken for a :param:`relative` error,
+        otherwise the whole table
+
+    Returns
+    -------
+    table: :class:`numpy.ndarray`
+        The interpolant coefficients, of shape (N, num_intervals, 4).  For
+        temperature T, with x = (T - T0) * inv_dT, i = floor(x) and t = x - i,
+        quantity n is sum_j table[n, i, j] * t**j.  None if :param:`tol` cannot
+        be satisfied
+    T0: float
+        The lowest temperature of the grid
+    inv_dT: float
+        The inverse of the temperature interval width
+    """
+
+    num = 16
+    while num <= max_intervals:
+        dT = (Tmax - Tmin) / num
+        T0 = Tmin
+        if T_align is not None and Tmin < T_align < Tmax:
+            # narrow the intervals such that both the lowest temperature and
+            # the alignment temperature lie on the grid (rather than starting
+            # the grid below the lowest temperature, possibly at T <= 0)
+            dT = (T_align - Tmin) / np.ceil((T_align - Tmin) / dT - 1e-8)
+        count = int(np.ceil((Tmax - T0) / dT - 1e-8))
+        starts = T0 + dT * np.arange(count)[:, np.newaxis]
+
+        # values at the nodes of each interval: (count, 4, N)
+        mids = np.repeat(starts + dT / 2, _nodes.size, axis=1)
+        values = func((starts + dT * _nodes).flatten(), mids.flatten())
+        values = values.reshape((count, _nodes.size, -1))
+        table = np.einsum('jk,ikn->nij', _inv_vandermonde, values)
+
+        # and check the interpolant between the nodes
+        checks = (starts + dT * _checks).flatten()
+        exact = func(checks, checks).reshape((count, _checks.size, -1))
+        approx = np.einsum('nij,kj->ikn', table, np.vander(
+            _checks, 4, increasing=True))
+        scale = 1
+        if relative:
+            inside = np.ones(count, dtype=bool)
+            if scale_range is not None:
+                # the intervals overlapping the scale range
+                inside = (starts[:, 0] + dT > scale_range[0]) & (
+                    starts[:, 0] < scale_range[1])
+            scale = np.max(np.abs(values[inside]), axis=(0, 1))
+            scale[scale == 0] = 1
+        if np.max(np.abs(approx - exact) / scale) <= tol:
+            return table, T0, 1. / dT
+        num *= 2
+
+    return None, None, None
+
+
+def _aligned_temperature(rate_info):
+    """
+    Returns the most common species midpoint temperature, on which the table
+    grid points are aligned, such that (for the species with this midpoint) no
+    interval spans the discontinuity between the low and high temperature
+    polynomials
+    """
+    T_mid, counts = np.unique(rate_info['thermo']['T_mid'], return_counts=True)
+    return T_mid[np.argmax(counts)]
+
+
+def species_table(nicename, rate_info, tol, max_intervals=max_intervals):
+    """
+    Tabulates the species thermodynamic property :param:`nicename` over the
+    temperatures the kernels are evaluated at, :data:`T_range`, such that the
+    end intervals of the table are never extrapolated
+
+    Parameters
+    ----------
+    nicename: ['cp', 'cv', 'h', 'u', 'b']
+        The property to tabulate
+    rate_info: dict
+        The reaction / species information from
+        :func:`pyjac.core.rate_subs.assign_rates`
+    tol: float
+        The maximum allowed error of the interpolant, relative to the largest
+        magnitude of the property of each species between the mechanism's
+        minimum and maximum temperatures
+    max_intervals: int [:data:`max_intervals`]
+        The largest number of intervals to try
+
+    Returns
+    -------
+    table: :class:`numpy.ndarray`
+        The interpolant coefficients, @see :func:`fit_table`
+    T0: float
+        The lowest temperature of the grid
+    inv_dT: float
+        The inverse of the temperature interval width
+    """
+
+    thermo = rate_info['thermo']
+
+    def __func(T, T_branch):
+        return nasa7_property(nicename, thermo['a_lo'], thermo['a_hi'],
+                              thermo['T_mid'], T, T_branch)
+
+    return fit_table(__func, T_range[0], T_range[1], tol,
+                     T_align=_aligned_temperature(rate_info),
+                     max_intervals=max_intervals,
+                     scale_range=(rate_info['minT'], rate_info['maxT']))
+
+
+def equilibrium_table(rate_info, tol, max_intervals=max_intervals):
+    """
+    Tabulates the natural logarithm of the equilibrium constants of the
+    reversible reactions over the temperatures the kernels are evaluated at,
+    :data:`T_range`.  The logarithm is tabulated, as the equilibrium constants
+    may vary over many orders of magnitude
+
+    Parameters
+    ----------
+    rate_info: dict
+        The reaction / species information from
+        :func:`pyjac.core.rate_subs.assign_rates`
+    tol: float
+        The maximum allowed (absolute) error of the interpolated logarithm,
+        i.e., approximately the relative error of the equilibrium constants
+    max_intervals: int [:data:`max_intervals`]
+        The largest number of intervals to try
+
+    Returns
+    -------
+    table: :class:`numpy.ndarray`
+        The interpolant coefficients, @see :func:`fit_table`
+    T0: float
+        The lowest temperature of the grid
+    inv_dT: float
+        The inverse of the temperature interval width
+    """
+
+    thermo = rate_info['thermo']
+    net = rate_info['net']
+    rev_map = rate_info['rev']['map']
+
+    # the net stoichiometric coefficients of the reversible reactions
+    offsets = np.cumsum(np.concatenate(([0], net['num_reac_to_spec'])))
+    nu = np.zeros((rate_info['Nr'], rate_info['Ns']))
+    for i in range(rate_info['Nr']):
+        for j in range(offsets[i], offsets[i + 1]):
+            nu[i, net['reac_to_spec'][j]] += net['nu'][2 * j] - net['nu'][2 * j + 1]
+    nu = nu[rev_map]
+    P_sum = np.asarray(net['nu_sum'])[rev_map] * np.log(chem.PA / chem.RU)
+
+    def __func(T, T_branch):
+        B = nasa7_property('b', thermo['a_lo'], thermo['a_hi'], thermo['T_mid'],
+                           T, T_branch)
+        return np.dot(B, nu.T) + P_sum
+
+    return fit_table(__func, T_range[0], T_range[1], tol, relative=False,
+                     T_align=_aligned_temperature(rate_info),
+                     max_intervals=max_intervals)
+
+
+def get_tables(rate_info, tol, max_intervals=max_intervals):
+    """
+    Tabulates the species thermodynamic properties (:data:`table_properties`)
+    and the equilibrium constants ('Kc') that can be represented to within the
+    supplied tolerance
+
+    Parameters
+    ----------
+    rate_info: dict
+        The reaction / species information from
+        :func:`pyjac.core.rate_subs.assign_rates`
+    tol: float
+        The maximum allowed error of the interpolants,
+        @see :func:`species_table` and :func:`equilibrium_table`
+    max_intervals: int [:data:`max_intervals`]
+        The largest number of intervals to try
+
+    Returns
+    -------
+    tables: dict
+        For each tabulated quantity, a tuple of the interpolant coefficients,
+        the lowest temperature of the grid and the inverse interval width.
+        Quantities that cannot meet the tolerance (or use NASA-9 polynomials)
+        are omitted, and should be evaluated as usual
+    """
+
+    logger = logging.getLogger(__name__)
+    if rate_info['thermo']['a_lo'].ndim != 2:
+        logger.warn('Tabulation of NASA-9 thermodynamic polynomials is not '
+                    'supported, using the polynomial evaluation.')
+        return {}
+
+    fits = {}
+    for nicename in table_properties:
+        fits[nicename] = species_table(nicename, rate_info, tol,
+                                       max_intervals=max_intervals)
+    if rate_info['rev']['num']:
+        fits['Kc'] = equilibrium_table(rate_info, tol,
+                                       max_intervals=max_intervals)
+
+    tables = {}
+    for name in sorted(fits):
+        table, T0, inv_dT = fits[name]
+        if table is None:
+            logger.warn('Could not tabulate {} to within a tolerance of {} using '
+                        '{} intervals, using the polynomial evaluation.'.format(
+                            name, tol, max_intervals))
+            continue
+        logger.info('Tabulated {} using {} intervals.'.format(
+            name, table.shape[1]))
+        tables[name] = (table, T0, inv_dT)
+
+    return tables
@@ -105,6 +105,7 @@ def mass_to_mole_factions(loopy_opts, namestore, conp=True, test_size=None):
                                pre_instructions=[pre_instructions],
                                instructions=instructions,
                                post_instructions=[post_instructions],
+                               chunkable=False,
                                mapstore=mapstore,
                                var_name=var_name,
                                kernel_data=kernel_data,
@@ -7,6 +7,7 @@
 from __future__ import print_function
 
 # Standard libraries
+import os
 import sys
 import itertools
 from argparse import ArgumentParser
@@ -380,6 +381,83 @@ def react(self, dt):
         netw.advance(netw.time + dt)
 
 
+class ParticleArray(object):
+    """Class for array-backed (structure-of-arrays) storage of all particles.
+
+    The thermochemical compositions (enthalpy + mass fractions) of all
+    particles are stored in a single ``(N, Ns + 1)`` array, such that mixing,
+    inflow and pairing may be performed as vectorized array operations.
+    """
+
+    def __init__(self, gas, num_part):
+        """Initialize all particles with the thermochemical state of `gas`.
+
+        Parameters
+        ----------
+        gas : `cantera.Solution`
+            Initial thermochemical state of all particles. This object is
+            (re)used to evaluate particle properties, e.g., during reaction.
+        num_part : int
+            Number of particles.
+
+        Returns
+        -------
+        None
+
+        """
+        self.gas = gas
+        self.P = gas.P
+        self.comp = np.tile(np.hstack((gas.enthalpy_mass, gas.Y)), (num_part, 1))
+        self.T = np.full(num_part, gas.T)
+
+    def __len__(self):
+        return self.comp.shape[0]
+
+    def permute(self, order):
+        """Reorder particles such that particle `i` takes the state of `order[i]`.
+
+        Parameters
+        ----------
+        order : numpy.array
+            Array of particle indices.
+
+        Returns
+        -------
+        None
+
+        """
+        self.comp = self.comp[order]
+        self.T = self.T[order]
+
+    def react(self, dt, pool=None):
+        """Perform reaction timestep for all particles.
+
+        Parameters
+        ----------
+        dt : float
+            Reaction timestep [seconds]
+        pool : Optional[`ReactionPool` or `PyJacReactionBackend`]
+            If supplied, the pool of workers / pyJac backend to react the
+            particles with.
+
+        Returns
+        -------
+        None
+
+        """
+        if pool is not None:
+            self.T[:] = pool.react(self.comp, self.P, dt)
+            return
+
+        gas = self.gas
+        for i in range(len(self)):
+            gas.HPY = self.comp[i, 0], self.P, self.comp[i, 1:]
+            Particle(gas).react(dt)
+            self.comp[i, 0] = gas.enthalpy_mass
+            self.comp[i, 1:] = gas.Y
+            self.T[i] = gas.T
+
+
 def equivalence_ratio(gas, eq_ratio, fuel, oxidizer, complete_products):
     """Calculate the mixture mole fractions from the equivalence ratio.
 
@@ -576,29 +654,486 @@ def mix_substep(particles, dt, tau_mix):
         particles[particles.index(p2)](comp2)
 
 
-def reaction_worker(part_tup):
-    """Worker for performing reaction substep given initial state.
+def mix_substep_array(particles, dt, tau_mix):
+    """Pairwise mixing step for array-backed particles.
+
+    Vectorized equivalent of :func:`mix_substep`.
 
     Parameters
     ----------
-    part_tup : tuple
-        Tuple with mechanism file, temperature, pressure, mass fractions, and time step.
+    particles : `ParticleArray`
+        Array of all particles.
+    dt : float
+        Time step [s] to increment particles.
+    tau_mix : float
+        Mixing timescale [s].
 
     Returns
     -------
-    p : `numpy.array`
-        Thermochemical composition of particle following reaction.
+    None
 
     """
-    mech, T, P, Y, dt = part_tup
-    gas = ct.Solution(mech)
-    gas.TPY = T,P,Y
+
+    decay = 0.5 * (1.0 - np.exp(-2.0 * dt / tau_mix))
+    num_paired = 2 * (len(particles) // 2)
+    p1 = particles.comp[0:num_paired:2]
+    p2 = particles.comp[1:num_paired:2]
+    delt = (p1 - p2) * decay
+    p1 -= delt
+    p2 += delt
+
+
+# Per-process state of the reaction workers
+_worker_gas = None
+_worker_comp = None
+_worker_temp = None
+
+
+def _init_reaction_worker(mech, comp, temp, shape):
+    """Initialize a reaction worker, parsing the mechanism once per process.
+
+    Parameters
+    ----------
+    mech : str
+        Mechanism filename.
+    comp : `multiprocessing.RawArray`
+        Shared array of particle compositions (enthalpy + mass fractions).
+    temp : `multiprocessing.RawArray`
+        Shared array of particle temperatures.
+    shape : tuple of int
+        Shape of the composition array.
+
+    Returns
+    -------
+    None
+
+    """
+    global _worker_gas, _worker_comp, _worker_temp
+    _worker_gas = ct.Solution(mech)
+    _worker_comp = np.frombuffer(comp, dtype=np.float64).reshape(shape)
+    _worker_temp = np.frombuffer(temp, dtype=np.float64)
+
+
+def reaction_worker(chunk):
+    """Worker for performing reaction substep on a contiguous chunk of particles.
+
+    The particle states are read from, and written back to, the shared
+    composition / temperature arrays.
+
+    Parameters
+    ----------
+    chunk : tuple
+        Tuple with start and end particle indices, pressure, and time step.
+
+    Returns
+    -------
+    None
+
+    """
+    start, end, P, dt = chunk
+    gas = _worker_gas
     p = Particle(gas)
-    p.react(dt)
-    return p()
+    for i in range(start, end):
+        gas.HPY = _worker_comp[i, 0], P, _worker_comp[i, 1:]
+        p.react(dt)
+        _worker_comp[i, 0] = gas.enthalpy_mass
+        _worker_comp[i, 1:] = gas.Y
+        _worker_temp[i] = gas.T
+
+
+class ReactionPool(object):
+    """Persistent pool of workers for the reaction substep.
+
+    Each worker loads the mechanism once, and particle states are exchanged
+    through shared memory in contiguous chunks.
+    """
+
+    def __init__(self, mech, num_part, num_comp, processes=None):
+        """Start the pool of workers.
+
+        Parameters
+        ----------
+        mech : str
+            Mechanism filename.
+        num_part : int
+            Number of particles.
+        num_comp : int
+            Size of particle composition (enthalpy + mass fractions).
+        processes : Optional[int]
+            Number of worker processes. Optional, default number of CPUs.
+
+        Returns
+        -------
+        None
+
+        """
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        self.processes = processes
+        shape = (num_part, num_comp)
+        shared_comp = multiprocessing.RawArray('d', num_part * num_comp)
+        shared_temp = multiprocessing.RawArray('d', num_part)
+        self.comp = np.frombuffer(shared_comp, dtype=np.float64).reshape(shape)
+        self.temp = np.frombuffer(shared_temp, dtype=np.float64)
+        self.pool = multiprocessing.Pool(
+            processes, initializer=_init_reaction_worker,
+            initargs=(mech, shared_comp, shared_temp, shape))
+
+    def react(self, comp, P, dt):
+        """Advance the particle states through reactions.
+
+        Parameters
+        ----------
+        comp : numpy.array
+            Particle compositions (enthalpy + mass fractions), updated in place.
+        P : float
+            Pressure [Pa].
+        dt : float
+            Time step [s] to increment particles.
+
+        Returns
+        -------
+        T : numpy.array
+            Particle temperatures following reaction.
+
+        """
+        num_part = comp.shape[0]
+        self.comp[:num_part] = comp
+        # a few chunks per worker for load balancing
+        chunk_size = max(1, -(-num_part // (4 * self.processes)))
+        chunks = [(start, min(start + chunk_size, num_part), P, dt)
+                  for start in range(0, num_part, chunk_size)]
+        self.pool.map(reaction_worker, chunks)
+        comp[:] = self.comp[:num_part]
+        return self.temp[:num_part].copy()
+
+    def close(self):
+        """Shut down the pool of workers.
+        """
+        self.pool.close()
+        self.pool.join()
+
+
+def load_pyjac_module(path, lang='c'):
+    """Load a `pywrap`-built pyJac module from the given directory.
+
+    The species rates and Jacobian wrappers share the same module name, hence
+    the module is loaded directly from `path` rather than via `sys.path`.
+
+    Parameters
+    ----------
+    path : str
+        Directory containing the compiled pyJac module.
+    lang : Optional[str]
+        Language of the wrapped pyJac kernel. Optional, default 'c'.
+
+    Returns
+    -------
+    module : module
+        The loaded pyJac module.
+
+    """
+    from pyjac import utils
+    name = 'pyjac_{}'.format(utils.package_lang[lang])
+    try:
+        from importlib.machinery import PathFinder
+        from importlib.util import module_from_spec
+    except ImportError:
+        # Python 2
+        import imp
+        return imp.load_module(name, *imp.find_module(name, [path]))
+
+    spec = PathFinder.find_spec(name, [path])
+    if spec is None:
+        raise ImportError('pyJac module {} not found in {}'.format(name, path))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_pyjac_modules(gas, build_dir, lang='c'):
+    """Generate and build the pyJac species rates and (full) Jacobian modules
+    for the constant pressure system of the given mechanism.
+
+    Parameters
+    ----------
+    gas : `cantera.Solution`
+        The mechanism to generate pyJac kernels for.
+    build_dir : str
+        Directory to generate / compile the pyJac modules in.
+    lang : Optional[str]
+        Language to generate the pyJac kernels in. Optional, default 'c'.
+
+    Returns
+    -------
+    rates : module
+        The species rates module.
+    jacobian : module
+        The Jacobian module.
+
+    """
+    from pyjac import utils
+    from pyjac.core.create_jacobian import create_jacobian
+    from pyjac.core.enum_types import KernelType, JacobianFormat
+    from pyjac.pywrap import pywrap
+
+    modules = []
+    for ktype in [KernelType.species_rates, KernelType.jacobian]:
+        path = os.path.abspath(os.path.join(build_dir, utils.enum_to_string(ktype)))
+        src = os.path.join(path, 'src')
+        obj = os.path.join(path, 'obj')
+        utils.create_dir(src)
+        utils.create_dir(obj)
+        create_jacobian(lang, gas=gas, build_path=src, kernel_type=ktype,
+                        data_order='C', conp=True,
+                        jac_format=JacobianFormat.full)
+        pywrap(lang, src, build_dir=obj, obj_dir=obj, out_dir=path, ktype=ktype)
+        modules.append(load_pyjac_module(path, lang))
+    return tuple(modules)
+
+
+class PyJacReactionBackend(object):
+    """Reaction substep backend using pyJac-generated kernels.
+
+    The species rates and Jacobian of all particles are each evaluated in a
+    single kernel call, and used to drive a batched, adaptive second-order
+    Rosenbrock (ROS2) integrator across the whole particle population.
+    The kernels must be generated for the constant pressure system, in "C"
+    data ordering with a full (dense) Jacobian, e.g., via
+    :func:`build_pyjac_modules`.
+    """
+
+    gamma = 1. + 1. / np.sqrt(2.)
+
+    def __init__(self, gas, rates, jacobian, num_part, num_threads=1,
+                 rtol=1e-6, atol=1e-15, max_steps=100000):
+        """Create the pyJac kernels for the particle population.
+
+        Parameters
+        ----------
+        gas : `cantera.Solution`
+            The mechanism the pyJac kernels were generated for.
+        rates : module
+            The `pywrap`-built pyJac species rates module.
+        jacobian : module
+            The `pywrap`-built pyJac Jacobian module.
+        num_part : int
+            Number of particles.
+        num_threads : Optional[int]
+            Number of threads / work-groups used by the kernels. \
+            Optional, default 1.
+        rtol : Optional[float]
+            Relative integration tolerance. Optional, default 1e-6.
+        atol : Optional[float]
+            Absolute integration tolerance [kmol]. Optional, default 1e-15.
+        max_steps : Optional[int]
+            Maximum number of integration steps per reaction substep. \
+            Optional, default 100000.
+
+        Returns
+        -------
+        None
+
+        """
+        from pyjac.core.mech_interpret import read_mech_ct
+        from pyjac.core import chem_model as chem
+        self.chem = chem
+
+        self.rates = rates.PySpecies_RatesKernel(num_part, num_threads)
+        self.jac = jacobian.PyJacobianKernel(num_part, num_threads)
+        _, specs, _ = read_mech_ct(gas=gas)
+
+        # map from the kernel's species order to the cantera species order
+        names = self.rates.species_names()
+        self.spec_map = np.array([gas.species_index(x) for x in names])
+        self.specs = [specs[i] for i in self.spec_map]
+        self.mw = np.array([sp.mw for sp in self.specs])
+
+        self.num_part = num_part
+        self.num_spec = len(names)
+        self.rtol = rtol
+        self.atol = atol
+        self.max_steps = max_steps
+
+        # per-particle state
+        self.T = np.full(num_part, gas.T)
+        self.h = None
+
+    def __call_rates(self, P, phi):
+        dphi = np.zeros_like(phi)
+        self.rates(P, phi.ravel(), dphi.reshape(-1))
+        return dphi
+
+    def __call_jac(self, P, phi):
+        jac = np.zeros((self.num_part, self.num_spec + 1, self.num_spec + 1))
+        self.jac(P, phi.ravel(), jac.reshape(-1))
+        return jac
+
+    def __temperature(self, h, Y):
+        """Solve for the temperature of the particles from their enthalpy."""
+        chem = self.chem
+        T = self.T.copy()
+        Y = Y / self.mw
+        for i in range(50):
+            dT = (np.sum(Y * chem.calc_spec_h(T, self.specs), axis=1) - h) / \
+                np.sum(Y * chem.calc_spec_cp(T, self.specs), axis=1)
+            T -= dT
+            if np.all(np.abs(dT) < 1e-8 * T):
+                break
+        return T
+
+    def to_state(self, comp, P):
+        """Convert particle compositions to the pyJac state vector.
+
+        Parameters
+        ----------
+        comp : numpy.array
+            Particle compositions (enthalpy + mass fractions).
+        P : float
+            Pressure [Pa].
+
+        Returns
+        -------
+        phi : numpy.array
+            The (constant pressure) pyJac state vectors of the particles,
+            i.e., temperature, volume and moles of all but the last species.
+
+        """
+        Y = comp[:, 1:][:, self.spec_map]
+        T = self.__temperature(comp[:, 0], Y)
+        n = Particle.particle_mass * Y / self.mw
+        phi = np.empty((comp.shape[0], self.num_spec + 1))
+        phi[:, 0] = T
+        phi[:, 1] = np.sum(n, axis=1) * self.chem.RU * T / P
+        phi[:, 2:] = n[:, :-1]
+        return phi
+
+    def from_state(self, phi, P, comp):
+        """Convert pyJac state vectors to particle compositions.
+
+        Parameters
+        ----------
+        phi : numpy.array
+            The (constant pressure) pyJac state vectors of the particles.
+        P : float
+            Pressure [Pa].
+        comp : numpy.array
+            Particle compositions (enthalpy + mass fractions), updated in place.
+
+        Returns
+        -------
+        None
+
+        """
+        T = phi[:, 0]
+        n = np.empty((phi.shape[0], self.num_spec))
+        n[:, :-1] = phi[:, 2:]
+        n[:, -1] = P * phi[:, 1] / (self.chem.RU * T) - np.sum(phi[:, 2:], axis=1)
+        Y = n * self.mw
+        Y /= np.sum(Y, axis=1)[:, np.newaxis]
+        comp[:, 0] = np.sum(Y / self.mw * self.chem.calc_spec_h(T, self.specs),
+                            axis=1)
+        comp[:, 1 + self.spec_map] = Y
+
+    def react(self, comp, P, dt):
+        """Advance the particle states through reactions.
+
+        Parameters
+        ----------
+        comp : numpy.array
+            Particle compositions (enthalpy + mass fractions), updated in place.
+        P : float
+            Pressure [Pa].
+        dt : float
+            Time step [s] to increment particles.
+
+        Returns
+        -------
+        T : numpy.array
+            Particle temperatures following reaction.
+
+        """
+        assert comp.shape[0] == self.num_part
+        y = self.integrate(self.to_state(comp, P), P, dt)
+        self.from_state(y, P, comp)
+        self.T = y[:, 0].copy()
+        return self.T.copy()
+
+    def integrate(self, y, P, dt):
+        """Integrate the pyJac state vectors of all particles over a time step.
+
+        Parameters
+        ----------
+        y : numpy.array
+            The (constant pressure) pyJac state vectors of the particles.
+        P : float
+            Pressure [Pa].
+        dt : float
+            Time step [s] to integrate over.
+
+        Returns
+        -------
+        y : numpy.array
+            The state vectors at the end of the time step.
+
+        """
+        y = y.copy()
+        P_arr = np.full(self.num_part, P)
+        ident = np.eye(self.num_spec + 1)
+        t = np.zeros(self.num_part)
+        if self.h is None:
+            self.h = np.full(self.num_part, dt)
+        h = np.minimum(self.h, dt)
+
+        def __solve(A, b):
+            return np.linalg.solve(A, b[:, :, np.newaxis])[:, :, 0]
+
+        for step in range(self.max_steps):
+            active = np.where(t < dt * (1 - 1e-12))[0]
+            if not active.size:
+                break
+            h[active] = np.minimum(h[active], dt - t[active])
+            ha = h[active][:, np.newaxis]
+
+            # one species rate / Jacobian evaluation per stage for all particles
+            f0 = self.__call_rates(P_arr, y)[active]
+            J = self.__call_jac(P_arr, y)[active]
+            A = ident - (self.gamma * ha)[:, :, np.newaxis] * J
+            k1 = __solve(A, f0)
+            y1 = y.copy()
+            y1[active] += ha * k1
+            f1 = self.__call_rates(P_arr, y1)[active]
+            k2 = __solve(A, f1 - 2 * k1)
+            y_new = y[active] + ha * (1.5 * k1 + 0.5 * k2)
+
+            # error estimate from the embedded first order solution
+            scale = self.atol + self.rtol * np.maximum(
+                np.abs(y[active]), np.abs(y_new))
+            err = np.sqrt(np.mean(
+                (0.5 * ha * (k1 + k2) / scale)**2, axis=1))
+            err[~np.isfinite(err)] = np.inf
+
+            accept = err <= 1
+            y[active[accept]] = y_new[accept]
+            t[active[accept]] += h[active[accept]]
+            with np.errstate(divide='ignore'):
+                fac = np.clip(0.9 / np.sqrt(err), 0.2, 5.)
+            h[active] *= fac
+        else:
+            raise RuntimeError('Maximum number of integration steps ({}) '
+                               'exceeded in reaction substep'.format(
+                                    self.max_steps))
 
+        self.h = h
+        return y
 
-def reaction_substep(particles, dt, mech):
+    def close(self):
+        """No-op, provided for compatibility with :class:`ReactionPool`.
+        """
+        pass
+
+
+def reaction_substep(particles, dt, mech, pool=None):
     """Advance each of the particles in time through reactions.
 
     Parameters
@@ -609,31 +1144,25 @@ def reaction_substep(particles, dt, mech):
         Time step [s] to increment particles.
     mech : str
         Mechanism filename.
+    pool : Optional[`ReactionPool` or `PyJacReactionBackend`]
+        If supplied, the pool of workers / pyJac backend to react the
+        particles with.
 
     Returns
     -------
     None
 
     """
-    if not parallel:
+    if pool is None:
         for p in particles:
             p.react(dt)
     else:
-        pool = multiprocessing.Pool()
-        jobs = []
-
-        #set up a new particle runner for each
-        for p in particles:
-            jobs.append([mech, p.gas.T, p.gas.P, p.gas.Y, dt])
-        jobs = tuple(jobs)
-        results = pool.map(reaction_worker, jobs)
-
-        pool.close()
-        pool.join()
+        comp = np.array([p() for p in particles])
+        pool.react(comp, particles[0].gas.P, dt)
         #and finally update the states of our particles on the main
         #thread
         for i, p in enumerate(particles):
-            p(comp=results[i])
+            p(comp=comp[i])
 
 
 def select_pairs(particles, num_pairs, num_skip=0):
@@ -675,6 +1204,48 @@ def select_pairs(particles, num_pairs, num_skip=0):
         particles[i_last + 1](temp_comp)
 
 
+def select_pairs_array(particles, num_pairs, num_skip=0):
+    """Randomly select pair(s) of array-backed particles and move to end.
+
+    Equivalent to :func:`select_pairs` (including the sequence of random
+    numbers drawn); the random swaps are first applied to an array of particle
+    indices, and the particle states are then reordered in a single gather.
+
+    Parameters
+    ----------
+    particles : `ParticleArray`
+        Array of all particles.
+    num_pairs : int
+        Number of pairs to be selected and moved.
+    num_skip : Optional[int]
+        Number of pairs at end of list to be skipped. Optional, default 0.
+
+    Returns
+    -------
+    None
+
+    """
+
+    if not num_pairs:
+        return
+
+    order = np.arange(len(particles))
+    for i_pair in range(num_pairs):
+        i = 2 * np.random.randint((len(particles) // 2) - i_pair - num_skip)
+        j = i + 1
+
+        # Commute particles at random
+        if np.random.random() > 0.5:
+            order[[i, j]] = order[[j, i]]
+
+        # Swap with pair at end of list
+        i_last = -2 * (i_pair + num_skip + 1)
+        order[[i, i_last]] = order[[i_last, i]]
+        order[[j, i_last + 1]] = order[[i_last + 1, j]]
+
+    particles.permute(order)
+
+
 def inflow(streams):
     """Determine index of stream for next inflowing particle.
 
@@ -742,10 +1313,235 @@ def save_data(idx, time, particles, data):
         data[idx, i, 3:] = mass_frac
 
 
+def save_data_array(idx, time, particles, data):
+    """Save temperature and species mass fraction from array-backed particles.
+
+    Vectorized equivalent of :func:`save_data`.
+
+    Parameters
+    ----------
+    idx : int
+        Index of timestep.
+    time : float
+        Current time [s].
+    particles : `ParticleArray`
+        Array of all particles.
+    data : `numpy.ndarray`
+        ndarray of particle data for all timesteps.
+
+    Returns
+    -------
+    None
+
+    """
+    data[idx, :, 0] = time
+    data[idx, :, 1] = particles.T
+    data[idx, :, 2] = particles.P
+    # Zero out any negative mass fractions
+    data[idx, :, 3:] = np.maximum(particles.comp[:, 1:], 0.0)
+
+
+def get_conditions(particles):
+    """Return the particle states in the layout of the pyJac condition database.
+
+    Each row contains the temperature [K], pressure [Pa] and species
+    concentrations [kmol/m^3] of one particle, such that (with a unit volume)
+    the rows may be directly read by `data_bin_writer` / the generated
+    `read_initial_conditions`.
+
+    Parameters
+    ----------
+    particles : list of `Particle` or `ParticleArray`
+        The particles.
+
+    Returns
+    -------
+    conditions : numpy.array
+        Array of shape (N, Ns + 2) of particle states.
+
+    """
+    if isinstance(particles, ParticleArray):
+        gas = particles.gas
+        # Zero out any negative mass fractions
+        Y = np.maximum(particles.comp[:, 1:], 0.0)
+        Y /= np.sum(Y, axis=1)[:, np.newaxis]
+        mw = gas.molecular_weights
+        rho = particles.P / (ct.gas_constant * particles.T * np.sum(Y / mw, axis=1))
+        return np.hstack((particles.T[:, np.newaxis],
+                          np.full((len(particles), 1), particles.P),
+                          rho[:, np.newaxis] * Y / mw))
+
+    conditions = np.empty((len(particles), particles[0].gas.n_species + 2))
+    for i, p in enumerate(particles):
+        conditions[i, 0] = p.gas.T
+        conditions[i, 1] = p.gas.P
+        conditions[i, 2:] = np.maximum(p.gas.concentrations, 0.0)
+    return conditions
+
+
+class ConditionWriter(object):
+    """Streams particle states to disk as the simulation progresses.
+
+    The states of each step (see :func:`get_conditions`) are appended to either
+    a chunked, compressed HDF5 dataset (for a '.h5' / '.hdf5' `filename`) or a
+    growable '.npy' file, which may be memory-mapped via
+    ``np.load(filename, mmap_mode='r')``.  Checkpoints of the simulation state
+    are stored alongside (in `filename` + '.ckpt.npz') such that interrupted
+    runs may be resumed.
+    """
+
+    # fixed size of the '.npy' header, such that it may be rewritten in place
+    # as the file grows
+    npy_header_size = 128
+
+    def __init__(self, filename, num_cols, resume=False):
+        """Open the output file.
+
+        Parameters
+        ----------
+        filename : str
+            Output filename.
+        num_cols : int
+            Number of columns of each particle state.
+        resume : Optional[bool]
+            If ``True`` and a checkpoint exists, keep the data written up to the
+            last checkpoint (see :meth:`load_checkpoint`), otherwise the output
+            file is overwritten. Optional, default ``False``.
+
+        Returns
+        -------
+        None
+
+        """
+        self.filename = filename
+        self.checkpoint_file = filename + '.ckpt.npz'
+        self.num_cols = num_cols
+        self.hdf5 = filename.endswith(('.h5', '.hdf5'))
+        self.rows = 0
+
+        resume = resume and os.path.isfile(self.checkpoint_file) and \
+            os.path.isfile(filename)
+        if self.hdf5:
+            try:
+                import tables
+            except ImportError:
+                print('Error: PyTables must be installed for HDF5 output.')
+                raise
+            if resume:
+                self.file = tables.open_file(filename, mode='a')
+                self.data = self.file.root.conditions
+            else:
+                self.file = tables.open_file(filename, mode='w')
+                self.data = self.file.create_earray(
+                    self.file.root, 'conditions', tables.Float64Atom(),
+                    shape=(0, num_cols),
+                    filters=tables.Filters(complevel=5, complib='blosc'),
+                    chunkshape=(max(1, 2**16 // num_cols), num_cols))
+        else:
+            self.file = open(filename, 'r+b' if resume else 'w+b')
+            if not resume:
+                self.__write_header()
+        if not resume and os.path.isfile(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+    def __write_header(self):
+        header = "{{'descr': '<f8', 'fortran_order': False, 'shape': ({}, {}), }}"
+        header = header.format(self.rows, self.num_cols)
+        # magic string + version + header length
+        preamble = b'\x93NUMPY\x01\x00' + np.array(
+            [self.npy_header_size - 10], dtype='<u2').tobytes()
+        header = header.ljust(self.npy_header_size - 10 - 1) + '\n'
+        self.file.seek(0)
+        self.file.write(preamble + header.encode('latin1'))
+
+    def append(self, conditions):
+        """Append the particle states of a step to the output.
+
+        Parameters
+        ----------
+        conditions : numpy.array
+            Array of particle states of shape (N, num_cols).
+
+        Returns
+        -------
+        None
+
+        """
+        conditions = np.ascontiguousarray(conditions, dtype='<f8')
+        assert conditions.shape[1] == self.num_cols
+        if self.hdf5:
+            self.data.append(conditions)
+        else:
+            self.file.seek(self.npy_header_size + 8 * self.rows * self.num_cols)
+            self.file.write(conditions.tobytes())
+        self.rows += conditions.shape[0]
+
+    def flush(self):
+        """Write all buffered data (and the current '.npy' header) to disk.
+        """
+        if self.hdf5:
+            self.file.flush()
+        else:
+            self.__write_header()
+            self.file.flush()
+
+    def checkpoint(self, state):
+        """Flush the output and store a checkpoint of the simulation state.
+
+        Parameters
+        ----------
+        state : dict
+            Dictionary of arrays / values describing the simulation state.
+
+        Returns
+        -------
+        None
+
+        """
+        self.flush()
+        # write to a temporary file, and move into place such that a valid
+        # checkpoint exists at all times
+        tmp = self.checkpoint_file + '.tmp.npz'
+        np.savez(tmp, rows=self.rows, **state)
+        os.rename(tmp, self.checkpoint_file)
+
+    def load_checkpoint(self):
+        """Load the last checkpoint of the simulation state, and discard any
+        data written after it.
+
+        Returns
+        -------
+        state : dict or None
+            Dictionary of the stored simulation state, or ``None`` if no
+            checkpoint exists.
+
+        """
+        if not os.path.isfile(self.checkpoint_file):
+            return None
+        with np.load(self.checkpoint_file) as ckpt:
+            state = dict((key, ckpt[key]) for key in ckpt.files)
+        self.rows = int(state.pop('rows'))
+        if self.hdf5:
+            self.data.truncate(self.rows)
+        else:
+            self.file.truncate(self.npy_header_size + 8 * self.rows * self.num_cols)
+            self.__write_header()
+        return state
+
+    def close(self):
+        """Flush and close the output file.
+        """
+        self.flush()
+        self.file.close()
+
+
 def run_simulation(mech, case, init_temp, pres, eq_ratio, fuel, oxidizer,
                    complete_products=['CO2','H2O','N2'],
                    num_part=100, tau_res=(10./1000.), tau_mix=(1./1000.),
-                   tau_pair=(1./1000.), num_res=10
+                   tau_pair=(1./1000.), num_res=10, vectorized=False,
+                   num_proc=None, backend='cantera', build_dir='pyjac_build',
+                   num_threads=1, output=None, resume=False,
+                   checkpoint_interval=10
                    ):
     """Perform partially stirred reactor (PaSR) simulation.
 
@@ -780,11 +1576,39 @@ def run_simulation(mech, case, init_temp, pres, eq_ratio, fuel, oxidizer,
         Pairing timescale [s]. Optional, default 1 [ms].
     num_res : Optional[int]
         Numer of residence times to simulate. Optional, default 5.
+    vectorized : Optional[bool]
+        If ``True``, store all particles in a `ParticleArray` and perform
+        mixing, inflow and pairing as vectorized array operations. \
+        Optional, default ``False``.
+    num_proc : Optional[int]
+        Number of worker processes for the reaction substep. \
+        Optional, default number of CPUs.
+    backend : Optional[{'cantera', 'pyjac'}]
+        The reaction substep backend; either a Cantera `ReactorNet` per particle,
+        or a pyJac-generated kernel with a batched integrator (see
+        :class:`PyJacReactionBackend`). Optional, default 'cantera'.
+    build_dir : Optional[str]
+        Directory in which to generate / build the pyJac modules for the
+        'pyjac' backend. Optional, default 'pyjac_build'.
+    num_threads : Optional[int]
+        Number of threads used by the pyJac kernels for the 'pyjac' backend. \
+        Optional, default 1.
+    output : Optional[str]
+        If supplied, stream the particle states of each step to this file
+        (see :class:`ConditionWriter`) rather than accumulating them in memory.
+        Optional, default ``None``.
+    resume : Optional[bool]
+        If ``True``, resume the simulation from the last checkpoint stored
+        with the `output`. Optional, default ``False``.
+    checkpoint_interval : Optional[int]
+        Number of steps between checkpoints of streamed simulations. \
+        Optional, default 10.
 
     Returns
     -------
     particle_data : numpy.array
-        numpy.array with full particle data.
+        numpy.array with full particle data, or ``None`` if streamed to
+        `output`.
 
     """
 
@@ -854,31 +1678,101 @@ def run_simulation(mech, case, init_temp, pres, eq_ratio, fuel, oxidizer,
     inlet_streams.append(pilot_stream)
 
     # Initialize all particles with pilot composition
-    particles = []
-    for i in range(num_part):
-        g = ct.Solution(mech)
-        g.TPX = gas.T, gas.P, gas.X
-        particles.append(Particle(g))
-
-    # Random seed
-    np.random.seed()
+    if vectorized:
+        particles = ParticleArray(gas, num_part)
+        select, mix, save = select_pairs_array, mix_substep_array, save_data_array
+    else:
+        particles = []
+        for i in range(num_part):
+            g = ct.Solution(mech)
+            g.TPX = gas.T, gas.P, gas.X
+            particles.append(Particle(g))
+        select, mix, save = select_pairs, mix_substep, save_data
+
+    # Persistent pool of reaction workers
+    pool = None
+    if backend == 'pyjac':
+        rates, jacobian = build_pyjac_modules(gas, build_dir)
+        pool = PyJacReactionBackend(gas, rates, jacobian, num_part, num_threads)
+    elif parallel and num_proc != 1:
+        pool = ReactionPool(mech, num_part, gas.n_species + 1, num_proc)
+
+    def mean_temperature():
+        if vectorized:
+            return np.mean(particles.T)
+        return np.mean([p.gas.T for p in particles])
+
+    # Output of particle data
+    writer = None
+    particle_data = None
+    if output is not None:
+        writer = ConditionWriter(output, gas.n_species + 2, resume)
+
+    def store():
+        if writer is not None:
+            writer.append(get_conditions(particles))
+        else:
+            save(i_step, time, particles, particle_data)
+
+    def checkpoint():
+        rng = np.random.get_state()
+        writer.checkpoint(dict(
+            time=time, i_step=i_step, part_out=part_out, part_pair=part_pair,
+            xflow=[stream.xflow for stream in inlet_streams],
+            comp=particles.comp if vectorized else
+            np.array([p() for p in particles]),
+            rng_keys=rng[1], rng_pos=rng[2], rng_has_gauss=rng[3],
+            rng_gauss=rng[4]))
+
+    state = None
+    if writer is not None and resume:
+        state = writer.load_checkpoint()
+
+    if state is not None:
+        # Restore simulation from checkpoint
+        time = float(state['time'])
+        i_step = int(state['i_step'])
+        part_out = float(state['part_out'])
+        part_pair = float(state['part_pair'])
+        for stream, xflow in zip(inlet_streams, state['xflow']):
+            stream.xflow = float(xflow)
+        if vectorized:
+            particles.comp[:] = state['comp']
+            for i in range(num_part):
+                gas.HPY = state['comp'][i, 0], gas.P, state['comp'][i, 1:]
+                particles.T[i] = gas.T
+        else:
+            for i, p in enumerate(particles):
+                p(comp=state['comp'][i])
+        np.random.set_state(('MT19937', state['rng_keys'], int(state['rng_pos']),
+                             int(state['rng_has_gauss']),
+                             float(state['rng_gauss'])))
+        while i_step + 1 >= num_steps:
+            num_steps *= 2
+    else:
+        # Random seed
+        np.random.seed()
 
-    time = 0.0
-    i_step = 0
+        time = 0.0
+        i_step = 0
 
-    part_out = 0.0
-    part_pair = 0.0
+        part_out = 0.0
+        part_pair = 0.0
 
     times = np.zeros(num_steps + 1)
     temp_mean = np.zeros(num_steps + 1)
-    temp_mean[0] = np.mean([p.gas.T for p in particles])
+    temp_mean[i_step] = mean_temperature()
 
-    # Array of full particle data for all timesteps
-    particle_data = np.empty([num_steps + 1, num_part, gas.n_species + 3])
-    save_data(i_step, time, particles, particle_data)
+    if writer is None:
+        # Array of full particle data for all timesteps
+        particle_data = np.empty([num_steps + 1, num_part, gas.n_species + 3])
+    if state is None:
+        store()
+        if writer is not None:
+            checkpoint()
 
     print('Time [ms]  Temperature [K]')
-    temp_mean[i_step] = np.mean([p.gas.T for p in particles])
+    temp_mean[i_step] = mean_temperature()
     print('{:6.2f}  {:9.1f}'.format(time*1000., temp_mean[i_step]))
 
     while time < time_end:
@@ -886,9 +1780,10 @@ def run_simulation(mech, case, init_temp, pres, eq_ratio, fuel, oxidizer,
             #need to resize arrays
             times = np.hstack((times, np.zeros(num_steps + 1)))
             temp_mean = np.hstack((temp_mean, np.zeros(num_steps + 1)))
-            particle_data = np.concatenate((particle_data,
-                np.empty([num_steps + 1, num_part, gas.n_species + 3])),
-                axis=0)
+            if particle_data is not None:
+                particle_data = np.concatenate((particle_data,
+                    np.empty([num_steps + 1, num_part, gas.n_species + 3])),
+                    axis=0)
             num_steps *= 2
 
         if (time + dt_max) > time_end:
@@ -903,46 +1798,70 @@ def run_simulation(mech, case, init_temp, pres, eq_ratio, fuel, oxidizer,
         # Select num_pairs random pairs of particles for each
         # inflow/outflow particle and shift to end.
         num_fl_pairs = 2 * npart_out
-        select_pairs(particles, num_fl_pairs)
+        select(particles, num_fl_pairs)
 
         # Set alternate particles to inflow properties
-        for i in range(npart_out):
-            i_str = inflow(inlet_streams)
-            particles[1 - 2 * (i+1)](inlet_streams[i_str]())
+        if vectorized:
+            if npart_out:
+                rows = num_part - 1 - 2 * np.arange(npart_out)
+                particles.comp[rows] = [inlet_streams[inflow(inlet_streams)]()
+                                        for i in range(npart_out)]
+        else:
+            for i in range(npart_out):
+                i_str = inflow(inlet_streams)
+                particles[1 - 2 * (i+1)](inlet_streams[i_str]())
 
         # Now perform pairing
         part_pair += 0.5 * num_part * dt / tau_pair
         num_pairs = int(round(part_pair))
         part_pair -= num_pairs
-        select_pairs(particles, num_pairs, num_fl_pairs)
+        select(particles, num_pairs, num_fl_pairs)
 
         # Rotate particles
-        temp_comp = particles[-1]()
-        for i in [i*2 + 1 for i in range(num_pairs - 1)]:
-            #particles[-i] = particles[-(i+2)]
-            particles[-i](particles[-(i+2)])
-        particles[-(num_pairs * 2 - 1)](temp_comp)
+        if vectorized:
+            if num_pairs:
+                rows = num_part - 1 - 2 * np.arange(num_pairs)
+                particles.comp[rows] = particles.comp[np.roll(rows, -1)]
+                particles.T[rows] = particles.T[np.roll(rows, -1)]
+        else:
+            temp_comp = particles[-1]()
+            for i in [i*2 + 1 for i in range(num_pairs - 1)]:
+                #particles[-i] = particles[-(i+2)]
+                particles[-i](particles[-(i+2)])
+            particles[-(num_pairs * 2 - 1)](temp_comp)
 
         # Now loop over mix-react substeps
         dt_sub = dt / num_substeps
         for i in range(num_substeps):
-            mix_substep(particles, dt_sub, tau_mix)
-            reaction_substep(particles, dt_sub, mech)
+            mix(particles, dt_sub, tau_mix)
+            if vectorized:
+                particles.react(dt_sub, pool)
+            else:
+                reaction_substep(particles, dt_sub, mech, pool)
 
         time += dt
         i_step += 1
 
         # Save mean properties
-        temp_mean[i_step] = np.mean([p.gas.T for p in particles])
+        temp_mean[i_step] = mean_temperature()
         times[i_step] = time
 
         # Save full data
-        save_data(i_step, time, particles, particle_data)
+        store()
+        if writer is not None and (i_step % checkpoint_interval == 0 or
+                                   time >= time_end):
+            checkpoint()
 
         print('{:6.2f}  {:9.1f}'.format(time*1000., temp_mean[i_step]))
 
+    if pool is not None:
+        pool.close()
+
     times = times[:i_step + 1]
     temp_mean = temp_mean[:i_step + 1]
+    if writer is not None:
+        writer.close()
+        return None
     particle_data = particle_data[:i_step + 1, :, :]
 
     return particle_data
@@ -1033,6 +1952,44 @@ def parse_input_file(input_file):
                         type=str, default='pasr_output.npy',
                         help='PaSR results file (.npy).'
                         )
+    parser.add_argument('-n', '--num_proc',
+                        type=int, default=None,
+                        help='Number of worker processes for the reaction '
+                             'substep, defaults to the number of CPUs.'
+                        )
+    parser.add_argument('-v', '--vectorized',
+                        action='store_true', default=False,
+                        help='Store particles in a single array and perform '
+                             'mixing / inflow / pairing as array operations, '
+                             'for large numbers of particles.'
+                        )
+    parser.add_argument('-s', '--stream',
+                        action='store_true', default=False,
+                        help='Stream the particle states (temperature, pressure '
+                             'and concentrations) of each step to the output '
+                             'file (.npy or .h5), with checkpoints for restart.'
+                        )
+    parser.add_argument('-r', '--resume',
+                        action='store_true', default=False,
+                        help='Resume a streamed simulation from its last '
+                             'checkpoint.'
+                        )
+    parser.add_argument('-b', '--backend',
+                        type=str, default='cantera',
+                        choices=['cantera', 'pyjac'],
+                        help='Reaction substep backend: Cantera reactor '
+                             'networks, or pyJac-generated kernels with a '
+                             'batched Rosenbrock integrator.'
+                        )
+    parser.add_argument('-d', '--build_dir',
+                        type=str, default='pyjac_build',
+                        help='Directory to build the pyJac modules in for the '
+                             'pyjac backend.'
+                        )
+    parser.add_argument('--num_threads',
+                        type=int, default=1,
+                        help='Number of threads used by the pyJac kernels.'
+                        )
     args = parser.parse_args()
 
     inputs = parse_input_file(args.input)
@@ -1042,6 +1999,11 @@ def parse_input_file(input_file):
         inputs['fuel'], inputs['oxidizer'],
         inputs['complete products'], inputs['number of particles'],
         inputs['residence time'], inputs['mixing time'],
-        inputs['pairing time'], inputs['number of residence times']
+        inputs['pairing time'], inputs['number of residence times'],
+        vectorized=args.vectorized, num_proc=args.num_proc,
+        backend=args.backend, build_dir=args.build_dir,
+        num_threads=args.num_threads,
+        output=args.output if args.stream else None, resume=args.resume
         )
-    np.save(args.output, particle_data)
+    if not args.stream:
+        np.save(args.output, particle_data)
@@ -7,8 +7,14 @@
 
 # Standard libraries
 import os
+import shutil
+import hashlib
+import tempfile
 import subprocess
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from collections import deque
 
 # Related modules
 import numpy as np
@@ -23,6 +29,7 @@
 
 # Local imports
 from pyjac.core.mech_interpret import read_mech_ct
+from pyjac.core.chem_model import calc_spec_cp, calc_spec_h
 from pyjac.core import array_creator as arc
 from pyjac.tests.test_jacobian import _get_ad_jacobian
 from pyjac.tests.test_utils import _run_mechanism_tests, runner, inNd
@@ -31,12 +38,50 @@
 from pyjac.libgen import generate_library
 from pyjac.core.create_jacobian import determine_jac_inds
 from pyjac.utils import inf_cutoff, kernel_argument_ordering, reassign_species_lists
+from pyjac import utils
+from pyjac._version import __version__ as pyjac_version
 
 
 def getf(x):
     return os.path.basename(x)
 
 
+# the reference answer evaluator, inherited by forked worker processes
+_reference_helper = None
+
+
+def _eval_reference_chunk(args):
+    return _reference_helper._eval_chunk(*args)
+
+
+def _map_reference_chunks(helper, chunks):
+    """
+    Evaluates the reference answers of the :param:`helper` for the given
+    :param:`chunks` (in order) over a pool of worker processes, each of which
+    holds its own (forked) copy of the helper's :class:`cantera.Solution`
+
+    The number of processes may be set via the 'reference_processes' test
+    input, and defaults to the number of CPUs
+    """
+    global _reference_helper
+    _reference_helper = helper
+    num_proc = int(_get_test_input('reference_processes',
+                                   multiprocessing.cpu_count()))
+    num_proc = min(num_proc, len(chunks))
+    if num_proc <= 1:
+        for chunk in chunks:
+            yield helper._eval_chunk(*chunk)
+        return
+
+    pool = multiprocessing.Pool(num_proc)
+    try:
+        for result in pool.imap(_eval_reference_chunk, chunks):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 class hdf5_store(object):
     def __init__(self, chunk_size=_get_test_input('chunk_size', 10000)):
         """
@@ -168,16 +213,12 @@ def release(self):
                 os.remove(f)
         self.handles.clear()
 
-    def output_to_pytables(self, name, dirname, ref_ans, order,
-                           filename=None, pytables_name=None,
-                           num_conditions=None):
+    def output_memmap(self, name, dirname, ref_ans, order, filename=None,
+                      num_conditions=None):
         """
-        Converts the binary output file in :param:`filename` to a HDF5 pytables file
-        in order to avoid memory errors
-
-        Note
-        ----
-        Processes the file in chunks of :attr:`error_chunk_size`
+        Memory-maps the binary output file in :param:`filename` in its native
+        data ordering, such that it may be compared to the reference answers in
+        chunks without loading it into memory (or converting it to HDF5)
 
         Parameters
         ----------
@@ -193,87 +234,157 @@ def output_to_pytables(self, name, dirname, ref_ans, order,
         filename: str [None]
             The filename of the output, if not supplied it will be assumed to be
             :param:`dir`/name.bin
-        pytables_name: str [None]
-            The filename of the pytables_output.  If not supplied, it will be the
-            same as :param:`filename` with the '.bin' prefix replaced with
-            '.hdf5'
         num_conditions: int [None]
             If specified, a limit on the number of conditions that were tested
             due to memory constraints
 
         Returns
         -------
-        arr: :class:`pytables.array`
-            The pytables
+        arr: :class:`numpy.memmap`
+            The read-only memory-mapped output
         """
 
-        # filenames
         if filename is None:
             filename = os.path.join(dirname, name + '.bin')
-        if pytables_name is None:
-            pytables_name = filename.replace('.bin', '.hdf5')
-
-        if pytables_name in self.handles:
-            # close open handle
-            file = self.handles[pytables_name]
-            file.close()
-            # first check if the file still exists -- it might have been removed in
-            # the :func:`_run_mechanism_tests.__cleanup()`
-            if os.path.exists(pytables_name):
-                os.remove(pytables_name)
-            # and remove from handles
-            del self.handles[pytables_name]
-
-        # open the pytables file for writing
-        hdf5_file = tables.open_file(pytables_name, mode='w')
-        # add compression
-        filters = tables.Filters(complevel=5, complib='blosc')
-        # get the reference answer shape
-        ref_ans_shape = list(ref_ans.shape)
-        # check for limits
+        shape = list(ref_ans.shape)
         if num_conditions:
-            ref_ans_shape[0] = num_conditions
+            shape[0] = num_conditions
+        return np.memmap(filename, mode='r', dtype=ref_ans.dtype,
+                         shape=tuple(shape), order=order)
 
-        # with the new version, all data is stored in 'C' or 'F' order in the
-        # non-split format
-        grow_axis = 0
-        shape = tuple(ref_ans_shape[:])
 
-        # and set the enlargable shape for the pytables array
-        eshape = tuple(shape[i] if i != grow_axis else 0
-                       for i in range(len(shape)))
-        # create hdf5 array
-        data_storage = hdf5_file.create_earray(
-            hdf5_file.root, name, tables.Atom.from_dtype(ref_ans.dtype),
-            shape=eshape, filters=filters,
-            expectedrows=shape[grow_axis])
-        # and read the number of conditions in the grow dimension
-        num_conds = shape[grow_axis]
-        # and cut down by vec width to respect chunk size
-        chunk_size = self.chunk_size
-        # open the data as a memmap to avoid loading it all into memory
-        file = np.memmap(filename, mode='r', dtype=ref_ans.dtype,
-                         shape=shape, order=order)
-        # now read in chunks
-        for i in range(0, num_conds, chunk_size):
-            # find out how many ICs to read
-            end = np.minimum(i + chunk_size, num_conds)
-            # set the read region
-            rslice = tuple(slice(None) if ax != grow_axis else slice(i, end)
-                           for ax in range(len(shape)))
-            # read in data and place into storage
-            data_storage.append(file[rslice])
-        # close memmap
-        del file
-
-        # close hdf5 file
-        hdf5_file.close()
-        # now reopen w/ read & return handle
-        hdf5_file = tables.open_file(pytables_name, mode='r')
-        # and store the handle
-        self.handles[pytables_name] = hdf5_file
-        # and reutrn data
-        return getattr(hdf5_file.root, name)
+class reference_cache(object):
+    def __init__(self, cache_dir, max_size=20.):
+        """
+        A persistent cache of reference answers (stored as HDF5 files), shared
+        between validation sessions.  The least recently used entries are evicted
+        once the total size of the cache exceeds :param:`max_size`
+
+        Parameters
+        ----------
+        cache_dir: str
+            The directory to store the cache in
+        max_size: float [20]
+            The maximum size of the cache, in GB
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = int(float(max_size) * 1024**3)
+
+    @staticmethod
+    def key(phi, chunk_size, *parts):
+        """
+        Returns the cache key for the reference answers of the given state vectors
+        :param:`phi` (a :class:`numpy.ndarray` or :class:`pytables.array`, hashed
+        in chunks of :param:`chunk_size`) and any further identifying
+        :param:`parts`, e.g., the mechanism, species ordering and conp / conv state
+        """
+        digest = hashlib.sha256()
+        digest.update(repr((ct.__version__, pyjac_version) + parts).encode('utf-8'))
+        digest.update(repr(phi.shape).encode('utf-8'))
+        for i in range(0, phi.shape[0], chunk_size):
+            digest.update(np.ascontiguousarray(
+                phi[i:i + chunk_size], dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def fetch(self, key, filenames):
+        """
+        Retrieves the cached :param:`filenames` for :param:`key` (if available).
+        Entries are cached by their base name, and copied to the given
+        (absolute or relative) paths
+
+        Returns
+        -------
+        values: dict or None
+            The dictionary of values stored with the cached files, or None if
+            the entry was not found
+        """
+        path = self._path(key)
+        values = os.path.join(path, 'values.npz')
+        if not os.path.isfile(values) or not all(
+                os.path.isfile(os.path.join(path, os.path.basename(f)))
+                for f in filenames):
+            return None
+        for f in filenames:
+            cached = os.path.join(path, os.path.basename(f))
+            if os.path.exists(f):
+                os.remove(f)
+            try:
+                # link if possible, to avoid copying large files
+                os.link(cached, f)
+            except (OSError, AttributeError):
+                shutil.copyfile(cached, f)
+        # mark as recently used
+        os.utime(path, None)
+        with np.load(values) as loaded:
+            return dict((k, loaded[k]) for k in loaded.files)
+
+    def store(self, key, filenames, **values):
+        """
+        Stores the :param:`filenames` (and additional :param:`values`) for
+        :param:`key` in the cache, and evicts old entries if required
+        """
+        path = self._path(key)
+        if os.path.isdir(path):
+            return
+        utils.create_dir(self.cache_dir)
+        # copy to a temporary directory, and move into place such that the entry
+        # is never partially written
+        tmp = tempfile.mkdtemp(dir=self.cache_dir)
+        try:
+            for f in filenames:
+                shutil.copyfile(f, os.path.join(tmp, os.path.basename(f)))
+            np.savez(os.path.join(tmp, 'values.npz'), **values)
+            os.rename(tmp, path)
+        except OSError:
+            # e.g., stored concurrently by another process
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is within
+        :attr:`max_size`
+        """
+        entries = []
+        for entry in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, entry)
+            if not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(path, f))
+                       for f in os.listdir(path))
+            entries.append((os.path.getmtime(path), size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+def get_reference_cache():
+    """
+    Returns the :class:`reference_cache` in the 'reference_cache' test input
+    directory (limited to 'reference_cache_size' GB), or None if not specified
+    """
+    cache_dir = _get_test_input('reference_cache', '')
+    if not cache_dir:
+        return None
+    return reference_cache(cache_dir, _get_test_input('reference_cache_size', 20.))
+
+
+def _mechanism_hash(specs, reacs):
+    """
+    Returns a hash of the species / reactions of a mechanism, and the species
+    ordering thereof
+    """
+    digest = hashlib.sha256()
+    for item in list(specs) + list(reacs):
+        digest.update(repr(sorted(
+            (k, repr(v)) for k, v in iteritems(vars(item)))).encode('utf-8'))
+    return digest.hexdigest()
 
 
 class validation_runner(runner, hdf5_store):
@@ -358,6 +469,20 @@ def pre(self, gas, data, num_conditions, max_vec_width):
 
         self.helper = self.eval_class(gas, num_conditions)
 
+    def prepare(self, state):
+        """
+        Evaluates the reference answer for the given :param:`state`, such that
+        parallel workers forked from this process need only read it
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary containing the state of the current optimization / language
+            / vectorization patterns, etc.
+        """
+        phi = self.phi_cp if state['conp'] else self.phi_cv
+        self.helper.eval_answer(phi, state)
+
     def post(self):
         """
         Cleanup HDF5 files
@@ -380,7 +505,7 @@ def arrays_per_run(self, offset, this_run, order, answers, outputs):
             The data ordering
         answers: list of :class:`pytables.Array`
             The reference answers
-        outputs: list of :class:`pytables.Array`
+        outputs: list of :class:`numpy.memmap`
             The outputs to check
 
         Returns
@@ -391,14 +516,9 @@ def arrays_per_run(self, offset, this_run, order, answers, outputs):
             The converted in-memory outputs
         """
 
-        # outputs require a bit of parsing
-        out = []
-        ic_mask = np.arange(offset, offset + this_run)
-        for i, arr in enumerate(outputs):
-            # the outputs are now un-split, and in original order
-            inds = [slice(None) for x in range(arr.ndim)]
-            inds[0] = np.unique(ic_mask)
-            out.append(arr[tuple(inds)])
+        # the outputs are now un-split, and in original order -- copy the chunk
+        # into memory, as the error evaluation may modify it in place
+        out = [np.array(arr[offset:offset + this_run]) for arr in outputs]
 
         # simply need to reference and split answers
         answers = [x[offset:offset + this_run, :] for x in answers]
@@ -455,35 +575,74 @@ def run(self, state, dirs, phi_path, data_output, limits={}):
                               cwd=my_test)
 
         answers = self.helper.ref_answers(state)
-        outputs = []
-        # convert output to hdf5 files
-        for name, ref_ans in zip(*(self.helper.output_names, answers)):
-            outputs.append(
-                self.output_to_pytables(name, my_test, ref_ans, state['order'],
-                                        num_conditions=num_conditions))
-
-        # now loop through the output in error chunks increments to get error
-        offset = 0
-        # store the error dict
-        err_dict = {}
-        while offset < num_conditions:
-            this_run = np.minimum(
-                self.chunk_size, num_conditions - offset)
-
-            # convert our chunks to workable numpy arrays
-            ans, out = self.arrays_per_run(
-                offset, this_run, state['order'], answers, outputs)
-
-            # get error
-            err_dict = self.helper.eval_error(
-                offset, this_run, state, out, ans, err_dict)
+        # map the raw outputs
+        outputs = [self.output_memmap(name, my_test, ref_ans, state['order'],
+                                      num_conditions=num_conditions)
+                   for name, ref_ans in zip(*(self.helper.output_names, answers))]
 
-            # finally update the offset
-            offset += this_run
+        err_dict = self.compare(state, answers, outputs, num_conditions)
+        del outputs
 
         # and write to file
         np.savez(data_output, **err_dict)
 
+    def compare(self, state, answers, outputs, num_conditions):
+        """
+        Compute the error statistics of the :param:`outputs` compared to the
+        reference :param:`answers`
+
+        The arrays are read in chunks of :attr:`chunk_size` conditions, and the
+        error of each chunk is evaluated in a pool of threads (the size of which
+        may be set by the 'comparison_threads' test input, defaulting to the number
+        of CPUs), such that only the reduced error statistics are retained
+
+        Parameters
+        ----------
+        state: dict
+            A dictionary containing the state of the current optimization / language
+            / vectorization patterns, etc.
+        answers: list of :class:`pytables.Array`
+            The reference answers
+        outputs: list of :class:`numpy.memmap`
+            The outputs to check
+        num_conditions: int
+            The number of conditions to compare
+
+        Returns
+        -------
+        err_dict: dict
+            The error statistics
+        """
+
+        num_threads = int(_get_test_input('comparison_threads',
+                                          multiprocessing.cpu_count()))
+
+        def __eval_error(args):
+            return self.helper.eval_error(*args)
+
+        err_dict = {}
+        pending = deque()
+        pool = ThreadPool(num_threads)
+        try:
+            for offset in range(0, num_conditions, self.chunk_size):
+                this_run = np.minimum(self.chunk_size, num_conditions - offset)
+                # reading the chunks (in particular, from the HDF5 reference
+                # answers) is not thread-safe, and is done here
+                ans, out = self.arrays_per_run(
+                    offset, this_run, state['order'], answers, outputs)
+                pending.append(pool.apply_async(
+                    __eval_error, ((offset, this_run, state, out, ans, {}),)))
+                # limit the number of chunks held in memory
+                while len(pending) >= 2 * num_threads:
+                    self.helper.merge_error(err_dict, pending.popleft().get())
+            while pending:
+                self.helper.merge_error(err_dict, pending.popleft().get())
+        finally:
+            pool.close()
+            pool.join()
+
+        return err_dict
+
 
 class eval(hdf5_store):
     def eval_answer(self, phi, param, state):
@@ -492,6 +651,13 @@ def eval_answer(self, phi, param, state):
     def eval_error(self, offset, this_run, state, output, answers, err_dict):
         raise NotImplementedError
 
+    def merge_error(self, err_dict, chunk_err):
+        """
+        Merge the error statistics :param:`chunk_err` of a subsequent chunk of
+        conditions (as returned by :meth:`eval_error`) into :param:`err_dict`
+        """
+        raise NotImplementedError
+
     def ref_answers(self, state):
         raise NotImplementedError
 
@@ -516,15 +682,6 @@ class spec_rate_eval(eval):
     def __init__(self, gas, num_conditions, atol=1e-10, rtol=1e-6):
         self.atol = atol
         self.rtol = rtol
-        self.molar_rates = np.zeros((num_conditions, gas.n_species - 1))
-        self.conp_temperature_rates = np.zeros((num_conditions, 1))
-        self.conv_temperature_rates = np.zeros((num_conditions, 1))
-        self.conp_extra_rates = np.zeros((num_conditions, 1))
-        self.conv_extra_rates = np.zeros((num_conditions, 1))
-        self.h = np.zeros((gas.n_species))
-        self.u = np.zeros((gas.n_species))
-        self.cp = np.zeros((gas.n_species))
-        self.cv = np.zeros((gas.n_species))
         self.num_conditions = num_conditions
 
         # get mappings
@@ -539,9 +696,6 @@ def __init__(self, gas, num_conditions, atol=1e-10, rtol=1e-6):
             except AttributeError:
                 pass
         self.thd_map = np.array(self.thd_map, dtype=arc.kint_type)
-        self.rop_fwd_test = np.zeros((num_conditions, self.fwd_map.size))
-        self.rop_rev_test = np.zeros((num_conditions, self.rev_map.size))
-        self.rop_net_test = np.zeros((num_conditions, self.fwd_map.size))
         # need special maps for rev/thd
         self.rev_to_thd_map = np.where(np.in1d(self.rev_map, self.thd_map))[0]
         self.thd_to_rev_map = np.where(np.in1d(self.thd_map, self.rev_map))[0]
@@ -556,6 +710,10 @@ def __init__(self, gas, num_conditions, atol=1e-10, rtol=1e-6):
 
         # predefines
         self.specs = gas.species()[:]
+        # species thermo-data, for vectorized evaluation of the cp / h polynomials
+        _, self.thermo, reacs = read_mech_ct(gas=gas)
+        self.mech_hash = _mechanism_hash(self.thermo, reacs)
+        self.cache = get_reference_cache()
         self.gas = gas
         self.evaled = False
         self.name = 'spec'
@@ -576,93 +734,133 @@ def output_names(self):
     def ref_answers(self, state):
         return self.outputs_cp if state['conp'] else self.outputs_cv
 
-    def eval_answer(self, phi, state):
-        def __eval_cp(j, T):
-            return self.specs[j].thermo.cp(T)
-        eval_cp = np.vectorize(__eval_cp, cache=True)
-
-        def __eval_h(j, T):
-            return self.specs[j].thermo.h(T)
-        eval_h = np.vectorize(__eval_h, cache=True)
+    def _eval_chunk(self, phi, conp):
+        """
+        Evaluates the reference answers for a chunk of the state vectors
+        :param:`phi`, returning a dictionary of the resulting arrays
+        """
+        gas = self.gas
+        gas.basis = 'molar'
+        T = phi[:, 0]
+        P = phi[:, 1] if conp else phi[:, 2]
+        V = phi[:, 2] if conp else phi[:, 1]
+        # it's actually more accurate to set the density
+        # (total concentration) due to the cantera internals
+        D = P / (ct.gas_constant * T)
+
+        # get the last species's concentrations as D - sum(other species)
+        concs = phi[:, 3:] / V[:, np.newaxis]
+        last_spec = np.expand_dims(D - np.sum(concs, axis=1), 1)
+        concs = np.concatenate((concs, last_spec), axis=1)
+
+        num = T.size
+        check = np.empty((num, gas.n_species + 2))
+        spec_rates = np.empty((num, gas.n_species))
+        rop_fwd = np.empty((num, self.fwd_map.size))
+        rop_rev = np.empty((num, self.rev_map.size))
+        rop_net = np.empty((num, self.fwd_map.size))
+        for i in range(num):
+            # first, set T / D
+            gas.TD = T[i], D[i]
+            # now set concentrations
+            gas.concentrations = concs[i]
+            check[i, 0] = gas.T
+            check[i, 1] = gas.density
+            check[i, 2:] = gas.concentrations
+            # get molar species rates
+            spec_rates[i] = gas.net_production_rates
+            # info vars
+            rop_fwd[i] = gas.forward_rates_of_progress
+            rop_rev[i] = gas.reverse_rates_of_progress[self.rev_map]
+            rop_net[i] = gas.net_rates_of_progress
+
+        # assert allclose
+        assert np.allclose(check[:, 0], T, atol=1e-12)
+        assert np.allclose(check[:, 1], D, atol=1e-12)
+        assert np.allclose(check[:, 2:], concs, atol=1e-12)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # find temperature rates
+            cp = calc_spec_cp(T, self.thermo)
+            h = calc_spec_h(T, self.thermo)
+            cv = cp - ct.gas_constant
+            u = h - T[:, np.newaxis] * ct.gas_constant
+            conp_temperature_rates = -np.sum(h * spec_rates, axis=1) / np.sum(
+                cp * concs, axis=1)
+            conv_temperature_rates = -np.sum(u * spec_rates, axis=1) / np.sum(
+                cv * concs, axis=1)
+
+            # finally find extra variable rates
+            mw_sum = np.dot(spec_rates[:, :-1], self.mw_frac)
+            conp_extra_rates = V * (T * ct.gas_constant * mw_sum / P +
+                                    conp_temperature_rates / T)
+            conv_extra_rates = (P / T) * conv_temperature_rates + \
+                T * ct.gas_constant * mw_sum
+
+        molar_rates = spec_rates[:, :-1] * V[:, np.newaxis]
+        return {'dphi_cp': np.concatenate((
+                    conp_temperature_rates[:, np.newaxis],
+                    conp_extra_rates[:, np.newaxis], molar_rates), axis=1),
+                'dphi_cv': np.concatenate((
+                    conv_temperature_rates[:, np.newaxis],
+                    conv_extra_rates[:, np.newaxis], molar_rates), axis=1),
+                'molar_rates': molar_rates,
+                'rop_fwd_test': rop_fwd,
+                'rop_rev_test': rop_rev,
+                'rop_net_test': rop_net,
+                'conp_extra_rates': conp_extra_rates[:, np.newaxis],
+                'conv_extra_rates': conv_extra_rates[:, np.newaxis]}
+
+    def __eval_reference(self, phi, state, shapes):
+        """
+        Evaluate the reference answers for :param:`phi` and write them to the
+        HDF5 files named by :param:`shapes`
+        """
+        answers = {}
+        for name, size in iteritems(shapes):
+            answers[name] = self.open_for_chunked_write(
+                name + '.hdf5', (0, size), self.num_conditions)
+
+        # evaluate in chunks, and write straight to the HDF5 store
+        phi = phi[:self.num_conditions]
+        chunks = [(phi[i:i + self.chunk_size], state['conp'])
+                  for i in range(0, self.num_conditions, self.chunk_size)]
+        for i, chunk in enumerate(_map_reference_chunks(self, chunks)):
+            print(i * self.chunk_size)
+            for name, arr in iteritems(answers):
+                arr.append(chunk[name])
 
+    def eval_answer(self, phi, state):
         if not self.evaled:
-            ns_range = np.arange(self.gas.n_species)
-
-            T = phi[:, 0]
-            P = phi[:, 1] if state['conp'] else phi[:, 2]
-            V = phi[:, 2] if state['conp'] else phi[:, 1]
-            # it's actually more accurate to set the density
-            # (total concentration) due to the cantera internals
-            D = P / (ct.gas_constant * T)
-
-            # get the last species's concentrations as D - sum(other species)
-            concs = phi[:, 3:] / V[:, np.newaxis]
-            last_spec = np.expand_dims(D - np.sum(concs, axis=1), 1)
-            concs = np.concatenate((concs, last_spec), axis=1)
-
-            self.gas.basis = 'molar'
-            with np.errstate(divide='ignore', invalid='ignore'):
-                for i in range(self.num_conditions):
-                    if not i % 10000:
-                        print(i)
-                    # first, set T / D
-                    self.gas.TD = T[i], D[i]
-                    # now set concentrations
-                    self.gas.concentrations = concs[i]
-                    # assert allclose
-                    assert np.allclose(self.gas.T, T[i], atol=1e-12)
-                    assert np.allclose(self.gas.density, D[i], atol=1e-12)
-                    assert np.allclose(self.gas.concentrations, concs[i], atol=1e-12)
-                    # get molar species rates
-                    spec_rates = self.gas.net_production_rates[:]
-                    self.molar_rates[i, :] = spec_rates[:-1] * V[i]
-                    # info vars
-                    self.rop_fwd_test[i, :] = self.gas.forward_rates_of_progress[:]
-                    self.rop_rev_test[i, :] = self.gas.reverse_rates_of_progress[:][
-                        self.rev_map]
-                    self.rop_net_test[i, :] = self.gas.net_rates_of_progress[:]
-
-                    # find temperature rates
-                    cp = eval_cp(ns_range, T[i])
-                    h = eval_h(ns_range, T[i])
-                    cv = cp - ct.gas_constant
-                    u = h - T[i] * ct.gas_constant
-                    np.divide(-np.dot(h, spec_rates), np.dot(cp, concs[i]),
-                              out=self.conp_temperature_rates[i, :])
-                    np.divide(-np.dot(u, spec_rates), np.dot(cv, concs[i]),
-                              out=self.conv_temperature_rates[i, :])
-
-                    # finally find extra variable rates
-                    self.conp_extra_rates[i] = V[i] * (
-                        T[i] * ct.gas_constant * np.sum(
-                            self.mw_frac * spec_rates[:-1]) / P[i] +
-                        self.conp_temperature_rates[i, :] / T[i])
-                    self.conv_extra_rates[i] = (
-                        P[i] / T[i]) * self.conv_temperature_rates[i, :] + \
-                        T[i] * ct.gas_constant * np.sum(
-                            self.mw_frac * spec_rates[:-1])
-
-            def _dphi(conp):
-                temperature_rates = self.conp_temperature_rates if conp \
-                    else self.conv_temperature_rates
-                extra_rates = self.conp_extra_rates if conp else\
-                    self.conv_extra_rates
-                return np.concatenate((temperature_rates, extra_rates,
-                                      self.molar_rates), axis=1)
-
-            # finally convert to HDF5
-            self.dphi_cp = _dphi(True)
-            self.dphi_cp = self.to_file(self.dphi_cp, 'dphi_cp.hdf5')
-            self.dphi_cv = _dphi(False)
-            self.dphi_cv = self.to_file(self.dphi_cp, 'dphi_cv.hdf5')
-            self.molar_rates = self.to_file(self.molar_rates, 'molar_rates.hdf5')
-            self.rop_fwd_test = self.to_file(self.rop_fwd_test, 'rop_fwd_test.hdf5')
-            self.rop_rev_test = self.to_file(self.rop_rev_test, 'rop_rev_test.hdf5')
-            self.rop_net_test = self.to_file(self.rop_net_test, 'rop_net_test.hdf5')
-            self.conp_extra_rates = self.to_file(
-                self.conp_extra_rates, 'conp_extra_rates.hdf5')
-            self.conv_extra_rates = self.to_file(
-                self.conv_extra_rates, 'conv_extra_rates.hdf5')
+            ns = self.gas.n_species
+            shapes = {'dphi_cp': ns + 1,
+                      'dphi_cv': ns + 1,
+                      'molar_rates': ns - 1,
+                      'rop_fwd_test': self.fwd_map.size,
+                      'rop_rev_test': self.rev_map.size,
+                      'rop_net_test': self.fwd_map.size,
+                      'conp_extra_rates': 1,
+                      'conv_extra_rates': 1}
+            files = [name + '.hdf5' for name in sorted(shapes)]
+
+            # check for cached answers
+            key = None
+            if self.cache is not None:
+                key = self.cache.key(
+                    phi, self.chunk_size, self.name,
+                    self.mech_hash, bool(state['conp']))
+            if key is None or self.cache.fetch(key, files) is None:
+                self.__eval_reference(phi, state, shapes)
+                # close for writing
+                for f in files:
+                    self.open_for_read(f)
+                if key is not None:
+                    self.cache.store(key, files)
+
+            # and reopen for reading
+            for name in shapes:
+                setattr(self, name, self.open_for_read(name + '.hdf5'))
+
             # and store outputs
             outputs = {arc.forward_rate_of_progress: self.rop_fwd_test,
                        arc.reverse_rate_of_progress: self.rop_rev_test,
@@ -777,6 +975,23 @@ def __get_locs_and_mask(arr, locs=None, inds=None):
 
         return err_dict
 
+    def merge_error(self, err_dict, chunk_err):
+        for name in [x for x in chunk_err if x + '_store' in chunk_err]:
+            if name not in err_dict:
+                for key in [name, name + '_value', name + '_store']:
+                    err_dict[key] = chunk_err[key].copy()
+                if name == 'rop_net':
+                    err_dict['rop_component'] = chunk_err['rop_component'].copy()
+                continue
+            # take the maximum relative error
+            update_locs = np.where(
+                chunk_err[name + '_store'] >= err_dict[name + '_store'])
+            for key in [name, name + '_value', name + '_store']:
+                err_dict[key][update_locs] = chunk_err[key][update_locs]
+            if name == 'rop_net':
+                err_dict['rop_component'][update_locs] = chunk_err[
+                    'rop_component'][update_locs]
+
     def _check_size(self, err, names, mods, size, vecsize):
         non_conformant = [n + mod for n in names for mod in mods
                           if err[n + mod].size != size]
@@ -867,6 +1082,8 @@ def __init__(self, gas, num_conditions, atol=1e-2, rtol=1e-6):
         self.gas = gas
         self.evaled = False
         self.name = 'jac'
+        self.mech_hash = _mechanism_hash(self.specs, self.reacs)
+        self.cache = get_reference_cache()
         ret = determine_jac_inds(self.reacs, self.specs, RateSpecialization.fixed)
         self.inds = ret['jac_inds']
         self.non_zero_specs = ret['net_per_spec']['map']
@@ -991,15 +1208,15 @@ def __fast_jac(self, conp, sparse, order, require=False):
                 return getattr(self, name)
         return jac
 
-    def eval_answer(self, phi, state):
-        jac = self.__fast_jac(state['conp'], state['jac_format'], state['order'])
-        if jac is not None:
-            return jac
-
+    def __eval_ad_jacobian(self, phi, state, name):
+        """
+        Evaluate the autodifferentiated Jacobian for :param:`phi` and write it to
+        the HDF5 file :param:`name`.hdf5, returning the norm of all finite
+        entries of the Jacobian
+        """
         # number of IC's
         num_conds = self.num_conditions
         # open the pytables file for writing
-        name = 'fd_jac_' + ('cp' if state['conp'] else 'cv')
         jac = self.open_for_chunked_write(
             name + '.hdf5', (0, len(self.specs) + 1, len(self.specs) + 1),
             num_conds)
@@ -1083,14 +1300,38 @@ def __get_state(offset, end):
             # and add to data array
             jac.append(jtemp)
 
+        return np.sqrt(threshold)
+
+    def eval_answer(self, phi, state):
+        jac = self.__fast_jac(state['conp'], state['jac_format'], state['order'])
+        if jac is not None:
+            return jac
+
+        name = 'fd_jac_' + ('cp' if state['conp'] else 'cv')
+        filename = name + '.hdf5'
+        # check for a cached Jacobian
+        key = None
+        cached = None
+        if self.cache is not None:
+            key = self.cache.key(
+                phi, self.chunk_size, self.name,
+                self.mech_hash, bool(state['conp']))
+            cached = self.cache.fetch(key, [filename])
+        if cached is not None:
+            threshold = cached['threshold']
+        else:
+            threshold = self.__eval_ad_jacobian(phi, state, name)
+
         # and reload for reading
-        jac = self.open_for_read(name + '.hdf5')
+        jac = self.open_for_read(filename)
+        if cached is None and key is not None:
+            self.cache.store(key, [filename], threshold=threshold)
         # store for later use
         setattr(self, name, jac)
 
         # store threshold for single computation
         thresh_name = 'threshold_' + 'cp' if state['conp'] else 'cv'
-        setattr(self, thresh_name, np.sqrt(threshold))
+        setattr(self, thresh_name, threshold)
 
         if state['jac_format'] == 'sparse':
             name += '_sp'
@@ -1128,19 +1369,29 @@ def ref_answers(self, state):
         return [self.__fast_jac(state['conp'], state['jac_format'], state['order'],
                                 require=True)]
 
+    @staticmethod
+    def _update_key(err_dict, key, value, op='norm'):
+        if key in err_dict:
+            if op == 'norm':
+                # update sqrt in correct way
+                # i.e. sqrt(sqrt(a^2)^2 + sqrt(b^2)^2) == sqrt(a^2 + b^2)
+                value = np.sqrt(
+                    err_dict[key] * err_dict[key] + value * value)
+            elif op == 'max':
+                value = np.maximum(err_dict[key], value)
+            else:
+                raise NotImplementedError(op)
+        err_dict[key] = value
+
+    def merge_error(self, err_dict, chunk_err):
+        for key, value in iteritems(chunk_err):
+            op = 'max' if key.endswith('_amax') or key.endswith('_value') \
+                else 'norm'
+            self._update_key(err_dict, key, value, op=op)
+
     def eval_error(self, offset, this_run, state, outputs, answers, err_dict):
         def __update_key(key, value, op='norm'):
-            if key in err_dict:
-                if op == 'norm':
-                    # update sqrt in correct way
-                    # i.e. sqrt(sqrt(a^2)^2 + sqrt(b^2)^2) == sqrt(a^2 + b^2)
-                    value = np.sqrt(
-                        err_dict[key] * err_dict[key] + value * value)
-                elif op == 'max':
-                    value = np.maximum(err_dict[key], value)
-                else:
-                    raise NotImplementedError(op)
-            err_dict[key] = value
+            self._update_key(err_dict, key, value, op=op)
 
         threshold = self.threshold(state)
         # load output
@@ -1304,7 +1555,8 @@ def check_file(self, filename, Ns, Nr, Nrev, current_vecsize):
 
 
 @nottest
-def species_rate_tester(work_dir='error_checking', test_matrix=None, prefix=''):
+def species_rate_tester(work_dir='error_checking', test_matrix=None, prefix='',
+                        num_jobs=1, max_cores=None):
     """Runs validation testing on pyJac's species_rate kernel, reading a series
     of mechanisms and datafiles from the :param:`work_dir`, and outputting
     a numpy zip file (.npz) with the error of various outputs (rhs vector, ROP, etc.)
@@ -1316,6 +1568,14 @@ def species_rate_tester(work_dir='error_checking', test_matrix=None, prefix=''):
         Working directory with mechanisms and for data
     test_matrix: str
         The testing matrix file, specifing the configurations to test
+    prefix: str
+        a prefix within the work directory to store the output of this run
+    num_jobs: int [1]
+        The number of test states to run concurrently, see
+        :func:`_run_mechanism_tests`
+    max_cores: int [None]
+        The number of cores available to concurrent test states, see
+        :func:`_run_mechanism_tests`
 
     Returns
     -------
@@ -1332,11 +1592,13 @@ def species_rate_tester(work_dir='error_checking', test_matrix=None, prefix=''):
 
     valid = validation_runner(spec_rate_eval, KernelType.species_rates)
     _run_mechanism_tests(work_dir, test_matrix, prefix, valid,
-                         raise_on_missing=raise_on_missing)
+                         raise_on_missing=raise_on_missing,
+                         num_jobs=num_jobs, max_cores=max_cores)
 
 
 @nottest
-def jacobian_tester(work_dir='error_checking', test_matrix=None, prefix=''):
+def jacobian_tester(work_dir='error_checking', test_matrix=None, prefix='',
+                    num_jobs=1, max_cores=None):
     """Runs validation testing on pyJac's jacobian kernel, reading a series
     of mechanisms and datafiles from the :param:`work_dir`, and outputting
     a numpy zip file (.npz) with the error of Jacobian as compared to a
@@ -1348,6 +1610,14 @@ def jacobian_tester(work_dir='error_checking', test_matrix=None, prefix=''):
         Working directory with mechanisms and for data
     test_matrix: str
         The testing matrix file, specifing the configurations to test
+    prefix: str
+        a prefix within the work directory to store the output of this run
+    num_jobs: int [1]
+        The number of test states to run concurrently, see
+        :func:`_run_mechanism_tests`
+    max_cores: int [None]
+        The number of cores available to concurrent test states, see
+        :func:`_run_mechanism_tests`
 
     Returns
     -------
@@ -1364,4 +1634,5 @@ def jacobian_tester(work_dir='error_checking', test_matrix=None, prefix=''):
 
     valid = validation_runner(jacobian_eval, KernelType.jacobian)
     _run_mechanism_tests(work_dir, test_matrix, prefix, valid,
-                         raise_on_missing=raise_on_missing)
+                         raise_on_missing=raise_on_missing,
+                         num_jobs=num_jobs, max_cores=max_cores)
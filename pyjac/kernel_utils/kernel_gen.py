@@ -2,12 +2,14 @@
 kernel_gen.py - generators used for kernel creation
 """
 
+import copy
 import shutil
 import textwrap
 import os
 import re
 from string import Template
 import logging
+import json
 from collections import defaultdict
 import six
 from six.moves import cPickle as pickle
@@ -27,7 +29,7 @@
 
 from pyjac.kernel_utils import file_writers as filew
 from pyjac.kernel_utils.memory_limits import memory_limits, \
-    memory_type, MemoryGenerationResult, get_string_strides
+    memory_type, MemoryGenerationResult, get_string_strides, get_cache_size
 from pyjac.core.enum_types import DeviceMemoryType
 from pyjac import siteconf as site
 from pyjac import utils
@@ -159,6 +161,276 @@ def make_kernel_generator(loopy_opts, *args, **kwargs):
     raise NotImplementedError()
 
 
+def chunk_kernels(kernels, barriers, max_per_kernel):
+    """
+    Splits any :class:`knl_info` in :param:`kernels` whose outer loop (e.g., over
+    the reactions or species of the mechanism) has more than :param:`max_per_kernel`
+    entries into a sequence of kernels, each evaluating a contiguous chunk of the
+    loop.  Each chunk is generated as a separate function, holding only its own
+    partition of the mechanism's maps and per-reaction data
+    (@see :func:`partition_chunk`), such that the constant data in each generated
+    function is bounded for very large mechanisms.
+
+    Kernels that carry state between iterations of the loop (i.e., that are not
+    :attr:`knl_info.chunkable`) are left as is
+
+    Parameters
+    ----------
+    kernels: list of :class:`knl_info` or :class:`loopy.LoopKernel`
+        The kernels to chunk, pre-built kernels are left as is
+    barriers: list of tuples
+        The global memory barriers between the :param:`kernels`,
+        (knl1, knl2, barrier_type)
+    max_per_kernel: int
+        The maximum number of loop entries per kernel
+
+    Returns
+    -------
+    chunked: list of :class:`knl_info` or :class:`loopy.LoopKernel`
+        The chunked kernels
+    barriers: list of tuples
+        The barriers, updated to point to the chunked kernels
+    """
+
+    chunked = []
+    # the (first, last) index of each original kernel in the chunked list
+    locations = []
+    for info in kernels:
+        first = len(chunked)
+        if isinstance(info, lp.LoopKernel) or info.chunk is not None or \
+                not info.chunkable:
+            chunked.append(info)
+        else:
+            _, domain = info.mapstore.get_iname_domain()
+            start, end = [int(x.strip()) for x in domain.split(
+                '<= {} <='.format(info.mapstore.iname))]
+            if end - start + 1 <= max_per_kernel:
+                chunked.append(info)
+            else:
+                for i, lower in enumerate(six.moves.range(
+                        start, end + 1, max_per_kernel)):
+                    chunk = copy.copy(info)
+                    chunk.name = '{}_chunk{}'.format(info.name, i)
+                    chunk.chunk = (lower, min(lower + max_per_kernel - 1, end))
+                    chunked.append(chunk)
+        locations.append((first, len(chunked) - 1))
+
+    barriers = [(locations[b[0]][1], locations[b[1]][0]) + tuple(b[2:])
+                for b in barriers]
+    return chunked, barriers
+
+
+def partition_chunk(knl, iname, lower, upper):
+    """
+    Restricts the constant arrays (e.g., the reaction maps and per-reaction
+    parameters) of a chunk of a kernel split by :func:`chunk_kernels` to the
+    entries used by the chunk, such that each chunk carries its own partition of
+    the data rather than a copy of the whole.
+
+    Only accesses indexed by the chunked loop (i.e., 'iname + c') are restricted,
+    any other access keeps using the full array
+
+    Parameters
+    ----------
+    knl: :class:`loopy.LoopKernel`
+        The kernel of the chunk
+    iname: str
+        The chunked loop index
+    lower: int
+        The first value of :param:`iname` in the chunk
+    upper: int
+        The last value of :param:`iname` in the chunk
+
+    Returns
+    -------
+    knl: :class:`loopy.LoopKernel`
+        The kernel, with the partitioned constant arrays
+    """
+
+    from pymbolic.primitives import Variable, Sum
+    from loopy.symbolic import SubstitutionRuleMappingContext
+    from loopy.transform.padding import ArrayAxisSplitHelper
+
+    loop = Variable(iname)
+    constants = set(name for name, temp in six.iteritems(knl.temporary_variables)
+                    if temp.read_only and temp.initializer is not None)
+
+    def __offset(index):
+        # returns c, if the index is of the form 'iname + c'
+        if index == loop:
+            return 0
+        if isinstance(index, Sum) and loop in index.children:
+            rest = [x for x in index.children if x != loop]
+            if len(rest) == len(index.children) - 1 and all(
+                    isinstance(x, six.integer_types + (np.integer,))
+                    for x in rest):
+                return int(sum(rest))
+        return None
+
+    def __map(knl, handler):
+        context = SubstitutionRuleMappingContext(
+            knl.substitutions, knl.get_var_name_generator())
+        mapper = ArrayAxisSplitHelper(context, constants, handler)
+        return context.finish_kernel(mapper.map_kernel(knl))
+
+    # find the offsets from the loop index at which each constant is accessed,
+    # along each axis
+    offsets = defaultdict(lambda: defaultdict(set))
+
+    def __record(expr):
+        for axis, index in enumerate(expr.index_tuple):
+            offset = __offset(index)
+            if offset is not None:
+                offsets[expr.aggregate.name][axis].add(offset)
+        return expr
+
+    __map(knl, __record)
+
+    # and slice the constants to the chunk along the (first) such axis
+    slices = {}
+    temps = knl.temporary_variables.copy()
+    for name in sorted(offsets):
+        temp = temps[name]
+        axis = min(offsets[name])
+        start = lower + min(offsets[name][axis])
+        stop = upper + max(offsets[name][axis])
+        if start < 0 or stop >= temp.shape[axis] or (
+                start == 0 and stop == temp.shape[axis] - 1):
+            continue
+        new_name = '{}_{}_{}'.format(name, start, stop)
+        shape = list(temp.shape)
+        shape[axis] = stop - start + 1
+        temps[new_name] = lp.TemporaryVariable(
+            new_name, dtype=temp.dtype, shape=tuple(shape), order=temp.order,
+            initializer=temp.initializer.take(
+                np.arange(start, stop + 1), axis=axis),
+            address_space=temp.address_space, read_only=True)
+        slices[name] = (new_name, axis, start)
+
+    def __slice(expr):
+        if expr.aggregate.name not in slices:
+            return expr
+        new_name, axis, start = slices[expr.aggregate.name]
+        index = list(expr.index_tuple)
+        offset = __offset(index[axis])
+        if offset is None:
+            return expr
+        index[axis] = loop + (offset - start) if offset != start else loop
+        return Variable(new_name).index(tuple(index))
+
+    # the (now) unused full arrays are removed with the other unused temporaries
+    return __map(knl.copy(temporary_variables=temps), __slice)
+
+
+def plan_working_buffer(sizes, live_ranges):
+    """
+    Assigns offsets in the working buffer to the arrays in :param:`sizes`, such
+    that arrays whose lifetimes (:param:`live_ranges`) do not overlap may share
+    storage.  The arrays are placed in order of decreasing size, each at the
+    lowest offset that does not overlap any already placed array that is live at
+    the same time
+
+    Parameters
+    ----------
+    sizes: dict of str -> int
+        The size of each array
+    live_ranges: dict of str -> (int, int)
+        The (inclusive) indicies of the first and last sub-kernels that use each
+        array
+
+    Returns
+    -------
+    offsets: dict of str -> int
+        The offset of each array in the working buffer
+    total: int
+        The total size of the working buffer
+    """
+
+    offsets = {}
+    for name in sorted(sizes, key=lambda x: (-sizes[x], live_ranges[x], x)):
+        first, last = live_ranges[name]
+        # the storage used by the placed arrays live at the same time
+        conflicts = sorted((offsets[x], offsets[x] + sizes[x]) for x in offsets
+                           if not (live_ranges[x][1] < first or
+                                   last < live_ranges[x][0]))
+        offset = 0
+        for start, end in conflicts:
+            if offset + sizes[name] <= start:
+                break
+            offset = max(offset, end)
+        offsets[name] = offset
+
+    total = max([offsets[x] + sizes[x] for x in offsets] + [0])
+    return offsets, total
+
+
+def parameter_path_variable(name):
+    """
+    Returns the name of the environment variable through which the calling
+    program may override the location of the runtime-loaded parameter blob of
+    kernel :param:`name` (e.g., after moving or installing the library)
+
+    Parameters
+    ----------
+    name: str
+        The kernel name
+
+    Returns
+    -------
+    variable: str
+        The environment variable name, e.g., 'PYJAC_JACOBIAN_PARAMETERS'
+    """
+
+    return 'PYJAC_{}_PARAMETERS'.format(name.upper())
+
+
+def write_parameters(filename, host_constants, order, alignment=64):
+    """
+    Serializes the :param:`host_constants` (i.e., the mechanism parameter tables)
+    into a single binary blob, to be loaded (memory-mapped) at runtime.  Each
+    table is placed at an offset aligned to :param:`alignment` bytes, and the
+    layout is written to a JSON index alongside the blob (:param:`filename` +
+    '.json'), such that the parameters may be updated without regenerating or
+    recompiling the kernels
+
+    Parameters
+    ----------
+    filename: str
+        The path of the blob to write
+    host_constants: list of :class:`loopy.TemporaryVariable`
+        The constants to serialize
+    order: {'C', 'F'}
+        The data ordering
+    alignment: int [64]
+        The alignment (in bytes) of each table in the blob
+
+    Returns
+    -------
+    offsets: dict of str -> int
+        The byte offset of each table in the blob
+    size: int
+        The total size (in bytes) of the blob, against which the calling program
+        validates the loaded file
+    """
+
+    offsets = {}
+    index = {}
+    with open(filename, 'wb') as file:
+        for const in sorted(host_constants, key=lambda x: x.name):
+            file.write(b'\0' * (-file.tell() % alignment))
+            offsets[const.name] = file.tell()
+            data = np.asarray(const.initializer, dtype=const.dtype.numpy_dtype)
+            file.write(data.flatten(order).tobytes())
+            index[const.name] = {'offset': offsets[const.name],
+                                 'dtype': data.dtype.str,
+                                 'shape': list(data.shape),
+                                 'order': order}
+        size = file.tell()
+    with open(filename + '.json', 'w') as file:
+        json.dump(index, file, indent=4, sort_keys=True)
+    return offsets, size
+
+
 def find_inputs_and_outputs(knl):
     """
     Convienence method that returns the name of all input/output array's for a given
@@ -442,6 +714,20 @@ class CallgenResult(TargetCheckingRecord, DocumentingRecord):
         If true, save copies of local arrays to file(s) for validation testing.
     binname: str
         The path to the compiled OpenCL binary, if applicable
+    parameter_path: str
+        The default path to the runtime-loaded parameter blob, if applicable.
+        The calling program may override this via the environment variable
+        returned by :func:`parameter_path_variable`
+    parameter_size: int
+        The expected size (in bytes) of the runtime-loaded parameter blob, if
+        applicable
+    parameter_offsets: dict of str -> dict of str -> int
+        A dictionary mapping of kernel name -> (host constant name -> byte
+        offset in the parameter blob), if applicable
+    condition_thresholds: list of float
+        The (sorted, unique) temperatures at which the kernels branch, used by
+        the calling program to compute the 'condition_order' input, if
+        applicable.  @see :func:`pyjac.core.driver_kernels.condition_order`
     """
 
     def __init__(self, name='', work_arrays=[], input_args={}, output_args={},
@@ -450,7 +736,8 @@ def __init__(self, name='', work_arrays=[], input_args={}, output_args={},
                  rxn_strings=[], dev_mem_type=DeviceMemoryType.mapped, type_map={},
                  host_constants={}, source_names={}, platform='', build_options='',
                  device_type=None, input_data_path='', for_validation=False,
-                 binname='', language_docs=None):
+                 binname='', parameter_path='', parameter_offsets={},
+                 language_docs=None, condition_thresholds=[], parameter_size=0):
 
         docs = self.init_docs(lang, docs=docs, language_docs=language_docs)
         ImmutableRecord.__init__(self, name=name, work_arrays=work_arrays,
@@ -467,7 +754,11 @@ def __init__(self, name='', work_arrays=[], input_args={}, output_args={},
                                  device_type=device_type,
                                  input_data_path=input_data_path,
                                  for_validation=for_validation,
-                                 binname=binname)
+                                 binname=binname,
+                                 parameter_path=parameter_path,
+                                 parameter_offsets=parameter_offsets,
+                                 condition_thresholds=condition_thresholds,
+                                 parameter_size=parameter_size)
 
     def _get_data(self, include_work=False):
         data = {}
@@ -560,11 +851,14 @@ class ReadgenRecord(TargetCheckingRecord):
         The data ordering
     type_map: dict of :class:`LoopyType` -> str
         The mapping of loopy types to ctypes
+    index_type: str ['int']
+        The ctype to use for indexing over the initial conditions
     """
 
-    def __init__(self, lang='', type_map={}, order='', inputs=[]):
+    def __init__(self, lang='', type_map={}, order='', inputs=[],
+                 index_type='int'):
         ImmutableRecord.__init__(self, lang=lang, order=order, inputs=inputs,
-                                 type_map=type_map)
+                                 type_map=type_map, index_type=index_type)
 
     @property
     def dev_mem_type(self):
@@ -676,6 +970,11 @@ def __init__(self, loopy_opts, kernel_type, kernels,
         if name is not None:
             assert self.kernel_type == KernelType.dummy
         self.kernels = kernels
+        self.barriers = barriers[:]
+        if loopy_opts.max_reactions_per_kernel:
+            # split large kernels into chunks
+            self.kernels, self.barriers = chunk_kernels(
+                self.kernels, self.barriers, loopy_opts.max_reactions_per_kernel)
         self.namestore = namestore
         self.test_size = test_size
         self.auto_diff = auto_diff
@@ -692,7 +991,6 @@ def __init__(self, loopy_opts, kernel_type, kernels,
         self.depends_on = depends_on[:]
         self.array_props = array_props.copy()
         self.all_arrays = []
-        self.barriers = barriers[:]
 
         # extra kernel parameters to be added to subkernels
         self.extra_kernel_data = extra_kernel_data[:]
@@ -719,6 +1017,8 @@ def __init__(self, loopy_opts, kernel_type, kernels,
         self.for_testing = isinstance(test_size, int)
         # setup driver type
         self.driver_type = driver_type
+        # the number of conditions per work-item, resolved on generation
+        self._block_size = 1
         # and pinned
         self.use_pinned = use_pinned
         # mark owners
@@ -799,6 +1099,32 @@ def target_preambles(self):
 
         return []
 
+    @property
+    def block_size(self):
+        """
+        Returns the number of conditions evaluated by each work-item per call to
+        the generated kernel, @see :func:`_set_block_size`
+        """
+        return self._block_size
+
+    def _set_block_size(self, record):
+        """
+        Determine the number of conditions evaluated by each work-item per call to
+        the generated kernel (and it's dependencies).  By default this is one, but
+        it may be overridden in subclasses
+
+        Parameters
+        ----------
+        record: :class:`MemoryGenerationResult`
+            The memory record of the processed kernel arguments
+
+        Returns
+        -------
+        None
+        """
+
+        pass
+
     @property
     def vec_width(self):
         """
@@ -962,10 +1288,37 @@ def _with_target(self, kernel_arg, for_atomic=False):
             The argument with correct target set in the dtype
         """
 
+        kernel_arg = self._with_index_type(kernel_arg)
         return kernel_arg.copy(
             dtype=to_loopy_type(kernel_arg.dtype, for_atomic=for_atomic,
                                 target=self.target).with_target(self.target))
 
+    def _with_index_type(self, kernel_arg):
+        """
+        Returns a copy of :param:`kernel_arg` with the
+        :attr:`loopy_options.index_dtype` if it is a value argument over the
+        initial conditions (i.e., the problem / work-size or driver offset) such
+        that index arithmetic over the conditions is carried out in the index type.
+        Other arguments (e.g., the species / reaction maps) are returned unchanged.
+
+        Parameters
+        ----------
+        kernel_arg: :class:`loopy.KernelArgument`
+            The argument to convert
+
+        Returns
+        -------
+        updated: :class:`loopy.KernelArgument`
+            The argument, with the index type set (if applicable)
+        """
+
+        from pyjac.core.driver_kernels import driver_offset
+        if self.loopy_opts.index_dtype != arc.kint_type and \
+                isinstance(kernel_arg, lp.ValueArg) and kernel_arg.name in [
+                    p_size.name, w_size.name, driver_offset.name]:
+            return kernel_arg.copy(dtype=self.loopy_opts.index_dtype)
+        return kernel_arg
+
     def _make_kernels(self, kernels=[], **kwargs):
         """
         Turns the supplied kernel infos into loopy kernels,
@@ -1132,7 +1485,9 @@ def _generate_common(self, path, record):
             lang=self.loopy_opts.lang,
             type_map=self.type_map,
             order=self.loopy_opts.order,
-            inputs=inputs)
+            inputs=inputs,
+            index_type=self.type_map[to_loopy_type(
+                self.loopy_opts.index_dtype, target=self.target)])
 
         # serialize
         readout = os.path.join(path, 'readgen.pickle')
@@ -1680,13 +2035,15 @@ def _process_memory(self, record):
             self.loopy_opts, mem_types,
             string_strides=get_string_strides()[0],
             input_file=self.mem_limits,
+            dtype=self.loopy_opts.index_dtype,
             limit_int_overflow=self.loopy_opts.limit_int_overflow)
 
         args = record.args[:]
         constants = record.constants[:]
         readonly = record.readonly.copy()
         host_constants = []
-        if not all(x >= 0 for x in mem_limits.can_fit()):
+        if self.loopy_opts.runtime_parameters or not all(
+                x >= 0 for x in mem_limits.can_fit()):
             # we need to convert our __constant temporary variables to
             # __global kernel args until we can fit
             type_changes = defaultdict(lambda: list())
@@ -1697,8 +2054,13 @@ def _process_memory(self, record):
                 gtemps = [x for x in constants if self.jacobian_lookup not in x.name]
             # sort by largest size
             gtemps = sorted(gtemps, key=lambda x: np.prod(x.shape), reverse=True)
-            type_changes[memory_type.m_global].append(gtemps[0])
-            gtemps = gtemps[1:]
+            if self.loopy_opts.runtime_parameters:
+                # all parameters are loaded at runtime
+                type_changes[memory_type.m_global].extend(gtemps)
+                gtemps = []
+            else:
+                type_changes[memory_type.m_global].append(gtemps[0])
+                gtemps = gtemps[1:]
             while not all(x >= 0 for x in mem_limits.can_fit(
                     with_type_changes=type_changes)):
                 if not gtemps:
@@ -1726,6 +2088,7 @@ def _process_memory(self, record):
             mem_limits = memory_limits.get_limits(
                 self.loopy_opts, mem_types, string_strides=get_string_strides()[0],
                 input_file=self.mem_limits,
+                dtype=self.loopy_opts.index_dtype,
                 limit_int_overflow=self.loopy_opts.limit_int_overflow)
 
         return record.copy(args=args, constants=constants, readonly=readonly,
@@ -1922,7 +2285,8 @@ def _name_assign(arr, use_atomics=True):
                 size=self.vec_width)]
 
         knl = lp.make_kernel(domains, insns, kdata, name=name,
-                             target=self.target)
+                             target=self.target,
+                             index_dtype=self.loopy_opts.index_dtype)
 
         if self.vec_width and not self.loopy_opts.is_simd:
             ggs = vecwith_fixer(knl.copy(), self.vec_width)
@@ -1968,6 +2332,48 @@ def _migrate_host_constants(self, kernels, host_constants):
 
         return kernels
 
+    def _get_live_ranges(self):
+        """
+        Determines the lifetime of each array used by the (ordered) sub-kernels of
+        this :class:`kernel_generator`, for compaction of the working buffer
+
+        Notes
+        -----
+        The lifetime of an array that is read by the first sub-kernel to use it
+        (i.e., that may depend on its previous contents), or that is an input /
+        output of this kernel, is extended to all the sub-kernels
+
+        Returns
+        -------
+        live_ranges: dict of str -> (int, int)
+            The (inclusive) indicies of the first and last sub-kernels that use
+            each array.  None if the working buffer should not be compacted, i.e.,
+            if not enabled, for deep-vectorizations (where a subsequent sub-kernel
+            may begin before all the work-items in a group are finished with the
+            previous sub-kernel) and for kernels with calls to other kernels
+            smuggled past loopy
+        """
+
+        if not self.loopy_opts.compact_working_buffer or self.loopy_opts.depth \
+                or self.fake_calls or not all(isinstance(x, lp.LoopKernel)
+                                              for x in self.kernels):
+            return None
+
+        everywhere = (-1, len(self.kernels))
+        live_ranges = {}
+        for i, knl in enumerate(self.kernels):
+            read = knl.get_read_variables()
+            for name in read | knl.get_written_variables():
+                if name not in live_ranges:
+                    live_ranges[name] = (i, i) if name not in read else \
+                        everywhere
+                elif live_ranges[name] != everywhere:
+                    live_ranges[name] = (live_ranges[name][0], i)
+
+        for name in self.in_arrays + self.out_arrays:
+            live_ranges[name] = everywhere
+        return live_ranges
+
     def _get_working_buffer(self, args):
         """
         Determine the size of the working buffer required to store the :param:`args`
@@ -2013,39 +2419,58 @@ def _get_size(ssize):
                        for k, v in six.iteritems(vars(self.namestore))
                        if isinstance(v, arc.creator)}
 
-        def _offset():
-            # if we have unique pointers, the work-size is fixed to an integer, and
-            # will already be baked into the size of the array
-            work_size = self.work_size if not self.unique_pointers else 1
-            return '{} * {}'.format(size_per_work_item, work_size)
+        # if we have unique pointers, the work-size is fixed to an integer, and
+        # will already be baked into the size of the array
+        work_size = self.work_size if not self.unique_pointers else 1
 
+        # first, find the size of each argument, and whether it is stored per
+        # work-item, or statically (after all the per work-item data)
+        sizes = {}
+        per_work_item = []
+        static = []
         for arg in args:
-            buffer_size = None
-            offset = None
             # split the shape into the work-item and other dimensions
             isizes, ssizes = utils.partition(arg.shape, lambda x: isinstance(x, int))
             if len(ssizes) >= 1:
                 # check we have a work size in ssizes
-                buffer_size = int(np.prod(isizes) * _get_size(ssizes[0]))
-                # offset must be calculated _before_ updating size_per_work_item
-                offset = _offset()
-                size_per_work_item += buffer_size
-            elif not len(ssizes):
+                sizes[arg.name] = int(np.prod(isizes) * _get_size(ssizes[0]) *
+                                      self.block_size)
+                per_work_item.append(arg)
+            else:
                 # static size
-                buffer_size = int(np.prod(isizes))
-                offset = _offset()
-                ic_dep = False
-                if self.unique_pointers:
+                sizes[arg.name] = int(np.prod(isizes))
+                if self.unique_pointers and arg.name in mapping and \
+                        not mapping[arg.name].is_temporary:
                     # need to test if this is per work-item or not
-                    if arg.name in mapping and not mapping[arg.name].is_temporary:
-                        size_per_work_item += buffer_size
-                        ic_dep = True
-
-                if not ic_dep:
-                    static_size += buffer_size
+                    per_work_item.append(arg)
+                else:
+                    static.append(arg)
+
+        live_ranges = self._get_live_ranges()
+        if live_ranges is not None:
+            # share storage between arrays that are not live at the same time
+            sequential = sum(sizes[arg.name] for arg in per_work_item)
+            start, size_per_work_item = plan_working_buffer(
+                {arg.name: sizes[arg.name] for arg in per_work_item},
+                {arg.name: live_ranges.get(arg.name, (-1, len(self.kernels)))
+                 for arg in per_work_item})
+            logger = logging.getLogger(__name__)
+            logger.info('Working buffer compaction for kernel {}: {} -> {} values '
+                        'per work-item.'.format(self.name, sequential,
+                                                size_per_work_item))
+            for arg in per_work_item:
+                offsets[arg.name] = (arg.dtype, sizes[arg.name], '{} * {}'.format(
+                    start[arg.name], work_size), arg.address_space)
+        else:
+            for arg in per_work_item:
+                offsets[arg.name] = (arg.dtype, sizes[arg.name], '{} * {}'.format(
+                    size_per_work_item, work_size), arg.address_space)
+                size_per_work_item += sizes[arg.name]
 
-            # store offset and increment size
-            offsets[arg.name] = (arg.dtype, buffer_size, offset, arg.address_space)
+        for arg in static:
+            offsets[arg.name] = (arg.dtype, sizes[arg.name], '{} * {} + {}'.format(
+                size_per_work_item, work_size, static_size), arg.address_space)
+            static_size += sizes[arg.name]
 
         return size_per_work_item, static_size, offsets
 
@@ -2237,10 +2662,10 @@ def _get_func_body(cgr, subs={}):
         # split into bodies, preambles, etc.
         for i, k, in enumerate(kernels):
             # todo: hack -- until we have a proper OpenMP target in Loopy, we
-            # need to set the inner work-size dimension to 1
-            # (to avoid an explicit work-size loop)
+            # need to set the inner work-size dimension to the block size
+            # (by default 1, to avoid an explicit work-size loop)
             if self.lang == 'c':
-                k = lp.fix_parameters(k, **{w_size.name: 1})
+                k = lp.fix_parameters(k, **{w_size.name: self.block_size})
 
             # drivers own all their own kernels
             i_own = for_driver or (k.name in owner and owner[k.name] == self)
@@ -2538,6 +2963,8 @@ def _generate_wrapping_kernel(self, path, record=None, result=None,
             if record.host_constants:
                 kernels = self._migrate_host_constants(
                     kernels, record.host_constants)
+            # determine the number of conditions per work-item
+            self._set_block_size(record)
             # generate working buffer
             record, result = self._compress_to_working_buffer(record)
 
@@ -2718,7 +3145,7 @@ def _name(arg):
             if self.unique_pointers:
                 # reset from inner kernel where each pointer had a single
                 # workgroup / thread under consideration
-                offset = '{} * {}'.format(offset, arc.work_size.name)
+                offset = self._scale_unique_offset(offset)
             local_unpacks.append(
                 self._get_pointer_unpack(k, size, offset, dtype, scope,
                                          set_null=any(k == null.name for null
@@ -2727,6 +3154,29 @@ def _name(arg):
 
         return CodegenResult(pointer_unpacks=local_unpacks)
 
+    def _scale_unique_offset(self, offset):
+        """
+        Converts the :param:`offset` of an array in the working buffer for a single
+        work-item (i.e., with :attr:`unique_pointers`, where the work-size is fixed
+        to one) to the offset in the full working buffer of the driver.  Only the
+        per work-item part of the offset (@see :func:`_get_working_buffer`) is
+        scaled by the work-size, as the static data follows all the per work-item
+        data
+
+        Parameters
+        ----------
+        offset: str or int
+            The offset for a single work-item, i.e., '{per_wi} * 1 [+ {static}]'
+
+        Returns
+        -------
+        offset: str
+            The offset in the driver's working buffer
+        """
+
+        return re.sub(r'^(\d+) \* 1\b', r'\1 * {}'.format(arc.work_size.name),
+                      str(offset))
+
     def _generate_driver_kernel(self, path, wrapper_memory, wrapper_result,
                                 callgen):
         """
@@ -2766,12 +3216,17 @@ def _generate_driver_kernel(self, path, wrapper_memory, wrapper_result,
             raise NotImplementedError
 
         our_arg_names = self.in_arrays + self.out_arrays
+        driver_inputs = self.in_arrays[:]
+        if self.loopy_opts.reorder_conditions:
+            # the permutation of the initial conditions is supplied by the user
+            driver_inputs.append(arc.condition_order)
 
         kernels = self._make_kernels(knl_info, for_driver=True,
                                      # mark input / output arrays as un-simdable
                                      # to trigger correct scatter / gather copy
                                      # if necessary
-                                     dont_split=our_arg_names)
+                                     dont_split=our_arg_names + [
+                                        arc.condition_order])
 
         def localfy(kernel):
             """
@@ -2903,6 +3358,8 @@ def _size(a):
 
         filename = self._to_file(path, result, for_driver=True)
 
+        # note: the working buffers are counted by their actual (and, if enabled,
+        # compacted) size per work-item
         max_ic_per_run, max_ws_per_run = mem_limits.can_fit(memory_type.m_global)
         # normalize to divide evenly into vec_width
         if self.vec_width != 0:
@@ -2912,19 +3369,45 @@ def _size(a):
         work_arrays = self.order_kernel_args(
             [self._with_target(p_size)] + work_arrays)
 
+        parameter_path = ''
+        parameter_offsets = {}
+        parameter_size = 0
+        if self.loopy_opts.runtime_parameters and wrapper_memory.host_constants:
+            # serialize the parameter tables, to be loaded by the calling program
+            # (from the build directory, unless relocated via the environment)
+            parameter_path = os.path.abspath(os.path.join(
+                path, self.file_prefix + self.name + '_parameters.bin'))
+            parameter_offsets[self.name], parameter_size = write_parameters(
+                parameter_path, wrapper_memory.host_constants,
+                self.loopy_opts.order)
+
+        condition_thresholds = []
+        if self.loopy_opts.reorder_conditions:
+            # the species' midpoint temperatures, by which the calling program
+            # groups the initial conditions
+            condition_thresholds = [float(x) for x in np.unique(
+                self.namestore.T_mid.initializer)]
+
         # update callgen
         callgen = callgen.copy(name=self.name,
                                source_names=callgen.source_names + [filename],
                                max_ic_per_run=int(max_ic_per_run),
                                max_ws_per_run=int(max_ws_per_run),
-                               input_args={self.name: [
-                                x for x in record.args if x.name in self.in_arrays]},
+                               # with the permutation (if any) leading the
+                               # inputs, as in the python wrapper
+                               input_args={self.name: sorted([
+                                x for x in record.args if x.name in driver_inputs],
+                                key=lambda x: x.name != arc.condition_order)},
                                output_args={self.name: [
                                 x for x in record.args
                                 if x.name in self.out_arrays]},
                                work_arrays=work_arrays,
                                host_constants={
-                                self.name: wrapper_memory.host_constants[:]})
+                                self.name: wrapper_memory.host_constants[:]},
+                               parameter_path=parameter_path,
+                               parameter_offsets=parameter_offsets,
+                               parameter_size=parameter_size,
+                               condition_thresholds=condition_thresholds)
         return callgen
 
     def remove_unused_temporaries(self, knl):
@@ -3022,6 +3505,10 @@ def make_kernel(self, info, target, test_size, for_driver=False):
 
         # find the start index for 'i'
         iname, iname_domain = info.mapstore.get_iname_domain()
+        if info.chunk is not None:
+            # restrict to this kernel's chunk of the loop
+            iname_domain = '{} and {} <= {} <= {}'.format(
+                iname_domain, info.chunk[0], iname, info.chunk[1])
 
         # add to ranges
         iname_range.append(iname_domain)
@@ -3077,6 +3564,7 @@ def subs_preprocess(key, value):
         # check for duplicate kernel data (e.g. multiple phi arguements)
         kernel_data = []
         for k in info.kernel_data + extra_kernel_data:
+            k = self._with_index_type(k)
             if k not in kernel_data:
                 kernel_data.append(k)
 
@@ -3088,7 +3576,11 @@ def subs_preprocess(key, value):
                              target=target,
                              assumptions=' and '.join(assumptions),
                              default_offset=0,
+                             index_dtype=self.loopy_opts.index_dtype,
                              **info.kwargs)
+        if info.chunk is not None:
+            # partition the constant data between the chunks
+            knl = partition_chunk(knl, info.mapstore.iname, *info.chunk)
         # fix parameters
         if info.parameters:
             knl = lp.fix_parameters(knl, **info.parameters)
@@ -3263,9 +3755,13 @@ def get_inames(self, test_size, for_driver=False):
         """
 
         # Currently C has no vectorization capabilities, and unless we're in a driver
-        # function, we should only be executing the kernel once, hence:
+        # function, we should only be executing the kernel once per condition in
+        # the thread's block, hence:
 
         if not (for_driver or self.for_testing):
+            if self.tiled:
+                # the work-size is fixed to the block size on merging
+                return [global_ind], ['0 <= {} < {}'.format(global_ind, w_size.name)]
             return [global_ind], ['0 <= {} < 1'.format(global_ind)]
 
         if not self.for_testing:
@@ -3273,6 +3769,61 @@ def get_inames(self, test_size, for_driver=False):
 
         return [global_ind],  ['0 <= {} < {}'.format(global_ind, test_size)]
 
+    @property
+    def tiled(self):
+        """
+        Returns True if each OpenMP thread of the lockstep driver evaluates a block
+        of conditions (:attr:`loopy_options.driver_block_size`) per call
+        """
+        return bool(self.loopy_opts.driver_block_size) and not (
+            self.for_testing or self.unique_pointers) and \
+            self.driver_type == DriverType.lockstep
+
+    def _set_block_size(self, record):
+        """
+        Determine the number of conditions evaluated by each OpenMP thread per call
+        to the generated kernel.  If :attr:`loopy_options.driver_block_size` is
+        'auto', this is chosen such that the thread's working buffer fits in the
+        L2 cache of the host, @see :func:`driver_kernels.get_block_size`.
+
+        The block size is shared by all dependencies of this generator, as they
+        use the same working buffer.
+
+        Parameters
+        ----------
+        record: :class:`MemoryGenerationResult`
+            The memory record of the processed kernel arguments
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.tiled:
+            return
+
+        block_size = self.loopy_opts.driver_block_size
+        if block_size == 'auto':
+            from pyjac.core.driver_kernels import get_block_size
+            # find the working buffer size per-condition
+            per_condition = 0
+            for arg in record.args + record.local:
+                isizes, ssizes = utils.partition(
+                    arg.shape, lambda x: isinstance(x, int))
+                if any(w_size.name in str(x) for x in ssizes):
+                    per_condition += int(np.prod(isizes)) * arg.dtype.itemsize
+            cache_size = get_cache_size(2)
+            if cache_size is None:
+                cache_size = 256 * 1024
+            block_size = get_block_size(per_condition, cache_size)
+            logger = logging.getLogger(__name__)
+            logger.info('Using a driver block size of {} conditions for kernel {} '
+                        '({} bytes per condition, {} byte L2 cache).'.format(
+                            block_size, self.name, per_condition, cache_size))
+
+        for gen in self._get_deps(include_self=True):
+            gen._block_size = int(block_size)
+
     def _get_pointer_unpack(self, array, size, offset, dtype, scope=scopes.GLOBAL,
                             set_null=False, for_driver=False):
         """
@@ -3475,7 +4026,8 @@ def target_preambles(self):
         #ifndef work_size
             #define work_size (({int_type}) get_num_groups(0))
         #endif
-        """.format(int_type=self.type_map[to_loopy_type(arc.kint_type)])
+        """.format(int_type=self.type_map[to_loopy_type(
+            self.loopy_opts.index_dtype)])
 
         return [work_size]
 
@@ -3775,6 +4327,13 @@ class knl_info(object):
         kernel splits are applied
     unrolled_vector : bool [False]
         If true, apply 'unr' instead of 'vec' to any resulting explicit-SIMD iname
+    chunk : tuple of (int, int) [None]
+        If supplied, the (inclusive) range of the inner loop evaluated by this
+        kernel, @see :func:`chunk_kernels`
+    chunkable : bool [True]
+        If False, the iterations of the inner loop depend on each other (e.g.,
+        through an accumulator completed in the :param:`post_instructions`), such
+        that the kernel must not be split by :func:`chunk_kernels`
     **kwargs: dict
         Any other keyword args to pass to :func:`loopy.make_kernel`
     """
@@ -3792,6 +4351,8 @@ def __init__(self, name, instructions, mapstore, pre_instructions=[],
                  split_specializer=None,
                  unrolled_vector=False,
                  preambles=[],
+                 chunk=None,
+                 chunkable=True,
                  **kwargs):
 
         def __listify(arr):
@@ -3830,6 +4391,8 @@ def __listify(arr):
         self.iname_domain_override = iname_domain_override[:]
         self.kwargs = kwargs.copy()
         self.unrolled_vector = unrolled_vector
+        self.chunk = chunk
+        self.chunkable = chunkable
 
 
 def create_function_mangler(kernel, return_dtypes=()):
@@ -259,12 +259,22 @@ def __calculate_alloc_limit(limit):
             return np.minimum(limit, np.floor(
                 self.limits[memory_type.m_alloc] / size))
 
+        def __work_size_terms(dim):
+            # split a work-size dependent dimension, e.g., that of a working
+            # buffer: 'static + work_size * per_work_item' into the size per
+            # work-item and the static size
+            from pymbolic import parse, evaluate
+            expr = parse(str(dim))
+            fixed = evaluate(expr, {w_size.name: 0})
+            return evaluate(expr, {w_size.name: 1}) - fixed, fixed
+
         per_ic = 0
         per_ws = 0
         static = 0
         logger = logging.getLogger(__name__)
         for array in arrays:
             size = 1
+            fixed = 0
             is_ic_dep = False
             is_ws_dep = False
             for s in array.shape:
@@ -280,6 +290,11 @@ def __calculate_alloc_limit(limit):
                     if floor_div:
                         floor_div = int(floor_div.group(1))
                         size /= floor_div
+                    elif is_ws_dep and w_size.name in str(s):
+                        # use the actual per work-item size of the dimension
+                        # (e.g., of a possibly compacted working buffer)
+                        per_work_item, fixed = __work_size_terms(s)
+                        size *= per_work_item
                     continue
                 # update size
                 size *= s
@@ -291,6 +306,7 @@ def __calculate_alloc_limit(limit):
                 per_ic += size
             elif is_ws_dep:
                 per_ws += size
+                static += fixed * array.dtype.itemsize
             else:
                 static += size
 
@@ -349,8 +365,9 @@ def get_limits(loopy_opts, arrays, input_file='',
         Parameters
         ----------
         loopy_opts: :class:`loopy_options`
-            If loopy_opts.lang == 'opencl', pyopencl will be used to fill in any
-            missing limits
+            Used to discover the default limits of the targeted device, see
+            :func:`discover_limits`.  Any limits specified in the
+            :param:`input_file` override the discovered values
         arrays: dict
             A mapping of :class:`memory_type` to :class:`loopy.TemporaryVariable` or
             :class:`loopy.GlobalArg`, representing the types of all arrays to be
@@ -374,17 +391,7 @@ def get_limits(loopy_opts, arrays, input_file='',
             'global', 'constant' and 'local' memory available on the device
         """
 
-        limits = {}  # {memory_type.m_pagesize: align_size}
-        if loopy_opts.lang == 'opencl':
-            try:
-                limits.update({
-                    memory_type.m_global: loopy_opts.device.global_mem_size,
-                    memory_type.m_constant:
-                        loopy_opts.device.max_constant_buffer_size,
-                    memory_type.m_local: loopy_opts.device.local_mem_size,
-                    memory_type.m_alloc: loopy_opts.device.max_mem_alloc_size})
-            except AttributeError:
-                pass
+        limits = discover_limits(loopy_opts)
         user = load_memory_limits(input_file)
         # find limit(s) that applies to us
         user = [u for u in user if 'platforms' not in u or
@@ -430,6 +437,148 @@ def get_limits(loopy_opts, arrays, input_file='',
                              limits, string_strides, dtype, limit_int_overflow)
 
 
+def get_host_memory_limit(meminfo='/proc/meminfo',
+                          cgroups=['/sys/fs/cgroup/memory.max',
+                                   '/sys/fs/cgroup/memory/memory.limit_in_bytes']):
+    """
+    Determine the amount of memory available to pyJac on the host, i.e., the
+    smaller of the total system memory and the memory limit of our control group
+    (if any).
+
+    Notes
+    -----
+    The total (rather than the currently available) memory is used, such that
+    the generated limits do not depend on the momentary load of the host
+
+    Parameters
+    ----------
+    meminfo: str ['/proc/meminfo']
+        The path to read the system memory information from
+    cgroups: list of str
+        The paths to the (v2, and v1, respectively) control group memory limits
+
+    Returns
+    -------
+    limit: int or None
+        The host memory limit in bytes, or None if it could not be determined
+    """
+
+    limit = None
+    try:
+        with open(meminfo, 'r') as file:
+            info = {}
+            for line in file:
+                match = re.match(r'^(\w+):\s+(\d+)\s*kB', line)
+                if match:
+                    info[match.group(1)] = int(match.group(2)) * 1024
+        limit = info.get('MemTotal')
+    except (IOError, OSError):
+        pass
+
+    for cgroup in cgroups:
+        try:
+            with open(cgroup, 'r') as file:
+                value = file.read().strip()
+        except (IOError, OSError):
+            continue
+        # unlimited cgroups are reported as 'max' (v2) or a near-int64 max (v1)
+        if not value.isdigit() or int(value) >= np.iinfo(np.int64).max // 2:
+            continue
+        limit = int(value) if limit is None else min(limit, int(value))
+
+    return limit
+
+
+def get_cache_size(level=2, cache_dir='/sys/devices/system/cpu/cpu0/cache'):
+    """
+    Determine the size of the (data or unified) CPU cache of the given
+    :param:`level` on the host
+
+    Parameters
+    ----------
+    level: int [2]
+        The cache level to query
+    cache_dir: str ['/sys/devices/system/cpu/cpu0/cache']
+        The path to read the cache information from
+
+    Returns
+    -------
+    size: int or None
+        The cache size in bytes, or None if it could not be determined
+    """
+
+    import os
+    units = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+    def __read(index, name):
+        with open(os.path.join(cache_dir, index, name), 'r') as file:
+            return file.read().strip()
+
+    try:
+        indicies = sorted(x for x in os.listdir(cache_dir) if x.startswith('index'))
+    except (IOError, OSError):
+        return None
+
+    for index in indicies:
+        try:
+            if int(__read(index, 'level')) != level or \
+                    __read(index, 'type') == 'Instruction':
+                continue
+            match = re.match(r'^(\d+)\s*([KMG]?)', __read(index, 'size'))
+        except (IOError, OSError, ValueError):
+            continue
+        if match:
+            return int(match.group(1)) * units[match.group(2)]
+
+    return None
+
+
+def discover_limits(loopy_opts):
+    """
+    Discover the default memory limits of the device targeted by
+    :param:`loopy_opts`.
+
+    For OpenCL, the device's global, constant, local and maximum allocation sizes
+    are queried via :mod:`pyopencl` (if available).  For C, the global memory is
+    limited to the host memory (capped by our control group's limit), see
+    :func:`get_host_memory_limit`
+
+    Parameters
+    ----------
+    loopy_opts: :class:`loopy_options`
+        The options describing the targeted language / device
+
+    Returns
+    -------
+    limits: dict
+        A mapping of :class:`memory_type` to the discovered limit in bytes.
+        Limits that could not be determined are omitted.
+    """
+
+    limits = {}  # {memory_type.m_pagesize: align_size}
+    if loopy_opts.lang == 'opencl':
+        try:
+            limits.update({
+                memory_type.m_global: loopy_opts.device.global_mem_size,
+                memory_type.m_constant:
+                    loopy_opts.device.max_constant_buffer_size,
+                memory_type.m_local: loopy_opts.device.local_mem_size,
+                memory_type.m_alloc: loopy_opts.device.max_mem_alloc_size})
+        except AttributeError:
+            pass
+    elif loopy_opts.lang == 'c':
+        host = get_host_memory_limit()
+        if host is not None:
+            limits[memory_type.m_global] = host
+
+    if limits:
+        logger = logging.getLogger(__name__)
+        logger.debug('Discovered memory-limits: {}'.format(', '.join(
+            '{}: {} B'.format(str(k)[str(k).index('.') + 3:], int(v))
+            for k, v in sorted(limits.items(), key=lambda x: x[0].name))))
+    return limits
+
+
 def get_string_strides():
     """
     Stride names we might see in variable indexing
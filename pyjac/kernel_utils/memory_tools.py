@@ -211,7 +211,8 @@ def get_signature(self, device, arr):
     def lang(self, device):
         return self.host_lang if not device else self.device_lang
 
-    def define(self, device, arr, host_constant=False, force_no_const=False):
+    def define(self, device, arr, host_constant=False, force_no_const=False,
+               parameters=None):
         """
         Declare a host or device array
 
@@ -226,6 +227,11 @@ def define(self, device, arr, host_constant=False, force_no_const=False):
         force_no_const: bool [False]
             Used for testing -- define a host constant w/o applying the const
             attribute
+        parameters: tuple of (str, int) [None]
+            If supplied (with :param:`host_constant`), the host constant is
+            instead defined as a pointer into the runtime-loaded parameter blob,
+            given as the name of the (char) pointer to the blob, and the byte
+            offset of the constant in the blob
         """
 
         if host_constant:
@@ -238,6 +244,12 @@ def define(self, device, arr, host_constant=False, force_no_const=False):
         name = self.get_name(device, arr)
         dtype = self.mem_type[self.lang(device)](arr)
 
+        if host_constant and parameters is not None:
+            blob, offset = parameters
+            return 'const {dtype}* {name} = (const {dtype}*)({blob} + {offset});'\
+                .format(dtype=self.type_map[arr.dtype], name=name, blob=blob,
+                        offset=offset)
+
         if host_constant:
             init = arr.initializer.flatten(self.order)
             size = init.shape[0]
@@ -1,3 +1,4 @@
-from pyjac.libgen.libgen import generate_library, lib_ext, get_toolchain, compile
+from pyjac.libgen.libgen import generate_library, lib_ext, get_toolchain, compile,\
+    object_cache
 
-__all__ = ['generate_library', 'lib_ext', 'get_toolchain', 'compile']
+__all__ = ['generate_library', 'lib_ext', 'get_toolchain', 'compile', 'object_cache']
@@ -53,6 +53,20 @@
                              'executable shared library (cannot be supplied w/ '
                              '--static switch)')
 
+    parser.add_argument('-j', '--jobs',
+                        required=False,
+                        type=int,
+                        default=None,
+                        help='The number of files to compile in parallel, defaults '
+                             'to the number of CPUs.')
+    parser.add_argument('-c', '--cache_dir',
+                        required=False,
+                        type=str,
+                        default=None,
+                        help='The directory to cache compiled objects in, such '
+                             'that unchanged files are not rebuilt.')
+
     args = parser.parse_args()
     generate_library(args.lang, args.source_dir, args.obj_dir, args.out_dir,
-                     not args.static, args.kernel_type, args.executable)
+                     not args.static, args.kernel_type, args.executable,
+                     jobs=args.jobs, cache_dir=args.cache_dir)
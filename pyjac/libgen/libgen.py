@@ -4,6 +4,11 @@
 
 import os
 import logging
+import hashlib
+import shutil
+import subprocess
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import six
 
 from codepy.toolchain import GCCToolchain
@@ -72,15 +77,15 @@ def get_toolchain(lang, shared=True, executable=True, **kwargs):
     **kwargs:
     """
 
-    # compilation flags
-    compile_flags = opt_flags
+    # compilation flags -- copy, as we modify these below
+    compile_flags = opt_flags[:]
     from pyjac.utils import get_env_val
     # read debug flag from ENV or config
     if get_env_val('debug'):
-        compile_flags = debug_flags
+        compile_flags = debug_flags[:]
 
     # link flags
-    linkflags = ldflags[lang]
+    linkflags = ldflags[lang][:]
     if shared and not executable:
         linkflags += shared_flags[lang]
         compile_flags += shared_flags[lang]
@@ -179,7 +184,101 @@ def get_file_list(source_dir, lang, ktype, file_base=None):
     return i_dirs, files
 
 
-def compile(lang, toolchain, files, source_dir='', obj_dir=''):
+class object_cache(object):
+    """
+    A content-addressed cache of compiled object files, keyed on the
+    preprocessed source and the compiler command, such that unchanged translation
+    units (e.g., the error checking, timing and initial condition reading
+    files common to all mechanisms) are never rebuilt
+
+    Parameters
+    ----------
+    cache_dir: str
+        The directory to store the cached object files in
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+        utils.create_dir(self.cache_dir)
+
+    def key(self, preprocessed, flags):
+        """
+        Returns the cache key for the given preprocessed source and compiler flags
+
+        Parameters
+        ----------
+        preprocessed: bytes
+            The preprocessed source code
+        flags: list of str
+            The compiler and all flags that affect the generated object code
+
+        Returns
+        -------
+        key: str
+            The cache key
+        """
+        hasher = hashlib.sha256()
+        hasher.update(' '.join(flags).encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(preprocessed)
+        return hasher.hexdigest()
+
+    def _path(self, key, o_ext='.o'):
+        return os.path.join(self.cache_dir, key + o_ext)
+
+    def fetch(self, key, obj_file):
+        """
+        Copies the cached object for :param:`key` (if any) to :param:`obj_file`
+
+        Returns
+        -------
+        found: bool
+            True if the object was found in the cache
+        """
+        if key is None:
+            return False
+        cached = self._path(key, os.path.splitext(obj_file)[1])
+        if not os.path.isfile(cached):
+            return False
+        shutil.copyfile(cached, obj_file)
+        return True
+
+    def store(self, key, obj_file):
+        """
+        Stores the compiled :param:`obj_file` in the cache under :param:`key`
+        """
+        if key is None:
+            return
+        cached = self._path(key, os.path.splitext(obj_file)[1])
+        # copy to a temporary file first and rename, such that concurrent builds
+        # never see a partially written object
+        temp = '{}.{}.tmp'.format(cached, os.getpid())
+        shutil.copyfile(obj_file, temp)
+        os.rename(temp, cached)
+
+
+def _toolchain_key(cache, toolchain, source):
+    """
+    Returns the :class:`object_cache` key for the :param:`source` file compiled with
+    the given :param:`toolchain`, or None if the file could not be preprocessed
+    """
+
+    flags = [toolchain.cc] + toolchain.cflags + \
+        ['-D{}'.format(x) for x in toolchain.defines] + \
+        ['-U{}'.format(x) for x in toolchain.undefines]
+    cmd = flags + ['-I{}'.format(x) for x in toolchain.include_dirs] + \
+        ['-E', '-P', source]
+    try:
+        with open(os.devnull, 'w') as devnull:
+            preprocessed = subprocess.check_output(cmd, stderr=devnull)
+    except (subprocess.CalledProcessError, OSError):
+        # let the compiler report the error
+        return None
+    return cache.key(preprocessed, flags)
+
+
+def compile(lang, toolchain, files, source_dir='', obj_dir='', jobs=None,
+            cache_dir=None):
     """
     Compiles the source files with the given toolchain
 
@@ -196,6 +295,12 @@ def compile(lang, toolchain, files, source_dir='', obj_dir=''):
         If specified, the base directory the source files are located in
     obj_dir: str ['']
         If specified, place the object files in this directory
+    jobs: int [None]
+        The number of files to compile in parallel.  If not specified, the number
+        of CPUs on this machine
+    cache_dir: str [None]
+        If specified, use an :class:`object_cache` in this directory to avoid
+        rebuilding unchanged translation units
 
     Returns
     -------
@@ -208,28 +313,69 @@ def compile(lang, toolchain, files, source_dir='', obj_dir=''):
     """
 
     extension = utils.file_ext[lang]
+    cache = object_cache(cache_dir) if cache_dir else None
+    sources = []
     obj_files = []
     for file in files:
+        # get source file
+        if not source_dir:
+            file_base = os.path.basename(file[:file.index(extension)])
+        else:
+            file_base = file[:file.index(extension)]
+            file = os.path.join(source_dir, file)
+
+        # get object file
+        obj_file = file_base + toolchain.o_ext
+        if obj_dir:
+            obj_file = os.path.join(obj_dir, obj_file)
+        sources.append(file)
+        obj_files.append(obj_file)
+
+    def __compile(index):
+        file, obj_file = sources[index], obj_files[index]
+        key = None
+        if cache is not None:
+            key = _toolchain_key(cache, toolchain, file)
+            if cache.fetch(key, obj_file):
+                logger = logging.getLogger(__name__)
+                logger.debug('Using cached object for file: {}'.format(file))
+                return None
         try:
-            # get source file
-            if not source_dir:
-                file_base = os.path.basename(file[:file.index(extension)])
-            else:
-                file_base = file[:file.index(extension)]
-                file = os.path.join(source_dir, file)
-
-            # get object file
-            obj_file = file_base + toolchain.o_ext
-            if obj_dir:
-                obj_file = os.path.join(obj_dir, obj_file)
-            obj_files.append(obj_file)
-
-            # compile
-            toolchain.build_object(obj_files[-1], [file])
+            toolchain.build_object(obj_file, [file])
         except CompileError as e:
-            logger = logging.getLogger(__name__)
-            logger.error('Error compiling file: {}'.format(file))
-            raise CompilationError(file)
+            return str(e)
+        if cache is not None:
+            cache.store(key, obj_file)
+        return None
+
+    # start the largest files first, as they dominate the build time
+    def __size(index):
+        try:
+            return os.path.getsize(sources[index])
+        except OSError:
+            return 0
+    order = sorted(range(len(sources)), key=__size, reverse=True)
+
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    jobs = max(1, min(jobs, len(sources)))
+    if jobs == 1:
+        errors = [__compile(i) for i in order]
+    else:
+        # the compiler runs in a subprocess, so threads suffice here
+        pool = ThreadPool(jobs)
+        try:
+            errors = pool.map(__compile, order)
+        finally:
+            pool.close()
+            pool.join()
+
+    failed = [(sources[i], err) for i, err in zip(order, errors) if err is not None]
+    if failed:
+        logger = logging.getLogger(__name__)
+        for file, err in failed:
+            logger.error('Error compiling file: {}\n{}'.format(file, err))
+        raise CompilationError([file for file, _ in failed])
 
     return obj_files
 
@@ -281,7 +427,8 @@ def link(toolchain, obj_files, libname, lib_dir=''):
 
 
 def generate_library(lang, source_dir, obj_dir=None, out_dir=None, shared=None,
-                     ktype=KernelType.jacobian, as_executable=False, **kwargs):
+                     ktype=KernelType.jacobian, as_executable=False, jobs=None,
+                     cache_dir=None, **kwargs):
     """Generate shared/static library for pyJac files.
 
     Parameters
@@ -303,6 +450,13 @@ def generate_library(lang, source_dir, obj_dir=None, out_dir=None, shared=None,
     as_executable: bool [False]
         If true, the generated library should use the '-fPIE' flag (or equivalent)
         to be executable
+    jobs: int [None]
+        The number of files to compile in parallel, defaults to the number of CPUs
+    cache_dir: str [None]
+        The directory of the object cache, used to avoid rebuilding unchanged
+        translation units.  If not specified, the environment / test-config value
+        of 'object_cache' is used, and if that is empty, a 'cache' directory
+        inside the :param:`obj_dir`
 
     Keyword Arguments
     -----------------
@@ -356,10 +510,16 @@ def generate_library(lang, source_dir, obj_dir=None, out_dir=None, shared=None,
     toolchain = get_toolchain(lang, shared, as_executable)
     toolchain = toolchain.copy(include_dirs=toolchain.include_dirs + i_dirs)
 
+    if cache_dir is None:
+        cache_dir = utils.get_env_val('object_cache', '')
+    if not cache_dir:
+        cache_dir = os.path.join(obj_dir, 'cache')
+
     # compile
     ext = utils.file_ext[lang]
     obj_files = compile(lang, toolchain, [x + ext for x in files],
-                        source_dir=source_dir, obj_dir=obj_dir)
+                        source_dir=source_dir, obj_dir=obj_dir, jobs=jobs,
+                        cache_dir=cache_dir)
 
     # and link
     if lang == 'opencl':
@@ -131,6 +131,58 @@ class loopy_options(object):
         codes an that have already been parallelized.
     explicit_simd: bool [False]
         Attempt to utilize explict-SIMD instructions in OpenCL
+    spec_rates_gather : bool [False]
+        If True, evaluate the species production rates by gathering the net rates
+        of progress of each species' reactions, rather than scattering each
+        reaction's net rate of progress to its species.  The gather form is free
+        of write-races, and hence needs no atomics for deep-vectorization
+    T_invariants : bool [False]
+        If True, evaluate the (guarded) temperature, its inverse and logarithm
+        once per condition into a shared block of the working buffer, from which
+        the rate constant, falloff and thermodynamic kernels read
+    thermo_table_tol : float [None]
+        If supplied, evaluate the species thermodynamic properties and the
+        equilibrium constants by cubic interpolation in uniform temperature
+        tables, built at generation time to satisfy this (relative) error
+        tolerance.  @see :mod:`pyjac.core.thermo_tables`
+    reorder_conditions : bool [False]
+        If True, the driver kernel gathers the conditions into (and scatters the
+        results from) the working buffer in the order given by a user-supplied
+        permutation, e.g., grouping conditions that take the same temperature
+        branches, @see :func:`pyjac.core.driver_kernels.condition_order`
+    max_reactions_per_kernel : int [None]
+        If supplied, kernels that loop over more than this number of reactions
+        (or species, etc.) are split into a sequence of kernels, each evaluating a
+        contiguous chunk of the loop with its own partition of the mechanism data,
+        @see
+        :func:`pyjac.kernel_utils.kernel_gen.chunk_kernels`
+    runtime_parameters : bool [False]
+        If True, the mechanism parameter tables (rate parameters, thermodynamic
+        coefficients, index maps, etc.) are serialized into a binary file that is
+        loaded by the calling program at initialization, rather than compiled
+        into the generated source.  The file is read from the build directory,
+        unless overridden by the calling program via the environment, @see
+        :func:`pyjac.kernel_utils.kernel_gen.write_parameters` and
+        :func:`pyjac.kernel_utils.kernel_gen.parameter_path_variable`
+    compact_working_buffer : bool [False]
+        If True, arrays in the working buffer whose lifetimes (over the ordered
+        sub-kernels) do not overlap share storage, @see
+        :func:`pyjac.kernel_utils.kernel_gen.plan_working_buffer`
+    index_type : {'int32', 'int64'} ['int32']
+        The integer type used for index arithmetic in the generated kernels
+        (i.e., strides over the initial conditions).  The species / reaction maps
+        are always stored as :attr:`pyjac.core.array_creator.kint_type`.
+        A 64-bit index type lifts the limit on the number of initial conditions
+        that may be evaluated per-run to avoid integer overflow, @see
+        :attr:`limit_int_overflow`
+    driver_block_size : int or 'auto' [None]
+        If supplied, each OpenMP thread in the C lockstep driver evaluates a block
+        of this many conditions through each sub-kernel (rather than a single
+        condition).  If 'auto', the block size is chosen such that a thread's
+        working buffer fits in the L2 cache, @see
+        :func:`pyjac.core.driver_kernels.get_block_size`
+    driver_schedule : {'static', 'dynamic', 'guided'} ['static']
+        The OpenMP schedule of the C lockstep driver loop
     """
     def __init__(self, width=None, depth=None, ilp=False, unr=None,
                  lang='opencl', order='C', rate_spec=RateSpecialization.fixed,
@@ -139,7 +191,12 @@ def __init__(self, width=None, depth=None, ilp=False, unr=None,
                  use_atomic_doubles=True, use_atomic_ints=True,
                  jac_type=JacobianType.exact, jac_format=JacobianFormat.full,
                  device=None, device_type=None, is_simd=None,
-                 unique_pointers=False, explicit_simd=None):
+                 unique_pointers=False, explicit_simd=None,
+                 spec_rates_gather=False, T_invariants=False, thermo_table_tol=None,
+                 reorder_conditions=False, max_reactions_per_kernel=None,
+                 runtime_parameters=False, compact_working_buffer=False,
+                 index_type='int32', driver_block_size=None,
+                 driver_schedule='static'):
         self.width = width
         self.depth = depth
         if not utils.can_vectorize_lang[lang]:
@@ -157,6 +214,23 @@ def __init__(self, width=None, depth=None, ilp=False, unr=None,
         self.rate_spec = utils.to_enum(rate_spec, RateSpecialization)
         self.rate_spec_kernels = rate_spec_kernels
         self.rop_net_kernels = rop_net_kernels
+        self.spec_rates_gather = spec_rates_gather
+        self.T_invariants = T_invariants
+        self.thermo_table_tol = thermo_table_tol
+        self.reorder_conditions = reorder_conditions
+        self.max_reactions_per_kernel = max_reactions_per_kernel
+        self.runtime_parameters = runtime_parameters
+        self.compact_working_buffer = compact_working_buffer
+        assert index_type in ['int32', 'int64'], (
+            'Unknown index type: {}'.format(index_type))
+        self.index_type = index_type
+        assert driver_block_size is None or driver_block_size == 'auto' or (
+            int(driver_block_size) >= 1), (
+            'Invalid driver block size: {}'.format(driver_block_size))
+        self.driver_block_size = driver_block_size
+        assert driver_schedule in ['static', 'dynamic', 'guided'], (
+            'Unknown driver schedule: {}'.format(driver_schedule))
+        self.driver_schedule = driver_schedule
         self.platform = platform
         self.device_type = device_type
         self.device = device
@@ -222,6 +296,13 @@ def __init__(self, width=None, depth=None, ilp=False, unr=None,
         # check for broken vectorizations
         self.raise_on_broken()
 
+    @property
+    def index_dtype(self):
+        """
+        The :class:`numpy.dtype` used for index arithmetic in the generated kernels
+        """
+        return np.dtype(self.index_type)
+
     @property
     def limit_int_overflow(self):
         """
@@ -837,8 +918,9 @@ def fcn(self, arg_name):
                     ...
             and returns True iff this arg_name should be used
         strict_name_match : bool, optional
-            If true, only kernels exactly matching this name will be excecuted
-            Defaut is False
+            If true, only kernels exactly matching this name (or the chunks of such
+            a kernel, @see :func:`pyjac.kernel_utils.kernel_gen.chunk_kernels`)
+            will be excecuted.  Defaut is False
         chain : function, optional
             If not None, a function of signature similar to:
                 def fcn(self, out_values):
@@ -935,7 +1017,8 @@ def is_my_kernel(self, knl):
         """
 
         if self.strict_name_match:
-            return self.name == knl.name
+            return self.name == knl.name or re.match(
+                r'^{}_chunk\d+$'.format(re.escape(self.name)), knl.name) is not None
         return True
 
     def set_state(self, array_splitter, order='F',
@@ -39,6 +39,18 @@ def main(args=None):
                                  'for each mechanism in the working_directory.'
                                  'This can be a helpful tool on a cluster to '
                                  'run multiple tests at once on different platforms')
+        parser.add_argument('-j', '--num_jobs',
+                            type=int,
+                            default=1,
+                            help='The number of test configurations to generate, '
+                                 'compile and run concurrently in separate worker '
+                                 'processes.')
+        parser.add_argument('-c', '--max_cores',
+                            type=int,
+                            default=None,
+                            help='The total number of cores that concurrently '
+                                 'running test configurations may use. Defaults '
+                                 'to the number of physical cores.')
         args = parser.parse_args()
         methods = []
         if args.runtype == 'jac':
@@ -49,7 +61,8 @@ def main(args=None):
             methods = [species_performance_tester, jacobian_performance_tester]
 
         for m in methods:
-            m(args.working_directory, args.test_matrix, args.prefix)
+            m(args.working_directory, args.test_matrix, args.prefix,
+              num_jobs=args.num_jobs, max_cores=args.max_cores)
 
 
 if __name__ == '__main__':
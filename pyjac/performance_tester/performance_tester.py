@@ -243,7 +243,7 @@ def run(self, state, dirs, phi_path, data_output, limits={}):
 
 @nottest
 def species_performance_tester(work_dir='performance', test_matrix=None,
-                               prefix=''):
+                               prefix='', num_jobs=1, max_cores=None):
     """Runs performance testing of the species rates kernel for pyJac
 
     Parameters
@@ -254,6 +254,12 @@ def species_performance_tester(work_dir='performance', test_matrix=None,
         The testing matrix file, specifing the configurations to test
     prefix: str
         a prefix within the work directory to store the output of this run
+    num_jobs: int [1]
+        The number of test states to run concurrently, see
+        :func:`_run_mechanism_tests`
+    max_cores: int [None]
+        The number of cores available to concurrent test states, see
+        :func:`_run_mechanism_tests`
 
     Returns
     -------
@@ -270,12 +276,13 @@ def species_performance_tester(work_dir='performance', test_matrix=None,
 
     _run_mechanism_tests(work_dir, test_matrix, prefix,
                          performance_runner(KernelType.species_rates),
-                         raise_on_missing=raise_on_missing)
+                         raise_on_missing=raise_on_missing,
+                         num_jobs=num_jobs, max_cores=max_cores)
 
 
 @nottest
 def jacobian_performance_tester(work_dir='performance',  test_matrix=None,
-                                prefix=''):
+                                prefix='', num_jobs=1, max_cores=None):
     """Runs performance testing of the jacobian kernel for pyJac
 
     Parameters
@@ -286,6 +293,12 @@ def jacobian_performance_tester(work_dir='performance',  test_matrix=None,
         The testing matrix file, specifing the configurations to test
     prefix: str
         a prefix within the work directory to store the output of this run
+    num_jobs: int [1]
+        The number of test states to run concurrently, see
+        :func:`_run_mechanism_tests`
+    max_cores: int [None]
+        The number of cores available to concurrent test states, see
+        :func:`_run_mechanism_tests`
 
     Returns
     -------
@@ -302,4 +315,5 @@ def jacobian_performance_tester(work_dir='performance',  test_matrix=None,
 
     _run_mechanism_tests(work_dir, test_matrix, prefix,
                          performance_runner(KernelType.jacobian),
-                         raise_on_missing=raise_on_missing)
+                         raise_on_missing=raise_on_missing,
+                         num_jobs=num_jobs, max_cores=max_cores)
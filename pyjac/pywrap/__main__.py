@@ -34,6 +34,15 @@
                         help='The type of library to build: {type}'.format(
                             type=str(utils.EnumType(KernelType))))
 
+    parser.add_argument('-ro', '--reorder_conditions',
+                        required=False,
+                        default=False,
+                        action='store_true',
+                        help='Set if the library was generated with reordered '
+                             'initial conditions, such that the wrapper takes '
+                             "the permutation (the 'condition_order' input) as "
+                             'its first argument.')
+
     args = parser.parse_args()
     pywrap(args.lang, args.source_dir, args.out_dir,
-           ktype=args.kernel_type)
+           ktype=args.kernel_type, reorder_conditions=args.reorder_conditions)
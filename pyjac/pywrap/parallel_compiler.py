@@ -1,12 +1,44 @@
 """Module for performing parallel compilation of source code files.
 """
 
+import os
+import subprocess
+import threading
 import multiprocessing
-from multiprocessing import Pool
-import distutils.ccompiler
+from multiprocessing.pool import ThreadPool
+from distutils.errors import CompileError
+from distutils.unixccompiler import UnixCCompiler
 
 N = multiprocessing.cpu_count()
 
+
+def _get_cache(output_dir):
+    """
+    Returns the :class:`pyjac.libgen.object_cache` to use for this build, stored
+    in the environment / test-config value of 'object_cache' if specified, or
+    a 'cache' directory in the :param:`output_dir` otherwise
+    """
+    from pyjac.libgen.libgen import object_cache
+    from pyjac.utils import get_env_val
+
+    cache_dir = get_env_val('object_cache', '')
+    if not cache_dir:
+        cache_dir = os.path.join(output_dir or os.getcwd(), 'cache')
+    return object_cache(cache_dir)
+
+
+def _run(cmd):
+    """
+    Run the command, returning the (combined) output on failure, or None
+    on success
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output, _ = proc.communicate()
+    if proc.returncode != 0:
+        return '{}\n{}'.format(' '.join(cmd), output.decode('utf-8', 'replace'))
+    return None
+
+
 # monkey-patch for parallel compilation
 def parallel_compile(self, sources, output_dir=None, macros=None,
                      include_dirs=None, debug=False, extra_preargs=None,
@@ -14,6 +46,11 @@ def parallel_compile(self, sources, output_dir=None, macros=None,
                      ):
     """Compile source files in parallel.
 
+    Unchanged sources are retrieved from an object cache (keyed on the
+    preprocessed source and compiler command) rather than rebuilt.
+    All compilations are run to completion before the first failure (if any) is
+    raised, along with the compiler output.
+
     Parameters
     ----------
     sources : list of `str`
@@ -38,6 +75,11 @@ def parallel_compile(self, sources, output_dir=None, macros=None,
     objects : list of `str`
         List of object files generated
 
+    Raises
+    ------
+    CompileError
+        If any source file fails to compile
+
     """
     # those lines are copied from distutils.ccompiler.CCompiler directly
     macros, objects, extra_postargs, pp_opts, build = self._setup_compile(
@@ -45,20 +87,61 @@ def parallel_compile(self, sources, output_dir=None, macros=None,
         )
     cc_args = self._get_cc_args(pp_opts, debug, extra_preargs)
 
-    # number of parallel compilations
+    # we can only run (and cache) the compiler command directly for unmodified
+    # unix compilers, the customized compilers (e.g., for nvcc) may modify the
+    # compiler state during compilation, and hence must be run serially
+    direct = isinstance(self, UnixCCompiler) and \
+        '_compile' not in self.__dict__ and isinstance(extra_postargs, list)
+    cache = _get_cache(output_dir) if direct else None
+    lock = threading.Lock()
 
     def _single_compile(obj):
-        """Compile single file.
+        """Compile single file, returning the compiler output on failure
         """
         try:
             src, ext = build[obj]
         except KeyError:
-            return
-        self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+            return None
+        if not direct:
+            with lock:
+                try:
+                    self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+                except CompileError as e:
+                    return str(e)
+            return None
+
+        self.mkpath(os.path.dirname(obj))
+        flags = self.compiler_so + cc_args + extra_postargs
+        key = None
+        try:
+            preprocessed = subprocess.check_output(
+                [x for x in flags if x != '-c'] + ['-E', '-P', src],
+                stderr=subprocess.STDOUT)
+            key = cache.key(preprocessed, flags)
+        except (subprocess.CalledProcessError, OSError):
+            # let the compiler report the error
+            pass
+        if cache.fetch(key, obj):
+            return None
+        error = _run(self.compiler_so + cc_args + [src, '-o', obj] +
+                     extra_postargs)
+        if error is None:
+            cache.store(key, obj)
+        return error
+
+    # number of parallel compilations
+    pool = ThreadPool(max(1, min(N, len(objects))))
+    try:
+        # consume all results, such that no errors are dropped
+        errors = pool.map(_single_compile, objects)
+    finally:
+        pool.close()
+        pool.join()
 
-    pool = Pool(N)
-    pool.imap(_single_compile, objects)
-    pool.close()
-    pool.join()
+    failed = [(obj, err) for obj, err in zip(objects, errors) if err is not None]
+    if failed:
+        obj, err = failed[0]
+        raise CompileError('Error compiling {} ({} failure(s) total):\n{}'.format(
+            build[obj][0], len(failed), err))
 
     return objects
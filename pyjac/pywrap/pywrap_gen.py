@@ -10,6 +10,7 @@
 
 from pyjac.libgen import generate_library
 from pyjac.core.enum_types import KernelType
+from pyjac.core import array_creator as arc
 from pyjac.core.create_jacobian import inputs_and_outputs as jac_args
 from pyjac.core.rate_subs import inputs_and_outputs as rate_args
 from pyjac.kernel_utils.kernel_gen import DocumentingRecord
@@ -29,12 +30,15 @@ class WrapperGen(ImmutableRecord, DocumentingRecord):
         The input / output arguments of the kernel
     lang: str
         The language this wrapper is being generated for
+    int_args: list of str
+        The (integer) arguments of :attr:`kernel_args` that are not double
+        precision
     """
 
-    def __init__(self, name='', kernel_args=[], lang='c'):
+    def __init__(self, name='', kernel_args=[], lang='c', int_args=[]):
         docs = self.init_docs(lang)
         ImmutableRecord.__init__(self, name=name, kernel_args=kernel_args, lang=lang,
-                                 docs=docs)
+                                 docs=docs, int_args=int_args)
 
 
 class SetupGen(ImmutableRecord):
@@ -141,7 +145,7 @@ def generate_setup(lang, setupfile, pyxfile, home_dir, build_dir, out_dir, libna
 
 def generate_wrapper(lang, pyxfile, build_dir, ktype=KernelType.jacobian,
                      additional_inputs=[], additional_outputs=[],
-                     nice_name=None):
+                     nice_name=None, reorder_conditions=False):
     """
     Generate the Cython wrapper file
 
@@ -161,6 +165,10 @@ def generate_wrapper(lang, pyxfile, build_dir, ktype=KernelType.jacobian,
         If supplied, treat these arguments as additional output variables
     nice_name: str [None]
         If supplied, use this instead of :param:`ktype` to derive the kernel name
+    reorder_conditions: bool [False]
+        If true, the kernel was generated with
+        :attr:`loopy_options.reorder_conditions`, and takes the (integer)
+        permutation of the initial conditions as an additional input
 
     Returns
     -------
@@ -189,6 +197,13 @@ def generate_wrapper(lang, pyxfile, build_dir, ktype=KernelType.jacobian,
         inputs = additional_inputs[:]
         outputs = additional_outputs[:]
 
+    int_args = []
+    if reorder_conditions:
+        # not a kernel data array, hence ordered ahead of the others,
+        # @see :func:`pyjac.utils.kernel_argument_ordering`
+        inputs = [arc.condition_order] + inputs
+        int_args.append(arc.condition_order)
+
     def extend(names, args=[]):
         for name in names:
             if name in replacements:
@@ -198,7 +213,8 @@ def extend(names, args=[]):
         return args
 
     args = extend(outputs, extend(inputs))
-    wrapper = WrapperGen(name=nice_name, kernel_args=args, lang=lang)
+    wrapper = WrapperGen(name=nice_name, kernel_args=args, lang=lang,
+                         int_args=int_args)
 
     # dump wrapper
     with utils.temporary_directory() as tdir:
@@ -280,6 +296,10 @@ def pywrap(lang, source_dir, build_dir=None, out_dir=None,
     additional_inputs: list of str [[]]
         Use to supply additional input argument names to the generator process;
         currently this is only used for :param:`ktype`==KernelType.dummy
+    reorder_conditions: bool [False]
+        If true, the library was generated with
+        :attr:`loopy_options.reorder_conditions`, and the wrapper takes the
+        permutation of the initial conditions as its first argument
 
 
     Returns
@@ -327,7 +347,9 @@ def pywrap(lang, source_dir, build_dir=None, out_dir=None,
     wrapper = generate_wrapper(lang, os.path.join(home_dir, pyxfile), build_dir,
                                ktype=ktype, additional_outputs=additional_outputs,
                                additional_inputs=kwargs.pop('additional_inputs', []),
-                               nice_name=kwargs.get('file_base', None))
+                               nice_name=kwargs.get('file_base', None),
+                               reorder_conditions=kwargs.get('reorder_conditions',
+                                                             False))
 
     # generate setup
     setup = generate_setup(
@@ -356,9 +356,10 @@ def setUp(self):
             sorting = get_rxn_sorting()
             if sorting != reaction_sorting.none:
                 # get ordering
-                ordering = sort_reactions(reacs, sorting, return_order=True)
+                ordering = sort_reactions(reacs, sorting, return_order=True,
+                                          specs=specs)
                 # and apply
-                reacs = sort_reactions(reacs, sorting)
+                reacs = [reacs[i] for i in ordering]
                 ct_reacs = gas.reactions()
                 # and apply to gas
                 gas = ct.Solution(thermo='IdealGas', kinetics='GasKinetics',
@@ -1,3 +1,6 @@
+import numpy as np
+
+from pyjac.core.chem_model import calc_spec_cp, calc_spec_h
 from pyjac.core.enum_types import falloff_form, reaction_type, reversible_type, \
     thd_body_type
 from pyjac.tests import TestClass
@@ -80,3 +83,13 @@ def test_rxn_strings(self):
             rstr = str(rxn)
             rstr = rstr[rstr.index(': ') + 2:]
             assert str(rstr) == str(self.store.gas.reaction(i).equation)
+
+    def test_vectorized_thermo(self):
+        T = self.store.T
+        assert np.allclose(calc_spec_cp(T, self.store.specs), self.store.spec_cp,
+                           rtol=1e-6)
+        assert np.allclose(calc_spec_h(T, self.store.specs), self.store.spec_h,
+                           rtol=1e-6, atol=1e2)
+        # and scalar temperatures
+        assert np.allclose(calc_spec_cp(T[0], self.store.specs)[0],
+                           self.store.spec_cp[0], rtol=1e-6)
@@ -1,5 +1,7 @@
 # local imports
 from pyjac.core.rate_subs import polyfit_kernel_gen, assign_rates
+from pyjac.core.enum_types import RateSpecialization
+from pyjac.core import thermo_tables
 from pyjac.loopy_utils.loopy_utils import kernel_call
 from pyjac.tests import TestClass
 from pyjac.tests.test_utils import _generic_tester
@@ -10,7 +12,7 @@
 
 
 class SubTest(TestClass):
-    def __subtest(self, ref_ans, nicename):
+    def __subtest(self, ref_ans, nicename, thermo_table_tol=None):
         def __wrapper(opt, namestore, test_size=None, **kwargs):
             return polyfit_kernel_gen(nicename, opt, namestore,
                                       test_size=test_size)
@@ -18,12 +20,20 @@ def __wrapper(opt, namestore, test_size=None, **kwargs):
         # create args
         args = {'phi': lambda x: np.array(self.store.phi_cp, order=x, copy=True),
                 nicename: lambda x: np.zeros_like(ref_ans, order=x)}
+        tols = {}
+        if thermo_table_tol is not None:
+            # the interpolant error is relative to the largest magnitude of the
+            # property
+            tols = {'rtol': 10 * thermo_table_tol,
+                    'atol': 10 * thermo_table_tol * np.max(np.abs(ref_ans))}
         # create the kernel call
         kc = kernel_call('eval_' + nicename,
                          [ref_ans],
-                         **args)
+                         **dict(tols, **args))
 
-        return _generic_tester(self, __wrapper, [kc], assign_rates)
+        return _generic_tester(self, __wrapper, [kc], assign_rates,
+                               do_T_invariants=True,
+                               thermo_table_tol=thermo_table_tol)
 
     @attr('long')
     def test_cp(self):
@@ -44,3 +54,15 @@ def test_u(self):
     @attr('long')
     def test_b(self):
         self.__subtest(self.store.spec_b, 'b')
+
+    @attr('long')
+    def test_tabulated(self):
+        tol = 1e-4
+        rate_info = assign_rates(self.store.reacs, self.store.specs,
+                                 RateSpecialization.fixed)
+        tables = thermo_tables.get_tables(rate_info, tol)
+        for nicename in thermo_tables.table_properties:
+            # all properties of the test mechanism can be tabulated
+            assert nicename in tables, nicename
+            self.__subtest(getattr(self.store, 'spec_' + nicename), nicename,
+                           thermo_table_tol=tol)
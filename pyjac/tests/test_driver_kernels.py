@@ -13,6 +13,7 @@
 from pyjac.core import array_creator as arc
 from pyjac.core.create_jacobian import reset_arrays, determine_jac_inds
 from pyjac.core import instruction_creator as ic
+from pyjac.core import driver_kernels as drivers
 from pyjac.core.enum_types import RateSpecialization, KernelType, DriverType
 from pyjac.core.mech_auxiliary import write_aux
 from pyjac.kernel_utils import kernel_gen as k_gen
@@ -24,8 +25,36 @@
 
 
 class SubTest(TestClass):
-    @attr('long')
-    def test_lockstep_driver(self):
+    def test_condition_order(self):
+        T = self.store.T
+        thresholds = self.store.specs[0].Trange[1:2]
+        for width in [2, 4, 8]:
+            order = drivers.condition_order(T, thresholds, width)
+            # a permutation
+            assert np.array_equal(np.sort(order), np.arange(T.size))
+            # grouped by branch, with the original order preserved in each group
+            above = T[order] >= thresholds[0]
+            assert np.all(np.diff(above.astype(int)) >= 0)
+            assert np.all(np.diff(order[~above]) > 0)
+            assert np.all(np.diff(order[above]) > 0)
+            # and at most one vector straddles the threshold
+            num_vecs = int(np.ceil(T.size / float(width)))
+            assert drivers.branch_divergence(
+                T[order], thresholds, width) <= 1. / num_vecs
+            assert drivers.branch_divergence(T[order], thresholds, width) <= \
+                drivers.branch_divergence(T, thresholds, width)
+
+    def test_block_size(self):
+        # the largest power of two that fits in the cache (up to the maximum)
+        assert drivers.get_block_size(1000, 256 * 1024) == 64
+        assert drivers.get_block_size(5000, 256 * 1024) == 32
+        assert drivers.get_block_size(5000, 256 * 1024, max_block_size=20) == 16
+        # and at least one condition
+        assert drivers.get_block_size(512 * 1024, 256 * 1024) == 1
+        assert drivers.get_block_size(0, 256 * 1024) == 1
+        assert drivers.get_block_size(1000, None) == 1
+
+    def __test_lockstep_driver(self, test_size=None, **oploop_kwds):
         # get rate info
         rate_info = determine_jac_inds(self.store.reacs, self.store.specs,
                                        RateSpecialization.fixed)
@@ -33,7 +62,7 @@ def test_lockstep_driver(self):
 
         for kind, loopy_opts in OptionLoopWrapper.from_get_oploop(
                 self, do_ratespec=False, langs=get_test_langs(),
-                do_vector=True, yield_index=True):
+                do_vector=True, yield_index=True, **oploop_kwds):
 
             # make namestore
             namestore = arc.NameStore(loopy_opts, rate_info)
@@ -97,10 +126,11 @@ def test_lockstep_driver(self):
 
             # use a "weird" (non-evenly divisibly by vector width) test-size to
             # properly test the copy-in / copy-out
-            test_size = self.store.test_size - 37
-            if test_size <= 0:
-                test_size = self.store.test_size - 1
-                assert test_size > 0
+            if test_size is None:
+                test_size = self.store.test_size - 37
+                if test_size <= 0:
+                    test_size = self.store.test_size - 1
+                    assert test_size > 0
             # and make
             with temporary_build_dirs() as (build, obj, lib):
 
@@ -133,6 +163,11 @@ def __save(shape, name, zero=False):
                                    data_order=loopy_opts.order,
                                    data_filename='data.bin',
                                    for_validation=True)
+                if loopy_opts.lang == 'c' and loopy_opts.driver_block_size \
+                        not in [None, 'auto']:
+                    # each thread evaluates a block of conditions
+                    assert generator.block_size == int(
+                        loopy_opts.driver_block_size)
 
                 # write header
                 write_aux(build, loopy_opts, self.store.specs, self.store.reacs)
@@ -143,13 +178,23 @@ def __save(shape, name, zero=False):
                        ktype=KernelType.dummy,
                        file_base=generator.name,
                        additional_inputs=inputs[:],
-                       additional_outputs=outputs[:])
+                       additional_outputs=outputs[:],
+                       reorder_conditions=loopy_opts.reorder_conditions)
+
+                wrapper_inputs = inputs[:]
+                if loopy_opts.reorder_conditions:
+                    # evaluate the conditions in an arbitrary order, which must
+                    # not change the results
+                    order = np.random.permutation(test_size).astype(arc.kint_type)
+                    np.save(pjoin(lib, arc.condition_order + '.npy'), order)
+                    wrapper_inputs = [arc.condition_order] + wrapper_inputs
 
                 # and calling script
                 test = pjoin(lib, 'test.py')
 
                 inputs = utils.stringify_args(
-                    [pjoin(lib, inp + '.npy') for inp in inputs], use_quotes=True)
+                    [pjoin(lib, inp + '.npy') for inp in wrapper_inputs],
+                    use_quotes=True)
                 str_outputs = utils.stringify_args(
                     [pjoin(lib, inp + '.npy') for inp in outputs], use_quotes=True)
 
@@ -193,3 +238,23 @@ def __save(shape, name, zero=False):
                 test = np.load(pjoin(lib, outputs[0] + '.npy')).reshape(
                     jac.shape, order=loopy_opts.order)
                 assert np.array_equal(test, jac)
+
+    @attr('long')
+    def test_lockstep_driver(self):
+        self.__test_lockstep_driver()
+
+    @attr('long')
+    def test_lockstep_driver_reordered(self):
+        self.__test_lockstep_driver(reorder_conditions=True)
+
+    @attr('long')
+    def test_lockstep_driver_blocked(self):
+        # a problem size that is not a multiple of the block size, such that the
+        # final block is partially filled
+        test_size = max(self.store.test_size - 37, 4)
+        if test_size % 3 == 0:
+            test_size -= 1
+        self.__test_lockstep_driver(test_size=test_size,
+                                    driver_block_size=[3, 'auto'])
+        # and fewer conditions than a single block
+        self.__test_lockstep_driver(test_size=5, driver_block_size=[8])
@@ -2,10 +2,19 @@
 from __future__ import print_function
 from __future__ import division
 
+import os
 import sys
 
+import numpy as np
+from nose.tools import assert_raises
+
 from pyjac.functional_tester import partially_stirred_reactor  # noqa
+from pyjac.functional_tester.partially_stirred_reactor import ParticleArray, \
+    select_pairs, select_pairs_array, mix_substep_array, ConditionWriter, \
+    PyJacReactionBackend
 from pyjac.functional_tester import test # noqa
+from pyjac.functional_tester.test import reference_cache
+from pyjac.utils import temporary_directory
 
 
 class TestPartiallyStirredReactor(object):
@@ -16,6 +25,124 @@ def test_imported(self):
         """
         assert 'pyjac.functional_tester.partially_stirred_reactor' in sys.modules
 
+    def __particle_array(self, comp):
+        # avoid the need for a cantera object
+        particles = ParticleArray.__new__(ParticleArray)
+        particles.comp = comp.copy()
+        particles.T = comp[:, 0].copy()
+        particles.P = 1
+        return particles
+
+    def test_select_pairs_array(self):
+        class dummy_particle(object):
+            def __init__(self, comp):
+                self.comp = comp
+
+            def __call__(self, comp=None):
+                if comp is None:
+                    return self.comp
+                self.comp = comp
+
+        for num_part in [10, 11]:
+            comp = np.arange(num_part * 3, dtype=np.float64).reshape((num_part, 3))
+            particles = [dummy_particle(c) for c in comp]
+            array = self.__particle_array(comp)
+
+            np.random.seed(0)
+            select_pairs(particles, 3, 1)
+            np.random.seed(0)
+            select_pairs_array(array, 3, 1)
+            assert np.array_equal(array.comp, np.array([p() for p in particles]))
+            assert np.array_equal(array.T, array.comp[:, 0])
+
+    def test_mix_substep_array(self):
+        comp = np.random.random((11, 4))
+        array = self.__particle_array(comp)
+        mix_substep_array(array, 1e-3, 1e-3)
+        # pairwise mixing conserves the pair-sum
+        assert np.allclose(array.comp[0:10:2] + array.comp[1:10:2],
+                           comp[0:10:2] + comp[1:10:2])
+        # and moves pairs toward each other
+        assert np.all(np.abs(array.comp[0:10:2] - array.comp[1:10:2]) <
+                      np.abs(comp[0:10:2] - comp[1:10:2]))
+        # odd particle out is unchanged
+        assert np.array_equal(array.comp[-1], comp[-1])
+
+    def test_condition_writer(self):
+        steps = [np.random.random((5, 4)) for i in range(3)]
+        with temporary_directory() as tdir:
+            filename = os.path.join(tdir, 'pasr_out.npy')
+            writer = ConditionWriter(filename, 4)
+            writer.append(steps[0])
+            writer.checkpoint({'step': 0})
+            writer.append(steps[1])
+            writer.flush()
+            # readable (and memory-mappable) while the simulation progresses
+            assert np.array_equal(np.load(filename, mmap_mode='r'),
+                                  np.vstack(steps[:2]))
+            writer.close()
+
+            # resume discards data written after the checkpoint
+            writer = ConditionWriter(filename, 4, resume=True)
+            assert writer.load_checkpoint()['step'] == 0
+            writer.append(steps[2])
+            writer.close()
+            assert np.array_equal(np.load(filename),
+                                  np.vstack((steps[0], steps[2])))
+
+    def test_pyjac_reaction_backend(self):
+        # a stiff, linear ODE: dy/dt = scale * A * y, with a per-particle scale
+        # such that the particles take different step sizes / numbers of steps
+        A = np.array([[-1., 0, 0], [1., -100., 0], [0, 50., -1e4]])
+        scale = np.array([0.1, 1., 10., 3.])
+        num_part = scale.size
+
+        class stub_rates(object):
+            def __call__(self, P, phi, dphi):
+                phi = phi.reshape((num_part, -1))
+                dphi[:] = (scale[:, np.newaxis] * np.dot(phi, A.T)).ravel()
+
+        class stub_jacobian(object):
+            def __call__(self, P, phi, jac):
+                jac[:] = (scale[:, np.newaxis, np.newaxis] * A).ravel()
+
+        # avoid the need for a cantera object / generated kernels
+        backend = PyJacReactionBackend.__new__(PyJacReactionBackend)
+        backend.rates = stub_rates()
+        backend.jac = stub_jacobian()
+        backend.num_part = num_part
+        backend.num_spec = A.shape[0] - 1
+        backend.rtol = 1e-6
+        backend.atol = 1e-12
+        backend.max_steps = 100000
+        backend.h = None
+
+        def exact(y0, t):
+            lam, V = np.linalg.eig(A)
+            out = np.empty_like(y0)
+            for i in range(num_part):
+                out[i] = np.dot(V, np.exp(scale[i] * lam * t) *
+                                np.linalg.solve(V, y0[i]))
+            return out
+
+        y0 = np.ones((num_part, A.shape[0]))
+        y = backend.integrate(y0, 1e5, 0.5)
+        assert np.allclose(y, exact(y0, 0.5), rtol=1e-4, atol=1e-10)
+        # the input state is unchanged, and the step sizes are kept per-particle
+        assert np.array_equal(y0, np.ones_like(y0))
+        assert backend.h.shape == (num_part,)
+        assert np.unique(backend.h).size > 1
+
+        # continue from the stored step sizes
+        y = backend.integrate(y, 1e5, 0.5)
+        assert np.allclose(y, exact(y0, 1.), rtol=1e-4, atol=1e-10)
+
+        # exceeding the maximum number of steps is an error
+        backend.h = None
+        backend.max_steps = 2
+        with assert_raises(RuntimeError):
+            backend.integrate(y0, 1e5, 0.5)
+
 
 class TestTest(object):
     """
@@ -24,3 +151,26 @@ def test_imported(self):
         """Ensure test module imported.
         """
         assert 'pyjac.functional_tester.test' in sys.modules
+
+    def test_reference_cache(self):
+        phi = np.random.random((10, 4))
+        with temporary_directory() as tdir:
+            cache = reference_cache(os.path.join(tdir, 'cache'))
+            ref = os.path.join(tdir, 'ref.hdf5')
+            key = cache.key(phi, 3, 'jac', True)
+            assert key == cache.key(phi, 5, 'jac', True)
+            assert key != cache.key(phi, 3, 'jac', False)
+            assert cache.fetch(key, [ref]) is None
+
+            with open(ref, 'w') as file:
+                file.write('ref')
+            cache.store(key, [ref], threshold=1.5)
+            os.remove(ref)
+            assert cache.fetch(key, [ref])['threshold'] == 1.5
+            with open(ref, 'r') as file:
+                assert file.read() == 'ref'
+
+            # and evict least recently used entries when full
+            cache.max_size = 0
+            cache.evict()
+            assert cache.fetch(key, [ref]) is None
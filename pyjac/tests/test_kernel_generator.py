@@ -20,7 +20,7 @@
 from pyjac.kernel_utils.memory_limits import memory_type
 from pyjac.kernel_utils.kernel_gen import kernel_generator, TargetCheckingRecord, \
     knl_info, make_kernel_generator, CallgenResult, local_work_name, rhs_work_name, \
-    int_work_name
+    int_work_name, chunk_kernels, partition_chunk
 from pyjac.utils import partition, temporary_directory, clean_dir, \
     can_vectorize_lang, header_ext, file_ext
 from pyjac.tests import TestClass
@@ -404,6 +404,78 @@ def __check_local_unpacks(result, args):
                 __check_local_unpacks(result, recordnew.args + recordnew.local +
                                       record.constants)
 
+    def test_unique_pointer_offsets(self):
+        # the static entries of the working buffer follow the per work-item data,
+        # and must stay inside the buffer once scaled to the driver's work-size
+        oploop = OptionLoopWrapper.from_get_oploop(self,
+                                                   do_conp=False,
+                                                   do_vector=False,
+                                                   do_sparse=False,
+                                                   unique_pointers=True)
+        for opts in oploop:
+            kgen = self._kernel_gen(opts)
+            args = [lp.GlobalArg('per_wi', shape=(arc.work_size.name, 5),
+                                 dtype=np.float64)]
+            args += [lp.GlobalArg('static{}'.format(i), shape=(size,),
+                                  dtype=np.float64)
+                     for i, size in enumerate([10, 20, 7])]
+            size_per_wi, static_size, offsets = kgen._get_working_buffer(args)
+            assert size_per_wi == 5
+            assert static_size == 37
+
+            work_size = 4
+            allocated = work_size * size_per_wi + static_size
+            static = []
+            for name, (_, size, offset, _) in six.iteritems(offsets):
+                start = eval(kgen._scale_unique_offset(offset),
+                             {arc.work_size.name: work_size})
+                if name == 'per_wi':
+                    assert start == 0
+                    continue
+                assert work_size * size_per_wi <= start
+                assert start + size <= allocated
+                static.append((start, start + size))
+            # and the static entries do not overlap
+            static = sorted(static)
+            assert all(static[i][1] <= static[i + 1][0]
+                       for i in range(len(static) - 1))
+
+    def test_chunk_rate_kernel(self):
+        from pyjac.core.rate_subs import assign_rates, get_simple_arrhenius_rates
+        from pyjac.loopy_utils.loopy_utils import loopy_options
+        rate_info = assign_rates(self.store.reacs, self.store.specs,
+                                 RateSpecialization.fixed)
+        size = 4
+
+        def __kernels(**kwargs):
+            opts = loopy_options(order='C', lang='c', **kwargs)
+            namestore = arc.NameStore(opts, rate_info, True,
+                                      self.store.test_size)
+            infos = get_simple_arrhenius_rates(
+                opts, namestore, test_size=self.store.test_size)
+            gen = make_kernel_generator(opts, KernelType.dummy, infos, namestore,
+                                        name='simple',
+                                        test_size=self.store.test_size)
+            return gen._make_kernels()
+
+        kernel, = __kernels()
+        chunks = __kernels(max_reactions_per_kernel=size)
+        num = int(np.ceil(rate_info['simple']['num'] / float(size)))
+        assert [x.name for x in chunks] == [
+            '{}_chunk{}'.format(kernel.name, i) for i in range(num)]
+
+        # each chunk holds only its own partition of the reaction parameters,
+        # which together make up the parameters of the unchunked kernel
+        for name in ['simple_A', 'simple_beta', 'simple_Ta']:
+            full = kernel.temporary_variables[name].initializer
+            parts = []
+            for chunk in chunks:
+                part, = [temp for temp_name, temp in six.iteritems(
+                    chunk.temporary_variables) if temp_name.startswith(name + '_')]
+                assert part.shape[0] <= size
+                parts.append(part.initializer)
+            assert np.array_equal(np.concatenate(parts), full)
+
     def test_merge_kernels(self):
         # test vector to ensure the various working buffer configurations work
         # (i.e., locals)
@@ -905,6 +977,82 @@ def test_call_header_generator(self):
                             assert re.search(
                                 r'double\* d_{};'.format(name), file_src)
 
+    def __get_compact_kernel_generator(self, opts):
+        # a chain of kernels, in which the temporaries 'tmp0' and 'tmp2' are never
+        # in use at the same time
+        domain = arc.creator('domain', arc.kint_type, (10,), 'C',
+                             initializer=np.arange(10, dtype=arc.kint_type))
+        mapstore = arc.MapStore(opts, domain, None)
+        names = ['arg', 'tmp0', 'tmp1', 'tmp2', 'out']
+        arrays = {name: arc.creator(name, np.float64,
+                                    (arc.problem_size.name, 10), opts.order)
+                  for name in names}
+        namestore = type('', (object,), arrays)
+        lp_arrays = {}
+        strs = {}
+        for name in names:
+            lp_arrays[name], strs[name] = mapstore.apply_maps(
+                arrays[name], 'j', 'i')
+
+        infos = []
+        chain = [('tmp0', 'arg', '{arg}'), ('tmp1', 'tmp0', '2 * {tmp0}'),
+                 ('tmp2', 'tmp1', '{tmp1} + 1'), ('out', 'tmp2', '{tmp2}')]
+        for i, (lhs, rhs, expr) in enumerate(chain):
+            insn = ('{lhs} = ' + expr + ' {{id=insn{i}}}').format(
+                lhs=strs[lhs], i=i, **strs)
+            infos.append(knl_info(
+                'knl{}'.format(i), insn, mapstore,
+                kernel_data=[lp_arrays[lhs], lp_arrays[rhs], arc.work_size],
+                silenced_warnings=['write_race(insn{})'.format(i)]))
+
+        return make_kernel_generator(
+            opts, KernelType.dummy, infos, namestore, name='compact',
+            input_arrays=['arg'], output_arrays=['out'])
+
+    def test_compact_working_buffer(self):
+        oploop = OptionLoopWrapper.from_get_oploop(self,
+                                                   do_conp=False,
+                                                   do_vector=True,
+                                                   do_sparse=False)
+        temps = ['tmp0', 'tmp1', 'tmp2']
+        for opts in oploop:
+            max_ws_per_run = {}
+            for compact in [False, True]:
+                opts.compact_working_buffer = compact
+                with temporary_directory() as tdir:
+                    kgen = self.__get_compact_kernel_generator(opts)
+                    kgen._make_kernels()
+
+                    live_ranges = kgen._get_live_ranges()
+                    if not compact or opts.depth:
+                        assert live_ranges is None
+                    else:
+                        assert live_ranges['tmp0'] == (0, 1)
+                        assert live_ranges['tmp1'] == (1, 2)
+                        assert live_ranges['tmp2'] == (2, 3)
+                        # inputs / outputs are always live
+                        assert live_ranges['arg'] == (-1, 4)
+                        assert live_ranges['out'] == (-1, 4)
+
+                    callgen, record, result = kgen._generate_wrapping_kernel(
+                        tdir)
+                    offsets = {x: result.pointer_offsets[x][2] for x in temps}
+                    if live_ranges is None:
+                        assert len(set(offsets.values())) == len(temps)
+                    else:
+                        # tmp0 & tmp2 share storage
+                        assert offsets['tmp0'] == offsets['tmp2']
+                        assert offsets['tmp1'] != offsets['tmp0']
+
+                    callgen = kgen._generate_driver_kernel(
+                        tdir, record, result, callgen)
+                    max_ws_per_run[compact] = callgen.max_ws_per_run
+
+            # and the compacted buffer fits more work-items in memory
+            if not opts.depth:
+                assert max_ws_per_run[True] > max_ws_per_run[False]
+            opts.compact_working_buffer = False
+
     def test_read_initial_condition_generator(self):
         oploop = OptionLoopWrapper.from_get_oploop(self,
                                                    do_conp=False,
@@ -1034,3 +1182,148 @@ def __check(record):
     # numpy dtype as dictionary key
     dtype = to_loopy_type(np.int32)
     __check(TargetCheckingRecord(kernel_data={dtype: 'bad'}))
+
+
+def test_chunk_kernels():
+    from pyjac.loopy_utils.loopy_utils import loopy_options
+    opts = loopy_options(order='C', lang='c')
+
+    def __info(name, size, **kwargs):
+        domain = arc.creator(name, arc.kint_type, (size,), 'C',
+                             initializer=np.arange(size, dtype=arc.kint_type))
+        return knl_info(name, '', arc.MapStore(opts, domain, None),
+                        kernel_data=[], **kwargs)
+
+    small = __info('small', 3)
+    large = __info('large', 10)
+    external = lp.make_kernel('{[i]: 0 <= i < 1}', 'a[i] = 0', name='external')
+    kernels, barriers = chunk_kernels([small, large, external],
+                                      [(0, 1, 'global'), (1, 2, 'global')], 4)
+
+    # the small kernel and the pre-built kernel are untouched
+    assert kernels[0] is small
+    assert kernels[-1] is external
+    # and the large kernel is split into contiguous chunks
+    chunks = kernels[1:-1]
+    assert [x.name for x in chunks] == ['large_chunk0', 'large_chunk1',
+                                        'large_chunk2']
+    assert [x.chunk for x in chunks] == [(0, 3), (4, 7), (8, 9)]
+    assert large.chunk is None
+    # with barriers before the first and after the last chunk
+    assert barriers == [(0, 1, 'global'), (3, 4, 'global')]
+
+    # kernels accumulating over the loop are not split
+    accumulator = __info('accumulator', 10, post_instructions=['a[0] = sum'],
+                         chunkable=False)
+    kernels, barriers = chunk_kernels([small, accumulator],
+                                      [(0, 1, 'global')], 4)
+    assert kernels[1] is accumulator
+    assert barriers == [(0, 1, 'global')]
+
+
+def test_partition_chunk():
+    A = lp.TemporaryVariable('A', shape=(10,), dtype=np.float64,
+                             initializer=np.arange(10, dtype=np.float64),
+                             read_only=True, address_space=scopes.GLOBAL)
+    B = lp.TemporaryVariable('B', shape=(20,), dtype=np.float64,
+                             initializer=np.arange(20, dtype=np.float64),
+                             read_only=True, address_space=scopes.GLOBAL)
+    knl = lp.make_kernel('{[i]: 4 <= i <= 7}',
+                         'out[i] = A[i] + A[i + 1] + B[2 * i]',
+                         [lp.GlobalArg('out', shape=(10,), dtype=np.float64),
+                          A, B])
+    knl = partition_chunk(knl, 'i', 4, 7)
+
+    # the array accessed by the loop index is restricted to the chunk
+    temps = knl.temporary_variables
+    assert np.array_equal(temps['A_4_8'].initializer, np.arange(4, 9))
+    assert temps['A_4_8'].shape == (5,)
+    deps = knl.instructions[0].dependency_names()
+    assert 'A_4_8' in deps and 'A' not in deps
+    # while any other access is left as is
+    assert 'B' in deps and not any(name.startswith('B_') for name in temps)
+
+
+def test_index_type():
+    from pyjac.loopy_utils.loopy_utils import loopy_options
+    from pyjac.core.driver_kernels import driver_offset
+    mask = arc.creator('mask', arc.kint_type, (2,), 'C',
+                       initializer=np.arange(2, dtype=arc.kint_type))
+    for index_type in ['int32', 'int64']:
+        opts = loopy_options(order='C', lang='c', index_type=index_type)
+        gen = make_kernel_generator(opts, KernelType.dummy, [], None,
+                                    name='index')
+        # the arguments over the initial conditions use the index type
+        for arg in [arc.problem_size, arc.work_size, driver_offset]:
+            assert gen._with_index_type(arg).dtype == np.dtype(index_type)
+            assert gen._with_target(arg).dtype == to_loopy_type(
+                np.dtype(index_type), target=gen.target)
+        # while the maps are left alone
+        mask_lp, _ = mask(0)
+        assert gen._with_index_type(mask_lp) is mask_lp
+
+        # and the generated kernel indexes with the index type
+        mapstore = arc.MapStore(opts, mask, None)
+        arr = arc.creator('arr', np.float64, (arc.problem_size.name, 2), 'C')
+        arr_lp, arr_str = mapstore.apply_maps(arr, arc.global_ind, arc.var_name)
+        info = knl_info('index', '{} = 1'.format(arr_str), mapstore,
+                        kernel_data=[arr_lp, arc.problem_size])
+        knl = gen.make_kernel(info, gen.target, None)
+        assert knl.index_dtype == to_loopy_type(np.dtype(index_type))
+        assert knl.arg_dict[arc.problem_size.name].dtype == to_loopy_type(
+            np.dtype(index_type))
+
+
+def test_write_parameters():
+    from pyjac.kernel_utils.kernel_gen import write_parameters
+    import json
+    consts = [lp.TemporaryVariable('b', initializer=np.arange(3, dtype=np.int32),
+                                   read_only=True),
+              lp.TemporaryVariable('a', initializer=np.arange(6.).reshape(2, 3),
+                                   read_only=True)]
+    for order in ['C', 'F']:
+        with temporary_directory() as tdir:
+            filename = os.path.join(tdir, 'params.bin')
+            offsets, size = write_parameters(filename, consts, order,
+                                             alignment=16)
+            # sorted by name, and aligned
+            assert offsets == {'a': 0, 'b': 48}
+            assert size == 60 and size == os.path.getsize(filename)
+            with open(filename + '.json', 'r') as file:
+                index = json.load(file)
+            with open(filename, 'rb') as file:
+                blob = file.read()
+            for const in consts:
+                entry = index[const.name]
+                assert entry['offset'] == offsets[const.name]
+                data = np.frombuffer(blob, dtype=entry['dtype'],
+                                     count=const.initializer.size,
+                                     offset=entry['offset'])
+                assert np.array_equal(data.reshape(entry['shape'], order=order),
+                                      const.initializer)
+
+
+def test_parameter_path_variable():
+    from pyjac.kernel_utils.kernel_gen import parameter_path_variable
+    assert parameter_path_variable('jacobian') == 'PYJAC_JACOBIAN_PARAMETERS'
+    assert parameter_path_variable('species_rates') == \
+        'PYJAC_SPECIES_RATES_PARAMETERS'
+
+
+def test_plan_working_buffer():
+    from pyjac.kernel_utils.kernel_gen import plan_working_buffer
+    sizes = {'a': 10, 'b': 10, 'c': 5, 'd': 20}
+    live_ranges = {'a': (0, 1), 'b': (2, 3), 'c': (1, 2), 'd': (-1, 4)}
+    offsets, total = plan_working_buffer(sizes, live_ranges)
+
+    # a & b are never live at the same time, and hence share storage
+    assert offsets['a'] == offsets['b']
+    assert total == 35
+    # and no arrays that are live at the same time overlap
+    for x in sizes:
+        for y in sizes:
+            if x == y or live_ranges[x][1] < live_ranges[y][0] or \
+                    live_ranges[y][1] < live_ranges[x][0]:
+                continue
+            assert offsets[x] + sizes[x] <= offsets[y] or \
+                offsets[y] + sizes[y] <= offsets[x]
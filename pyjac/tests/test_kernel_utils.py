@@ -14,7 +14,7 @@
 from pytools.py_codegen import remove_common_indentation
 
 from pyjac.core.array_creator import array_splitter, problem_size, MapStore, \
-    creator, kint_type
+    creator, kint_type, work_size
 from pyjac.kernel_utils.memory_limits import memory_limits, memory_type, \
     get_string_strides
 from pyjac.kernel_utils.kernel_gen import find_inputs_and_outputs, \
@@ -106,6 +106,16 @@ def test_stride_limiter(dtype):
         assert limit == limits.can_fit(mtype=memory_type.m_global)[0]
 
 
+def test_working_buffer_limits():
+    # the working buffer is limited by its per work-item (and static) size
+    from pymbolic.primitives import Variable
+    rwk = lp.GlobalArg('rwk', shape=(10 + Variable(work_size.name) * 100,),
+                       dtype=np.float64)
+    limits = memory_limits('c', 'C', {memory_type.m_global: [rwk]},
+                           {memory_type.m_global: 8 * 1010})
+    assert limits.can_fit(mtype=memory_type.m_global)[1] == 10
+
+
 def test_get_kernel_input_and_output():
     # make a kernel
     knl = lp.make_kernel('{[i]: 0 <= i < 2}',
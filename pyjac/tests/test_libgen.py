@@ -3,8 +3,11 @@
 from __future__ import division
 
 import sys
+import os
 
 from pyjac.libgen import libgen  # noaq
+from pyjac.libgen import object_cache
+from pyjac.utils import temporary_directory
 
 
 class TestLibgen(object):
@@ -14,3 +17,25 @@ def test_imported(self):
         """Ensure libgen module imported.
         """
         assert 'pyjac.libgen.libgen' in sys.modules
+
+
+def test_object_cache():
+    with temporary_directory() as tdir:
+        cache = object_cache(os.path.join(tdir, 'cache'))
+        key = cache.key(b'int main() { return 0; }', ['g++', '-O3'])
+        # keys depend on both the source & the flags
+        assert key == cache.key(b'int main() { return 0; }', ['g++', '-O3'])
+        assert key != cache.key(b'int main() { return 0; }', ['g++', '-O0'])
+        assert key != cache.key(b'int main() { return 1; }', ['g++', '-O3'])
+
+        obj = os.path.join(tdir, 'main.o')
+        out = os.path.join(tdir, 'out.o')
+        assert not cache.fetch(key, out)
+        with open(obj, 'wb') as file:
+            file.write(b'object')
+        cache.store(key, obj)
+        assert cache.fetch(key, out)
+        with open(out, 'rb') as file:
+            assert file.read() == b'object'
+        # no key -> no caching
+        assert not cache.fetch(None, out)
@@ -119,6 +119,44 @@ def check(start=0, end=len(reacs_ck), depth=0):
     check()
 
 
+def test_sorting_strategies():
+    from pyjac.core.mech_interpret import (
+        sort_reactions, sorting_metrics, _enum_types, _arrhenius_type,
+        _stoich_shape, _species_indicies)
+    _, specs, reacs = read_mech(ck_file, None)
+
+    def __is_grouped(keys):
+        # each key should appear in exactly one contiguous run
+        runs = [key for i, key in enumerate(keys) if not i or key != keys[i - 1]]
+        return len(runs) == len(set(runs))
+
+    for sorting in reaction_sorting:
+        ordering = sort_reactions(reacs, sorting, return_order=True, specs=specs)
+        # check that we have a permutation
+        assert sorted(ordering) == list(range(len(reacs)))
+        sorted_reacs = [reacs[i] for i in ordering]
+        metrics = sorting_metrics(sorted_reacs, specs)
+        assert 0 < metrics['type_runs'] <= len(reacs)
+        assert 0 < metrics['shape_runs'] <= len(reacs)
+        assert metrics['species_per_block'] <= len(specs)
+
+        if sorting == reaction_sorting.specialization:
+            # identical types, rate specializations & stoichiometric shapes
+            # should be contiguous
+            assert __is_grouped([
+                _enum_types(rxn) + (_arrhenius_type(rxn), _stoich_shape(rxn))
+                for rxn in sorted_reacs])
+        elif sorting == reaction_sorting.locality:
+            # reaction types should be contiguous, and ordered by largest
+            # species index within
+            assert __is_grouped([_enum_types(rxn)[0] for rxn in sorted_reacs])
+            inds = _species_indicies(sorted_reacs, specs)
+            for i in range(1, len(sorted_reacs)):
+                if _enum_types(sorted_reacs[i])[0] == _enum_types(
+                        sorted_reacs[i - 1])[0]:
+                    assert inds[i][-1] >= inds[i - 1][-1]
+
+
 class Tester(TestClass):
     def test_heikki_issue(self):
         # tests issue raised by heikki via email re: incorrect re-ordering of species
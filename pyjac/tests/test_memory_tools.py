@@ -331,6 +331,9 @@ def test_memory_tools_defn():
                 mem.define(True, a6, host_constant=True)
             assert mem.define(False, a6, host_constant=True) == \
                 'const long int h_a6[3] = {0, 1, 2};'
+            assert mem.define(False, a6, host_constant=True,
+                              parameters=('parameters', 64)) == \
+                'const long int* h_a6 = (const long int*)(parameters + 64);'
 
         elif opts.lang == 'c':
             assert mem.define(True, a1) == 'int* d_a1;'
@@ -342,6 +345,9 @@ def test_memory_tools_defn():
                 mem.define(True, a6, host_constant=True)
             assert mem.define(False, a6, host_constant=True) == \
                 'const long int h_a6[3] = {0, 1, 2};'
+            assert mem.define(False, a6, host_constant=True,
+                              parameters=('parameters', 64)) == \
+                'const long int* h_a6 = (const long int*)(parameters + 64);'
         else:
             raise NotImplementedError
 
@@ -4,6 +4,7 @@
 """
 
 # standard library
+import os
 import sys
 from collections import OrderedDict
 
@@ -27,6 +28,8 @@
 from pyjac.core.enum_types import (KernelType, JacobianFormat, JacobianType)
 from pyjac.tests.test_utils import get_comparable, skipif, dense_to_sparse_indicies,\
     select_elements, get_split_elements, sparsify, OptionLoopWrapper
+from pyjac.tests.test_utils import _pack_jobs, _source_group, _mechanism_test_job
+from pyjac.tests.test_utils import data_bin_writer as dbw
 from pyjac.tests import set_seed
 
 
@@ -387,6 +390,51 @@ def test_kernel_argument_ordering():
         'a', 'b', arc.forward_rate_of_progress, arc.state_vector]
 
 
+def test_pack_jobs():
+    def __group(index, *cores):
+        return _source_group(index, [_mechanism_test_job(
+            {'num_cores': c}, None, None, {}) for c in cores])
+
+    groups = [__group(0, 8, 4), __group(1, 4), __group(2, 2), __group(3, 1)]
+    assert groups[0].cores == 8
+
+    # pack by declared core count
+    assert [g.index for g in _pack_jobs(groups, 12)] == [0, 1]
+    assert [g.index for g in _pack_jobs(groups, 16)] == [0, 1, 2, 3]
+    assert [g.index for g in _pack_jobs(groups, 7, num_running=1)] == [1, 2, 3]
+    # respect the maximum number of workers
+    assert [g.index for g in _pack_jobs(groups, 16, max_workers=2)] == [0, 1]
+    assert not _pack_jobs(groups, 16, num_running=2, max_workers=2)
+    # always make progress if nothing is running
+    assert [g.index for g in _pack_jobs(groups, 4)] == [0]
+    assert not _pack_jobs(groups, 0, num_running=1)
+
+
+def test_data_bin_writer():
+    data = [np.random.random((7, 5)), np.random.random((4, 5))]
+    gas_map = np.array([2, 0, 1])
+    ref = np.vstack(data)
+    ref[:, 2:] = ref[:, 2 + gas_map]
+
+    chunk_size = dbw.chunk_size
+    with utils.temporary_directory() as tdir:
+        for i, arr in enumerate(data):
+            np.save(os.path.join(tdir, 'pasr_out_{}.npy'.format(i)), arr)
+        try:
+            # force multiple chunks per file
+            dbw.chunk_size = 3
+            num_conditions, loaded = dbw.load([], directory=tdir, gas_map=gas_map)
+            assert num_conditions == 11
+            assert np.array_equal(loaded, ref)
+
+            # stream to file, cutting conditions off the front
+            assert dbw.write(tdir, cut=5, gas_map=gas_map) == 11
+            written = np.fromfile(os.path.join(tdir, 'data_eqremoved.bin'))
+            assert np.array_equal(written.reshape((-1, 5)), ref[5:])
+        finally:
+            dbw.chunk_size = chunk_size
+
+
 class TestUtils(object):
     """
     """
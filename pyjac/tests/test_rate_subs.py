@@ -11,8 +11,10 @@
     get_troe_kernel, get_rev_rates, get_rxn_pres_mod,
     get_rop, get_rop_net, get_spec_rates,
     get_temperature_rate, get_concentrations,
-    get_molar_rates, get_extra_var_rates, reset_arrays)
+    get_molar_rates, get_extra_var_rates, reset_arrays,
+    get_temperature_invariants)
 from pyjac.core.exceptions import BrokenPlatformError
+from pyjac.core import thermo_tables
 from pyjac.loopy_utils.loopy_utils import (loopy_options, kernel_call)
 from pyjac.tests import TestClass, test_utils, get_test_langs
 from pyjac.core.enum_types import reaction_type, falloff_form, thd_body_type, \
@@ -345,6 +347,16 @@ def test_assign(type_max, fall):
                                           if isinstance(x, ct.ChebyshevReaction)])
             assert result['cheb']['num'] == len(cheb_inds)
             assert np.array_equal(result['cheb']['map'], np.array(cheb_inds))
+            # check the ragged coefficients
+            pp = result['cheb']['post_process']
+            for i, params in enumerate(result['cheb']['params']):
+                start, end = pp['coeff_offsets'][i:i + 2]
+                assert np.array_equal(pp['coeffs'][start:end].reshape(
+                    (result['cheb']['num_T'][i], result['cheb']['num_P'][i])),
+                    params)
+            # and the reduced temperature / pressure bounds
+            for lim, red in [(pp['Tlim'], pp['Tred']), (pp['Plim'], pp['Pred'])]:
+                assert np.allclose(lim * red[:, :1] + red[:, 1:], [-1, 1])
 
         if result['plog']['num']:
             plog_inds, plog_reacs = zip(*[(i, x) for i, x in
@@ -352,6 +364,15 @@ def test_assign(type_max, fall):
                                           if isinstance(x, ct.PlogReaction)])
             assert result['plog']['num'] == len(plog_inds)
             assert np.array_equal(result['plog']['map'], np.array(plog_inds))
+            # check the ragged parameter table
+            pp = result['plog']['post_process']
+            for i, params in enumerate(result['plog']['params']):
+                start, end = pp['offsets'][i:i + 2]
+                assert end - start == result['plog']['num_P'][i]
+                params = np.array(params)
+                assert np.allclose(pp['params'][start:end, :2],
+                                   np.log(params[:, :2]))
+                assert np.allclose(pp['params'][start:end, 2:], params[:, 2:])
 
         # test the thd / falloff / chem assignments
         assert np.array_equal(result['fall']['map'],
@@ -454,7 +475,8 @@ def test_assign(type_max, fall):
         assert np.array_equal(result['maxT'], self.store.gas.max_temp)
 
     def __generic_rate_tester(self, func, kernel_calls, do_ratespec=False,
-                              do_ropsplit=False, do_conp=False, **kwargs):
+                              do_ropsplit=False, do_conp=False,
+                              do_spec_gather=False, **kwargs):
         """
         A generic testing method that can be used for rate constants, third bodies,
         etc.
@@ -473,11 +495,14 @@ def __generic_rate_tester(self, func, kernel_calls, do_ratespec=False,
             If true, test kernel splitting for rop_net
         do_conp:  bool [False]
             If true, test for both constant pressure _and_ constant volume
+        do_spec_gather: bool [False]
+            If true, test the gather form of the species rates
         """
 
         _generic_tester(self, func, kernel_calls, assign_rates,
                         do_ratespec=do_ratespec, do_ropsplit=do_ropsplit,
-                        do_conp=do_conp, **kwargs)
+                        do_conp=do_conp, do_spec_gather=do_spec_gather,
+                        **kwargs)
 
     def __test_rateconst_type(self, rtype):
         """
@@ -576,7 +601,8 @@ def __simple_post(kc, out):
                          post_process=post, **args)
 
         self.__generic_rate_tester(
-            rate_func, kc, do_ratespec=rtype in ['simple', 'fall'], **kwargs)
+            rate_func, kc, do_ratespec=rtype in ['simple', 'fall'],
+            do_T_invariants=True, **kwargs)
 
     @attr('long')
     def test_simple_rate_constants(self):
@@ -674,7 +700,7 @@ def test_sri_falloff(self):
                             (np.arange(self.store.sri_inds.size, dtype=kint_type),),
                             ref_ans)],
                          **args)
-        self.__generic_rate_tester(get_sri_kernel, kc)
+        self.__generic_rate_tester(get_sri_kernel, kc, do_T_invariants=True)
 
     @attr('long')
     def test_troe_falloff(self):
@@ -700,7 +726,7 @@ def test_troe_falloff(self):
                          ref_ans_compare_mask=[get_comparable(
                             (np.arange(self.store.troe_inds.size, dtype=kint_type),),
                             ref_ans)], **args)
-        self.__generic_rate_tester(get_troe_kernel, kc)
+        self.__generic_rate_tester(get_troe_kernel, kc, do_T_invariants=True)
 
     @attr('long')
     def test_lind_falloff(self):
@@ -745,6 +771,30 @@ def test_rev_rates(self):
 
         self.__generic_rate_tester(get_rev_rates, kc, allint=allint)
 
+    @attr('long')
+    def test_tabulated_rev_rates(self):
+        tol = 1e-4
+        rate_info = assign_rates(self.store.reacs, self.store.specs,
+                                 RateSpecialization.fixed)
+        # the equilibrium constants of the test mechanism can be tabulated
+        assert 'Kc' in thermo_tables.get_tables(rate_info, tol)
+
+        ref_kc = self.store.equilibrium_constants.copy()
+        ref_rev = self.store.rev_rate_constants.copy()
+        args = {'phi': lambda x: np.array(self.store.phi_cp, order=x, copy=True),
+                'kf': lambda x: np.array(self.store.fwd_rate_constants, order=x,
+                                         copy=True),
+                'Kc': lambda x: np.zeros_like(ref_kc, order=x),
+                'kr': lambda x: np.zeros_like(ref_rev, order=x)}
+
+        # the interpolated logarithm is accurate to (roughly) the tolerance
+        kc = kernel_call('Kc', [ref_kc, ref_rev], out_mask=[0, 1],
+                         rtol=10 * tol, **args)
+
+        # (allint is unused by the tabulated kernel)
+        self.__generic_rate_tester(get_rev_rates, kc, allint={'net': False},
+                                   thermo_table_tol=tol, do_T_invariants=True)
+
     @attr('long')
     def test_pressure_mod(self):
         ref_pres_mod = self.store.ref_pres_mod.copy()
@@ -807,7 +857,10 @@ def test_rop(self):
               kernel_call('rop_eval_rev', [rev_rxn_rate],
                           input_mask=['kf', 'rop_fwd'],
                           strict_name_match=True, **args)]
-        self.__generic_rate_tester(get_rop, kc, allint=allint)
+        # test the kernels both as is, and split into chunks of reactions, each of
+        # which evaluates its part of the (same) reference answer
+        self.__generic_rate_tester(get_rop, kc, allint=allint,
+                                   max_reactions_per_kernel=[None, 4])
 
     @attr('long')
     def test_rop_net(self):
@@ -874,8 +927,8 @@ def test_spec_rates(self):
                                                       dtype=kint_type),), wdot)],
                          **args)
 
-        # test regularly
-        self.__generic_rate_tester(get_spec_rates, kc)
+        # test both the scatter and gather forms
+        self.__generic_rate_tester(get_spec_rates, kc, do_spec_gather=True)
 
     @attr('long')
     def test_temperature_rates(self):
@@ -894,9 +947,10 @@ def test_temperature_rates(self):
                             (np.array([0], dtype=kint_type),), self.store.dphi_cp)],
                           **args)]
 
-        # test conp
+        # test conp, with the (accumulating) kernel both as is, and with
+        # chunking requested -- which must not split the sums over the species
         self.__generic_rate_tester(get_temperature_rate, kc,
-                                   conp=True)
+                                   conp=True, max_reactions_per_kernel=[None, 4])
 
         # test conv
         kc = [kernel_call('temperature_rate', [self.store.dphi_cv],
@@ -906,7 +960,7 @@ def test_temperature_rates(self):
                           **args)]
         # test conv
         self.__generic_rate_tester(get_temperature_rate, kc,
-                                   conp=False)
+                                   conp=False, max_reactions_per_kernel=[None, 4])
 
     @attr('long')
     def test_get_molar_rates(self):
@@ -1008,6 +1062,17 @@ def test_reset_arrays(self):
         # test conp
         self.__generic_rate_tester(reset_arrays, kc)
 
+    def test_temperature_invariants(self):
+        T = np.clip(self.store.phi_cp[:, 0], 100., 10000.)
+        args = {'phi': lambda x: np.array(self.store.phi_cp, order=x, copy=True),
+                'T_invariants': lambda x: np.zeros((T.size, 3), order=x)}
+        # in the order of array_creator.T_invariant_keys
+        invariants = np.stack((T, 1. / T, np.log(T)), axis=1)
+
+        kc = kernel_call('T_invariants', [invariants], **args)
+
+        self.__generic_rate_tester(get_temperature_invariants, kc)
+
     @parameterized.expand([(x,) for x in get_test_langs()])
     @attr('fullkernel')
     def test_specrates(self, lang):
@@ -1015,4 +1080,25 @@ def test_specrates(self, lang):
                           lambda conp: self.store.dphi_cp if conp
                           else self.store.dphi_cv,
                           ktype=KernelType.species_rates, call_name='species_rates',
-                          loose_rtol=5e-3)
+                          loose_rtol=5e-3, do_T_invariants=True)
+
+    @parameterized.expand([(x,) for x in get_test_langs()])
+    @attr('fullkernel')
+    def test_specrates_runtime_parameters(self, lang):
+        # the parameter tables are read from the (relocated) binary file
+        _full_kernel_test(self, lang, get_specrates_kernel, 'dphi',
+                          lambda conp: self.store.dphi_cp if conp
+                          else self.store.dphi_cv,
+                          ktype=KernelType.species_rates, call_name='species_rates',
+                          loose_rtol=5e-3, runtime_parameters=True)
+
+    @parameterized.expand([(x,) for x in get_test_langs()])
+    @attr('fullkernel')
+    def test_specrates_compact_working_buffer(self, lang):
+        # arrays not in use at the same time share the working buffer, with
+        # unchanged results
+        _full_kernel_test(self, lang, get_specrates_kernel, 'dphi',
+                          lambda conp: self.store.dphi_cp if conp
+                          else self.store.dphi_cv,
+                          ktype=KernelType.species_rates, call_name='species_rates',
+                          loose_rtol=5e-3, compact_working_buffer=True)
@@ -4,6 +4,7 @@
 """
 
 # system
+from os import makedirs
 from os.path import isfile, join
 from collections import OrderedDict
 from tempfile import NamedTemporaryFile
@@ -16,7 +17,8 @@
 
 # internal
 from pyjac.core.enum_types import KernelType, JacobianFormat, JacobianType
-from pyjac.utils import enum_to_string, listify, is_iterable
+from pyjac.utils import enum_to_string, listify, is_iterable, \
+    temporary_directory
 from pyjac.tests.test_utils import xfail
 from pyjac.tests import script_dir as test_mech_dir
 from pyjac.tests.test_utils.get_test_matrix import load_models, load_platforms, \
@@ -27,7 +29,8 @@
     DuplicateTestException, InvalidOverrideException, \
     InvalidInputSpecificationException, ValidationError
 from pyjac.loopy_utils.loopy_utils import load_platform
-from pyjac.kernel_utils.memory_limits import memory_limits, memory_type
+from pyjac.kernel_utils.memory_limits import memory_limits, memory_type, \
+    get_host_memory_limit, get_cache_size
 
 current_test_langs = ['c', 'opencl']
 """
@@ -790,3 +793,57 @@ def __dummy_opts(name):
 
         limits = memory_limits.get_limits(__dummy_opts('nvidia'), [], file.name)
         assert limits.limits == {}
+
+
+def test_discover_memory_limits():
+    def __dummy_opts(name, lang):
+        return type('', (object,), {'platform_name': name, 'lang': lang,
+                                    'order': ''})
+
+    with NamedTemporaryFile('w') as meminfo, NamedTemporaryFile('w') as cgroup:
+        meminfo.write(remove_common_indentation("""
+        MemTotal:       16000000 kB
+        MemFree:         1000000 kB
+        MemAvailable:    8000000 kB
+        """))
+        meminfo.flush()
+        # unlimited cgroup
+        cgroup.write('max\n')
+        cgroup.flush()
+        # the total (not the momentarily available) memory is used
+        assert get_host_memory_limit(meminfo.name, [cgroup.name]) == \
+            16000000 * 1024
+        # limited cgroup
+        cgroup.seek(0)
+        cgroup.write('1000000000\n')
+        cgroup.flush()
+        assert get_host_memory_limit(meminfo.name, [cgroup.name]) == 1000000000
+        # and no information
+        assert get_host_memory_limit('', []) is None
+
+    # and the cache size
+    with temporary_directory() as cache_dir:
+        for i, (level, ctype, size) in enumerate([
+                (1, 'Data', '48K'), (1, 'Instruction', '32K'),
+                (2, 'Unified', '2048K')]):
+            index = join(cache_dir, 'index{}'.format(i))
+            makedirs(index)
+            for name, value in [('level', level), ('type', ctype),
+                                ('size', size)]:
+                with open(join(index, name), 'w') as file:
+                    file.write('{}\n'.format(value))
+        assert get_cache_size(1, cache_dir) == 48 * 1024
+        assert get_cache_size(2, cache_dir) == 2048 * 1024
+        assert get_cache_size(3, cache_dir) is None
+    assert get_cache_size(2, '') is None
+
+    # the discovered host limit is used for C
+    limits = memory_limits.get_limits(__dummy_opts('openmp', 'c'), [])
+    host = get_host_memory_limit()
+    if host is not None:
+        assert limits.limits == {memory_type.m_global: host}
+    # but is overridden by the user
+    limits = memory_limits.get_limits(
+        __dummy_opts('openmp', 'c'), [],
+        __prefixify('test_matrix.yaml', examples_dir))
+    assert limits.limits[memory_type.m_global] == 5e10
@@ -0,0 +1,99 @@
+# local imports
+from pyjac.core.rate_subs import assign_rates
+from pyjac.core.enum_types import RateSpecialization
+from pyjac.core import thermo_tables
+from pyjac.tests import TestClass
+
+# modules
+import numpy as np
+from nose.tools import assert_raises
+
+
+def _interpolate(table, T0, inv_dT, T):
+    # evaluate the tabulated interpolants at T, as in the generated kernels
+    Tpos = (T - T0) * inv_dT
+    cell = np.clip(np.floor(Tpos), 0, table.shape[1] - 1).astype(np.int64)
+    t = Tpos - cell
+    coeffs = table[:, cell, :]
+    return (coeffs[:, :, 0] + t * (coeffs[:, :, 1] + t * (
+        coeffs[:, :, 2] + t * coeffs[:, :, 3]))).T
+
+
+class SubTest(TestClass):
+    def __rate_info(self):
+        return assign_rates(self.store.reacs, self.store.specs,
+                            RateSpecialization.fixed)
+
+    def test_fit_table(self):
+        # a cubic should be fit exactly, with the minimum number of intervals
+        def __func(T, T_branch):
+            return np.vstack((T**3, 2 * T - 1)).T
+
+        table, T0, inv_dT = thermo_tables.fit_table(__func, 0, 2, 1e-12)
+        assert table.shape == (2, 16, 4)
+        T = np.linspace(0, 2, 101)
+        assert np.allclose(_interpolate(table, T0, inv_dT, T), __func(T, T))
+
+        # and aligned on the supplied temperature
+        _, T0, inv_dT = thermo_tables.fit_table(__func, 0, 2, 1e-12,
+                                                T_align=0.01)
+        assert np.isclose(np.mod((0.01 - T0) * inv_dT + 0.5, 1), 0.5)
+
+        # a jump cannot be tabulated
+        def __jump(T, T_branch):
+            return np.where(T < 1.001, 0., 1.)[:, np.newaxis]
+        assert thermo_tables.fit_table(__jump, 0, 2, 1e-3)[0] is None
+
+    def test_unknown_property(self):
+        a = np.ones((1, 7))
+        with assert_raises(ValueError):
+            thermo_tables.nasa7_property('s', a, a, np.array([1000.]), 300.)
+
+    def test_species_tables(self):
+        tol = 1e-4
+        rate_info = self.__rate_info()
+        tables = thermo_tables.get_tables(rate_info, tol)
+        for name in thermo_tables.table_properties:
+            # all properties of the test mechanism can be tabulated
+            assert name in tables, name
+            ref = getattr(self.store, 'spec_' + name)
+            table, T0, inv_dT = tables[name]
+            assert table.shape[0] == rate_info['Ns']
+            value = _interpolate(table, T0, inv_dT, self.store.T)
+            # compare relative to the species' magnitude (with some room for
+            # the differences between Cantera and the NASA polynomials)
+            err = np.abs(value - ref) / np.max(np.abs(ref), axis=0)
+            assert np.all(err <= 10 * tol), name
+
+    def test_equilibrium_table(self):
+        tol = 1e-4
+        rate_info = self.__rate_info()
+        tables = thermo_tables.get_tables(rate_info, tol)
+        assert 'Kc' in tables
+        table, T0, inv_dT = tables['Kc']
+        assert table.shape[0] == rate_info['rev']['num']
+        logKc = _interpolate(table, T0, inv_dT, self.store.T)
+        assert np.allclose(np.exp(logKc), self.store.equilibrium_constants,
+                           rtol=10 * tol)
+
+    def test_guarded_range(self):
+        # the tables cover the whole temperature range the kernels are evaluated
+        # at, such that the end intervals are never extrapolated
+        tol = 1e-4
+        rate_info = self.__rate_info()
+        thermo = rate_info['thermo']
+        tables = thermo_tables.get_tables(rate_info, tol)
+        Tmin, Tmax = thermo_tables.T_range
+        T = np.linspace(Tmin, Tmax, 1001)
+        for name in thermo_tables.table_properties:
+            table, T0, inv_dT = tables[name]
+            assert T0 <= Tmin and T0 + table.shape[1] / inv_dT >= Tmax, name
+            ref = thermo_tables.nasa7_property(
+                name, thermo['a_lo'], thermo['a_hi'], thermo['T_mid'], T)
+            value = _interpolate(table, T0, inv_dT, T)
+            # relative to the species' magnitude over the mechanism's range
+            scale = np.max(np.abs(thermo_tables.nasa7_property(
+                name, thermo['a_lo'], thermo['a_hi'], thermo['T_mid'],
+                np.linspace(rate_info['minT'], rate_info['maxT'], 1001))),
+                axis=0)
+            assert np.all(np.abs(value - ref) / scale <= 10 * tol), name
@@ -985,7 +985,8 @@ def reduce_oploop(base, add=None):
 def _get_oploop(owner, do_ratespec=False, do_ropsplit=False, do_conp=False,
                 langs=get_test_langs(), do_vector=True, do_sparse=False,
                 do_approximate=False, do_finite_difference=False,
-                sparse_only=False, do_simd=True, **kwargs):
+                sparse_only=False, do_simd=True, do_spec_gather=False,
+                do_T_invariants=False, **kwargs):
 
     platforms = load_platforms(owner.store.test_platforms, langs=langs)
     oploop = [('order', ['C', 'F']),
@@ -998,6 +999,12 @@ def _get_oploop(owner, do_ratespec=False, do_ropsplit=False, do_conp=False,
     if do_ropsplit:
         oploop += [
             ('rop_net_kernels', [True])]
+    if do_spec_gather:
+        oploop += [
+            ('spec_rates_gather', [True, False])]
+    if do_T_invariants:
+        oploop += [
+            ('T_invariants', [True, False])]
     if do_conp:
         oploop += [('conp', [True, False])]
     else:
@@ -1253,9 +1260,12 @@ def close(self):
 
 
 def _generic_tester(owner, func, kernel_calls, rate_func, do_ratespec=False,
-                    do_ropsplit=False, do_conp=False, do_vector=True,
+                    do_ropsplit=False, do_conp=False, do_spec_gather=False,
+                    do_vector=True,
                     do_sparse=False, langs=None,
-                    sparse_only=False, **kwargs):
+                    sparse_only=False, do_T_invariants=False,
+                    thermo_table_tol=None, max_reactions_per_kernel=None,
+                    **kwargs):
     """
     A generic testing method that can be used for to test the correctness of
     any _pyJac_ kernel via the supplied :class:`kernel_call`'s
@@ -1279,6 +1289,8 @@ def _generic_tester(owner, func, kernel_calls, rate_func, do_ratespec=False,
         If true, test kernel splitting for rop_net
     do_conp:  bool [False]
         If true, test for both constant pressure _and_ constant volume
+    do_spec_gather: bool [False]
+        If true, test the gather form of the species rates alongside the scatter
     do_vector: bool [True]
         If true, use vectorization in testing
     langs: ['opencl']
@@ -1287,6 +1299,15 @@ def _generic_tester(owner, func, kernel_calls, rate_func, do_ratespec=False,
         If true, test sparse jacobian alongside full
     sparse_only: bool [False]
             Test only the sparse jacobian (e.g. for testing indexing)
+    do_T_invariants: bool [False]
+        If true, test reading the temperature from the shared block of
+        temperature invariants alongside evaluating it in the kernel
+    thermo_table_tol: float [None]
+        If supplied, test with the thermodynamic properties / equilibrium
+        constants tabulated to this tolerance, @see :mod:`thermo_tables`
+    max_reactions_per_kernel: int or list of int [None]
+        If supplied, test with the kernels split into chunks of (each of) these
+        sizes, @see :func:`kernel_gen.chunk_kernels`
     kwargs: dict
         Any additional arguements to pass to the :param:`func`
     """
@@ -1305,15 +1326,32 @@ def _generic_tester(owner, func, kernel_calls, rate_func, do_ratespec=False,
 
     # listify
     kernel_calls = utils.listify(kernel_calls)
+    # kernel calls to supply the shared temperature invariants to, if read
+    T_invariant_calls = [kc for kc in kernel_calls
+                         if 'T_invariants' not in kc.input_args]
+
+    def __T_invariants(order):
+        # in the order of array_creator.T_invariant_keys
+        T = np.clip(owner.store.phi_cp[:, 0], 100., 10000.)
+        return np.array(np.stack((T, 1. / T, np.log(T)), axis=1), order=order,
+                        copy=True)
 
     def __skip_test(state):
         return 'platform' in state and state['platform'] in bad_platforms
 
+    oploop_kwds = {}
+    if thermo_table_tol is not None:
+        oploop_kwds['thermo_table_tol'] = thermo_table_tol
+    if max_reactions_per_kernel is not None:
+        oploop_kwds['max_reactions_per_kernel'] = max_reactions_per_kernel
+
     oploops = OptionLoopWrapper.from_get_oploop(
             owner, do_ratespec=do_ratespec, do_ropsplit=do_ropsplit,
-            langs=langs, do_conp=do_conp, do_sparse=do_sparse,
+            langs=langs, do_conp=do_conp, do_spec_gather=do_spec_gather,
+            do_sparse=do_sparse,
             sparse_only=sparse_only, skip_test=__skip_test, yield_index=True,
-            ignored_state_vals=exceptions)
+            ignored_state_vals=exceptions, do_T_invariants=do_T_invariants,
+            **oploop_kwds)
     tested_any = False
     for i, opt in oploops:
         # find rate info
@@ -1355,6 +1393,14 @@ def __skip_test(state):
 
         knl._make_kernels()
 
+        # supply the shared temperature invariants to kernels reading them
+        shared_T = any('T_invariants' in k.arg_dict for k in knl.kernels)
+        for kc in T_invariant_calls:
+            if shared_T:
+                kc.input_args['T_invariants'] = __T_invariants
+            else:
+                kc.input_args.pop('T_invariants', None)
+
         # create a list of answers to check
         for kc in kernel_calls:
             kc.set_state(knl.array_split, opt.order, namestore, opt.jac_format)
@@ -1596,12 +1642,25 @@ def __get_looser_tols(ravel_ind, copy_inds,
                     output_files='',
                     kernel_name=kgen.name.title()))
 
+            variable = None
+            if opts.runtime_parameters:
+                # move the parameter file out of the build directory, such that
+                # the kernel must load it from the path given in the environment
+                variable = k_gen.parameter_path_variable(kgen.name)
+                blob = kgen.file_prefix + kgen.name + '_parameters.bin'
+                shutil.move(os.path.join(build_dir, blob),
+                            os.path.join(lib_dir, blob))
+                os.environ[variable] = os.path.join(lib_dir, blob)
+
             try:
                 utils.run_with_our_python([os.path.join(lib_dir, 'test.py')])
             except subprocess.CalledProcessError:
                 logger = logging.getLogger(__name__)
                 logger.debug(oploops.state)
                 assert False, '{} error'.format(kgen.name)
+            finally:
+                if variable is not None:
+                    del os.environ[variable]
 
     if not tested_any:
         raise SkipTest('No valid platforms found to test.')
@@ -1777,6 +1836,13 @@ def run(self, state, asplit, dirs, data_output, limits):
     def check_file(self, file, state, limits={}):
         raise NotImplementedError
 
+    def prepare(self, state):
+        """
+        Evaluate anything needed by :func:`run` for the given :param:`state`
+        ahead of time, e.g., before forking parallel workers
+        """
+        pass
+
     @property
     def max_per_run(self):
         return None
@@ -1849,8 +1915,256 @@ def post(self):
         pass
 
 
+class _mechanism_test_job(object):
+    """
+    A single state of the testing :class:`OptionLoop` to be run by
+    :func:`_run_mechanism_tests`
+
+    Parameters
+    ----------
+    state: dict
+        The state of the :class:`OptionLoop` for this job
+    opts: :class:`loopy_options`
+        The loopy options constructed from the :param:`state`
+    phi_path: str
+        The path to the binary state-vector file for this job
+    limits: dict
+        The limits on the number of conditions for this mechanism
+    """
+
+    def __init__(self, state, opts, phi_path, limits):
+        self.state = state
+        self.opts = opts
+        self.phi_path = phi_path
+        self.limits = limits
+
+    @property
+    def cores(self):
+        return int(self.state.get('num_cores', 1) or 1)
+
+
+class _source_group(object):
+    """
+    A set of :class:`_mechanism_test_job`'s that share the same generated source
+    (i.e., they differ only in keys that do not require regeneration), and hence
+    may be generated & compiled once and run sequentially in the same (isolated)
+    directories
+
+    Parameters
+    ----------
+    index: int
+        The index of this group, used to create the isolated directories
+    jobs: list of :class:`_mechanism_test_job`
+        The jobs in this group
+    """
+
+    def __init__(self, index, jobs=None):
+        self.index = index
+        self.jobs = jobs if jobs is not None else []
+
+    @property
+    def state(self):
+        return self.jobs[0].state
+
+    @property
+    def cores(self):
+        """
+        The number of cores declared by this group, i.e., the maximum number
+        of cores used by any of it's jobs (as they are run sequentially)
+        """
+        return max(job.cores for job in self.jobs)
+
+    def dirs(self, base_dir, obj_dir='obj', build_dir='out', test_dir='test'):
+        """
+        Returns (and creates) the isolated build / object / test directories
+        for this group inside of :param:`base_dir`
+        """
+        root = os.path.join(base_dir, 'job_{}'.format(self.index))
+        dirs = {'run': base_dir,
+                'root': root,
+                'test': os.path.join(root, test_dir),
+                'build': os.path.join(root, build_dir),
+                'obj': os.path.join(root, obj_dir)}
+        for key in ['test', 'build', 'obj']:
+            utils.create_dir(dirs[key])
+        return dirs
+
+
+def _pack_jobs(pending, free_cores, num_running=0, max_workers=None):
+    """
+    Greedily selects the :class:`_source_group`'s from :param:`pending` that may
+    be started without oversubscribing the available cores
+
+    Notes
+    -----
+    The :param:`pending` groups are assumed to be sorted in order of priority
+    (i.e., largest core-count first).  If nothing is running, the first
+    :param:`pending` group will always be selected (even if it declares more cores
+    than are available) to guarantee forward progress.
+
+    Parameters
+    ----------
+    pending: list of :class:`_source_group`
+        The groups waiting to be run
+    free_cores: int
+        The number of currently unused cores
+    num_running: int [0]
+        The number of currently running groups
+    max_workers: int [None]
+        If supplied, the maximum number of concurrently running groups
+
+    Returns
+    -------
+    selected: list of :class:`_source_group`
+        The groups to launch
+    """
+
+    selected = []
+    for group in pending:
+        if max_workers is not None and \
+                num_running + len(selected) >= max_workers:
+            break
+        if group.cores <= free_cores or (not num_running and not selected):
+            selected.append(group)
+            free_cores -= group.cores
+    return selected
+
+
+def _run_source_group(group, dirs, generate, run, queue):
+    """
+    Generate, compile and run all :class:`_mechanism_test_job`'s in the
+    :param:`group` in a worker process, reporting the status to :param:`queue`
+
+    Parameters
+    ----------
+    group: :class:`_source_group`
+        The group to run
+    dirs: dict
+        The isolated directories for this group
+    generate: six.callable
+        Generates the source code for the :class:`_source_group`, taking as
+        arguements the loopy options, the constant-pressure flag, the build
+        directory and the state-vector path
+    run: :class:`runner`
+        The runner, which is inherited from the parent process on fork
+    queue: :class:`multiprocessing.Queue`
+        The queue to report the status of this group to, as a tuple of the
+        group index, status and message
+    """
+
+    status, message = 'ok', ''
+    try:
+        # isolate any files placed in the current working directory
+        os.chdir(dirs['root'])
+        generated = False
+        for job in group.jobs:
+            # update the runner's internal state for this job, and check whether
+            # it has been completed in the meantime
+            data_output = os.path.join(dirs['run'], run.get_filename(
+                job.opts, job.state['platform'], job.state['conp'],
+                job.state['num_cores']))
+            if run.check_file(data_output, job.state.copy(), job.limits):
+                continue
+            if not generated:
+                generate(job.opts, job.state['conp'], dirs['build'], job.phi_path)
+                generated = True
+            run.run(job.state.copy(), dirs, job.phi_path, data_output, job.limits)
+    except MissingPlatformError:
+        status = 'missing'
+        message = group.jobs[0].opts.platform_name
+    except BrokenPlatformError as e:
+        status = 'broken'
+        message = str(e)
+    except Exception:
+        import traceback
+        status = 'error'
+        message = traceback.format_exc()
+    finally:
+        clean_dir(dirs['root'], remove_dir=True)
+        queue.put((group.index, status, message))
+
+
+def _run_parallel_groups(groups, generate, run, base_dir, max_cores,
+                         max_workers=None):
+    """
+    Runs the :class:`_source_group`'s in parallel worker processes, packing the
+    groups by their declared core counts such that concurrent runs do not
+    oversubscribe the :param:`max_cores`
+
+    Notes
+    -----
+    The worker processes are forked, and hence inherit the state of the
+    :param:`run`-ner (e.g., pre-computed reference answers) from the parent
+
+    Parameters
+    ----------
+    groups: list of :class:`_source_group`
+        The groups to run
+    generate: six.callable
+        Generates the source code for a :class:`_source_group`
+    run: :class:`runner`
+        The runner
+    base_dir: str
+        The directory in which to create the isolated directories for each group
+    max_cores: int
+        The number of cores available for testing
+    max_workers: int [None]
+        If supplied, the maximum number of concurrent worker processes
+
+    Returns
+    -------
+    bad_platforms: set of str
+        The platforms found to be missing during testing
+    """
+
+    import multiprocessing
+    logger = logging.getLogger(__name__)
+    queue = multiprocessing.Queue()
+    # schedule the largest core-count first, as the smaller groups are easier
+    # to pack around them
+    pending = sorted(groups, key=lambda g: -g.cores)
+    running = {}
+    bad_platforms = set()
+    errors = []
+    while pending or running:
+        # remove anything from a platform we know to be missing
+        pending = [g for g in pending if g.jobs[0].opts.platform_name
+                   not in bad_platforms]
+        if not errors:
+            free = max_cores - sum(g.cores for g, _ in running.values())
+            for group in _pack_jobs(pending, free, len(running), max_workers):
+                pending.remove(group)
+                proc = multiprocessing.Process(
+                    target=_run_source_group,
+                    args=(group, group.dirs(base_dir), generate, run, queue))
+                proc.start()
+                running[group.index] = (group, proc)
+        else:
+            # don't start anything new after an error, simply drain the workers
+            pending = []
+        if not running:
+            break
+
+        index, status, message = queue.get()
+        group, proc = running.pop(index)
+        proc.join()
+        if status == 'missing':
+            bad_platforms.update([message])
+        elif status == 'broken':
+            logger.debug('Skipping bad platform: {}'.format(message))
+        elif status == 'error':
+            logger.error('Error running testing job {}:\n{}'.format(
+                utils.stringify_args(group.state, kwd=True), message))
+            errors.append(message)
+
+    if errors:
+        raise Exception('{} testing job(s) failed, first failure:\n{}'.format(
+            len(errors), errors[0]))
+    return bad_platforms
+
+
 def _run_mechanism_tests(work_dir, test_matrix, prefix, run,
-                         raise_on_missing=True):
+                         raise_on_missing=True, num_jobs=1, max_cores=None):
     """
     This method is used to consolidate looping for the :mod:`peformance_tester`
     and :mod:`functional tester, as they have very similar execution patterns
@@ -1867,6 +2181,15 @@ def _run_mechanism_tests(work_dir, test_matrix, prefix, run,
         a prefix within the work directory to store the output of this run
     raise_on_missing: bool
         Raise an exception of the specified :param:`test_matrix` file is not found
+    num_jobs: int [1]
+        The maximum number of states of the test matrix to run concurrently.
+        If greater than one, states that require separate code-generation are
+        generated, compiled and run in parallel worker processes with isolated
+        build directories
+    max_cores: int [None]
+        The number of cores that parallel workers may use concurrently; each
+        worker declares the maximum 'num_cores' of it's states.
+        If not supplied, the number of physical cores on this machine is used
 
     Returns
     -------
@@ -1961,15 +2284,17 @@ def __cleanup():
 
         # find the last species
         gas_map = find_last_species(specs, return_map=True)
-        del specs
 
-        # get the sorted reactions, if applicable
+        # get the sorted reactions, if applicable, such that the reference
+        # answers are evaluated with the same reaction order as pyJac
         rsort = get_rxn_sorting()
         ct_reacs = gas.reactions()
         if rsort != reaction_sorting.none:
             # get ordering
-            ordering = sort_reactions(reacs, rsort, return_order=True)
-            ct_reacs = [reacs[i] for i in range(ordering)]
+            ordering = sort_reactions(reacs, rsort, return_order=True,
+                                      specs=[specs[x] for x in gas_map])
+            ct_reacs = [ct_reacs[i] for i in ordering]
+        del specs
 
         # update the gas
         specs = gas.species()[:]
@@ -1979,15 +2304,13 @@ def __cleanup():
         del specs
 
         # first load data to get species rates, jacobian etc.
+        # (applying the species mapping to the data)
         num_conditions, data = dbw.load(
-            [], directory=os.path.join(work_dir, mech_name))
+            [], directory=os.path.join(work_dir, mech_name), gas_map=gas_map)
 
         # rewrite data to file in 'C' order
         # dbw.write(this_dir, num_conditions=num_conditions, data=data)
 
-        # apply species mapping to data
-        data[:, 2:] = data[:, 2 + gas_map]
-
         # check limits
         if 'limits' in mech_info:
             def __try_convert(enumtype, value):
@@ -2067,6 +2390,62 @@ def platform_skipper(state):
             skip_test=lambda state: any(call(state) for call in [
                 parallel_skip, model_skipper, platform_skipper]),
             skip_deep_simd=True)
+
+        def __generate(opts, conp, build_path, phi_path):
+            create_jacobian(opts.lang,
+                            gas=gas,
+                            width=opts.width,
+                            depth=opts.depth,
+                            data_order=opts.order,
+                            build_path=build_path,
+                            kernel_type=rtype,
+                            platform=opts.platform_name,
+                            data_filename=phi_path,
+                            split_rate_kernels=opts.rate_spec_kernels,
+                            rate_specialization=opts.rate_spec,
+                            split_rop_net_kernels=opts.rop_net_kernels,
+                            gather_spec_rates=opts.spec_rates_gather,
+                            temperature_invariants=opts.T_invariants,
+                            output_full_rop=(
+                                rtype == KernelType.species_rates
+                                and for_validation),
+                            conp=conp,
+                            use_atomic_doubles=opts.use_atomic_doubles,
+                            use_atomic_ints=opts.use_atomic_ints,
+                            jac_format=opts.jac_format,
+                            jac_type=opts.jac_type,
+                            for_validation=for_validation,
+                            mem_limits=test_matrix)
+
+        if num_jobs > 1:
+            # gather the jobs that remain to be run, grouped by generated source
+            groups = []
+            for opts in wrapper:
+                state = wrapper.state.copy()
+                conp = state['conp']
+                data_output = os.path.join(this_dir, run.get_filename(
+                    opts, state['platform'], conp, state['num_cores']))
+                if run.check_file(data_output, state.copy(), mech_info['limits']):
+                    continue
+                job = _mechanism_test_job(
+                    state, opts, phi_cp_path if conp else phi_cv_path,
+                    mech_info['limits'])
+                # evaluate anything that the workers will need before forking
+                run.prepare(state.copy())
+                group = next((g for g in groups if not __needs_regen(
+                    g.state, state)), None)
+                if group is None:
+                    group = _source_group(len(groups))
+                    groups.append(group)
+                group.jobs.append(job)
+
+            if max_cores is None:
+                max_cores = psutil.cpu_count(logical=False)
+            _run_parallel_groups(groups, __generate, run, this_dir, max_cores,
+                                 max_workers=num_jobs)
+            run.post()
+            continue
+
         for i, opts in enumerate(wrapper):
             # check for regen
             regen = old_state is None or __needs_regen(
@@ -2091,28 +2470,7 @@ def platform_skipper(state):
             try:
                 if regen:
                     # don't regenerate code if we don't need to
-                    create_jacobian(opts.lang,
-                                    gas=gas,
-                                    width=opts.width,
-                                    depth=opts.depth,
-                                    data_order=opts.order,
-                                    build_path=my_build,
-                                    kernel_type=rtype,
-                                    platform=opts.platform_name,
-                                    data_filename=phi_path,
-                                    split_rate_kernels=opts.rate_spec_kernels,
-                                    rate_specialization=opts.rate_spec,
-                                    split_rop_net_kernels=opts.rop_net_kernels,
-                                    output_full_rop=(
-                                        rtype == KernelType.species_rates
-                                        and for_validation),
-                                    conp=conp,
-                                    use_atomic_doubles=opts.use_atomic_doubles,
-                                    use_atomic_ints=opts.use_atomic_ints,
-                                    jac_format=opts.jac_format,
-                                    jac_type=opts.jac_type,
-                                    for_validation=for_validation,
-                                    mem_limits=test_matrix)
+                    __generate(opts, conp, my_build, phi_path)
             except MissingPlatformError:
                 # can't run on this platform
                 bad_platforms.update([opts.platform_name])
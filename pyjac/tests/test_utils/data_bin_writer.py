@@ -3,6 +3,9 @@
 
 import numpy as np
 
+# maximum number of conditions to hold in memory at once when streaming
+chunk_size = 100000
+
 
 def get_files(directory):
     return [os.path.join(directory, f) for f in os.listdir(directory)
@@ -11,26 +14,81 @@ def get_files(directory):
             and os.path.isfile(os.path.join(directory, f))]
 
 
-def load(npy_files, directory=None):
+def _open(npy_files, directory=None):
+    """
+    Memory-map the (sorted) :param:`npy_files`, or the PaSR output files in
+    :param:`directory` if not supplied
+    """
     if not npy_files and directory is not None:
         npy_files = get_files(directory)
-    data = None
-    num_conditions = 0
-    for npy in sorted(npy_files):
-        state_data = np.load(npy)
-        if data is None:
-            data = state_data
-        else:
-            data = np.vstack((data, state_data))
-        num_conditions += state_data.shape[0]
-        print(num_conditions, data.shape)
+    return [np.load(npy, mmap_mode='r') for npy in sorted(npy_files)]
+
+
+def _chunks(arrays, gas_map=None, cut=None):
+    """
+    Yield the concatenated conditions of :param:`arrays` in in-memory chunks of at
+    most :attr:`chunk_size` conditions
+
+    Parameters
+    ----------
+    arrays: list of :class:`numpy.ndarray`
+        The (memory-mapped) condition arrays
+    gas_map: :class:`numpy.ndarray` [None]
+        If supplied, the species permutation to apply to each chunk, i.e.,
+        chunk[:, 2:] = chunk[:, 2 + gas_map]
+    cut: int [None]
+        If supplied, the number of conditions to skip from the front of the
+        database
+    """
+    skip = cut or 0
+    for arr in arrays:
+        for start in range(0, arr.shape[0], chunk_size):
+            chunk = arr[start:start + chunk_size]
+            if skip >= chunk.shape[0]:
+                skip -= chunk.shape[0]
+                continue
+            chunk = np.array(chunk[skip:], dtype=np.float64, order='C')
+            skip = 0
+            if gas_map is not None:
+                chunk[:, 2:] = chunk[:, 2 + gas_map]
+            yield chunk
+
+
+def load(npy_files, directory=None, gas_map=None):
+    """
+    Load the condition database from the given :param:`npy_files` (or the
+    PaSR output files in :param:`directory`), optionally applying the
+    species permutation :param:`gas_map`
+
+    Each file is memory-mapped, and copied chunk-wise into a single
+    preallocated array.
+    """
+    arrays = _open(npy_files, directory)
+    num_conditions = sum(arr.shape[0] for arr in arrays)
+    if not arrays:
+        return num_conditions, None
+
+    data = np.empty((num_conditions, arrays[0].shape[1]))
+    offset = 0
+    for chunk in _chunks(arrays, gas_map):
+        data[offset:offset + chunk.shape[0]] = chunk
+        offset += chunk.shape[0]
     return num_conditions, data
 
 
-def write(directory, cut=None, num_conditions=None, data=None):
-    if not (num_conditions or data):
-        npy_files = get_files(directory)
-        num_conditions, data = load(npy_files)
+def write(directory, cut=None, num_conditions=None, data=None, gas_map=None):
+    """
+    Write the condition database in :param:`directory` to a binary file
+
+    If :param:`data` is not supplied, the PaSR output files in the directory are
+    memory-mapped and streamed chunk-wise to the binary file, such that the full
+    database is never held in memory.
+    """
+    if data is not None:
+        arrays = [data]
+    else:
+        arrays = _open([], directory)
+    num_conditions = sum(arr.shape[0] for arr in arrays)
 
     filename = 'data.bin' if cut is None else 'data_eqremoved.bin'
     with open(os.path.join(directory, filename), 'wb') as file:
@@ -39,10 +97,8 @@ def write(directory, cut=None, num_conditions=None, data=None):
         if num_conditions == 0:
             print('No data found in folder {}, continuing...'.format(directory))
             return 0
-        if cut is not None:
-            data = data[cut:, :]
-        data.tofile(file)
-        del data
+        for chunk in _chunks(arrays, gas_map, cut):
+            chunk.tofile(file)
     return num_conditions
 
 
@@ -4,7 +4,8 @@
 from cpython cimport bool
 
 cdef extern from "read_initial_conditions${header_ext}":
-    void read_initial_conditions (const char *filename, unsigned int NUM,
+    ctypedef long long ic_index_t
+    void read_initial_conditions (const char *filename, ic_index_t NUM,
                                   double *arg1, double *arg2,
                                   const char order);
 
@@ -14,7 +15,7 @@
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def read_ics(const char* filename,
-             np.uint_t NUM,
+             ic_index_t NUM,
              np.ndarray[np.float64_t] arg1,
              np.ndarray[np.float64_t] arg2,
              bool C_order):
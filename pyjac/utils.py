@@ -969,6 +969,85 @@ def get_parser():
                         "progress values (fwd / back / pdep) into different "
                         "kernels. Note that for a deep vectorization this will "
                         "introduce additional synchronization requirements.")
+    parser.add_argument('-gs', '--gather_spec_rates',
+                        default=False,
+                        action='store_true',
+                        help="If supplied, evaluate the species production rates "
+                        "by summing over the reactions of each species, rather than "
+                        "adding each reaction's rate of progress to its species. "
+                        "This avoids the atomic updates (or serialized execution, "
+                        "on platforms without double-precision atomics) otherwise "
+                        "required for a deep vectorization.")
+    parser.add_argument('-ti', '--temperature_invariants',
+                        default=False,
+                        action='store_true',
+                        help="If supplied, evaluate the temperature, its inverse "
+                        "and logarithm once per condition, and share them between "
+                        "the rate constant, falloff and thermodynamic kernels.")
+    parser.add_argument('-tt', '--thermo_table_tol',
+                        type=float,
+                        default=None,
+                        required=False,
+                        help="If supplied, evaluate the species thermodynamic "
+                        "properties and equilibrium constants by cubic "
+                        "interpolation in uniform temperature tables, built to "
+                        "satisfy this (relative) error tolerance.")
+    parser.add_argument('-ro', '--reorder_conditions',
+                        default=False,
+                        action='store_true',
+                        help="If supplied, the driver function copies the "
+                        "conditions into / out of the working buffer in the order "
+                        "of a supplied permutation (the 'condition_order' input), "
+                        "e.g., to group conditions taking the same temperature "
+                        "branches into the same vector.")
+    parser.add_argument('-mr', '--max_reactions_per_kernel',
+                        type=int,
+                        default=None,
+                        required=False,
+                        help="If supplied, split kernels looping over more than "
+                        "this number of reactions (or species) into a sequence of "
+                        "kernels, each evaluating a contiguous chunk of the loop "
+                        "with its own partition of the mechanism data. This "
+                        "bounds the constant data in each generated function for "
+                        "very large mechanisms.")
+    parser.add_argument('-rp', '--runtime_parameters',
+                        default=False,
+                        action='store_true',
+                        help="If supplied, serialize the mechanism parameter "
+                        "tables into a binary file that is loaded when the kernel "
+                        "is initialized, rather than compiling them into the "
+                        "generated source, such that the parameters may be "
+                        "changed without recompiling. The file may be relocated "
+                        "at runtime via the PYJAC_<KERNEL>_PARAMETERS "
+                        "environment variable.")
+    parser.add_argument('-cw', '--compact_working_buffer',
+                        default=False,
+                        action='store_true',
+                        help="If supplied, arrays in the working buffer that are "
+                        "not in use at the same time share storage, reducing the "
+                        "memory required per work-item.")
+    parser.add_argument('-it', '--index_type',
+                        default='int32',
+                        type=str,
+                        choices=['int32', 'int64'],
+                        help="The integer type used for index arithmetic over the "
+                        "initial conditions in the generated kernels. Using int64 "
+                        "avoids limiting the number of conditions evaluated "
+                        "per-run to prevent integer overflow in indexing.")
+    parser.add_argument('-bs', '--driver_block_size',
+                        type=lambda x: x if x == 'auto' else int(x),
+                        default=None,
+                        required=False,
+                        help="If supplied, each OpenMP thread in the C driver "
+                        "evaluates a block of this many conditions through each "
+                        "sub-kernel, rather than a single condition. If 'auto', "
+                        "the block size is chosen such that the thread's working "
+                        "buffer fits in the L2 cache.")
+    parser.add_argument('-ds', '--driver_schedule',
+                        type=str,
+                        default='static',
+                        choices=['static', 'dynamic', 'guided'],
+                        help="The OpenMP schedule of the C driver loop.")
     parser.add_argument('-conv', '--constant_volume',
                         required=False,
                         dest='conp',
@@ -1039,6 +1118,8 @@ def get_parser():
                              'local / or constant memory that the generated pyjac '
                              'code may allocate.  Useful for testing, or otherwise '
                              'limiting memory usage during runtime. '
+                             'Limits not specified are discovered from the '
+                             'OpenCL device, or the total host memory for C. '
                              'The keys of this file are the members of '
                              ':class:`pyjac.kernel_utils.memory_limits.mem_type`')
     parser.add_argument('--verbose',
@@ -1051,7 +1132,12 @@ def get_parser():
     parser.add_argument('--reaction_sorting',
                         type=EnumType(reaction_sorting),
                         default=reaction_sorting.none,
-                        help='Enable sorting of reactions [beta].')
+                        help='Enable sorting of reactions [beta]: "simd" groups '
+                        'reactions by type, "specialization" further groups '
+                        'reactions by Arrhenius rate specialization and '
+                        'stoichiometry, while "locality" orders reactions by the '
+                        'species they touch, to improve data reuse.  Choices: '
+                        '{type}'.format(type=str(EnumType(reaction_sorting))))
     args = parser.parse_args()
     return args
 
@@ -1075,6 +1161,16 @@ def create(**kwargs):
                     rate_specialization=args.rate_specialization,
                     split_rate_kernels=not args.fused_rate_kernels,
                     split_rop_net_kernels=args.split_rop_net_kernels,
+                    gather_spec_rates=args.gather_spec_rates,
+                    temperature_invariants=args.temperature_invariants,
+                    thermo_table_tol=args.thermo_table_tol,
+                    reorder_conditions=args.reorder_conditions,
+                    max_reactions_per_kernel=args.max_reactions_per_kernel,
+                    runtime_parameters=args.runtime_parameters,
+                    compact_working_buffer=args.compact_working_buffer,
+                    index_type=args.index_type,
+                    driver_block_size=args.driver_block_size,
+                    driver_schedule=args.driver_schedule,
                     conp=args.conp,
                     use_atomic_doubles=args.use_atomic_doubles,
                     use_atomic_ints=args.use_atomic_ints,
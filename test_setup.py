@@ -34,4 +34,13 @@
 # Set the number of initial conditions for pyJac testing
 # config['test_size'] = 8192
 # Set the type of reaction sorting to utilize
+# one of 'none', 'simd', 'specialization' or 'locality'
 # config['rxn_sort'] = 'simd'
+# unused by default, sets a persistent directory to cache the (expensive)
+# reference answers of the functional / validation testers in between sessions
+# config['reference_cache'] = os.path.join(home, 'reference_cache')
+# maximum size of the reference answer cache in GB
+# config['reference_cache_size'] = 20
+# number of threads used to compare the kernel outputs to the reference answers,
+# defaults to the number of CPUs
+# config['comparison_threads'] = 4